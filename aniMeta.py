@@ -72,6 +72,7 @@ kLeft, kRight, kCenter, kAll, kSelection = range( 5 )
 kHandle, kIKHandle, kJoint, kMain, kBodyGuide, kBipedRoot, kQuadrupedRoot, kCustomHandle, kBodyGuideLock, kBipedRootUE = range(10)
 kBiped, kBipedUE, kQuadruped, kCustom = range(4)
 kRigTypeString = ['Biped', 'BipedUE', 'Quadruped', 'Custom' ]
+kBipedTypes = ( kBiped, kBipedUE )
 kLocal, kWorld, kParent = range(3)
 kBasic, kSymmetricTranslation, kSymmetricRotation, kAuto = range( 4 )
 kTorso, kArm, kHand, kLeg, kHead, kFace = range(6)
@@ -79,6 +80,11 @@ kPairBlend, kPairBlendTranslate, kPairBlendRotate = range(3)
 kRigStateBind, kRigStateGuide, kRigStateControl = range(3)
 kXYZ, kYZX, kZXY, kXZY, kYXZ, kZYX = range(6)
 kFK, kIK = range(2)
+kTransformAttrs = ( 'tx', 'ty', 'tz', 'rx', 'ry', 'rz', 'sx', 'sy', 'sz' )
+kLocatorAttrs   = ( 'localScaleX', 'localScaleY', 'localScaleZ', 'localPositionX', 'localPositionY', 'localPositionZ' )
+
+# Turns the right side IK controls around X, they are mirrored against their joints
+kFlipX = om.MEulerRotation( math.pi, 0.0, 0.0 ).asMatrix()
 
 curveType = [ 'animCurveTA', 'animCurveTL', 'animCurveTT', 'animCurveTU',
               'animCurveUA', 'animCurveUL', 'animCurveUT', 'animCurveUU' ]
@@ -151,11 +157,12 @@ class AniMeta( object ):
         self.ui = AniMetaUI()
         self.update_ui()
 
-    def find_node( self, root, nodeName ):
+    def find_node( self, root, nodeName, nodeIndex = None ):
         '''
         Finds a DAG node within the specified character node, useful when multiple rigs are present.
         :param root: The character`s name.
         :param nodeName: The DAG node to look for
+        :param nodeIndex: Optional dictionary from get_node_index, saves listing the hierarchy for every lookup.
         :return: A string with the long DAG path to the node or None if the node is not found.
         '''
         if nodeName is None:
@@ -172,6 +179,9 @@ class AniMeta( object ):
             buff = nodeNameShort.split(':')
             nodeNameShort = buff[len(buff) - 1]
 
+        if nodeIndex is not None:
+            return nodeIndex.get( nodeNameShort )
+
         nodes = mc.listRelatives( root, ad=True, c=True, f=True) or []
 
         for node in nodes:
@@ -187,6 +197,33 @@ class AniMeta( object ):
         return None
 
 
+    def get_node_index( self, root ):
+        '''
+        Lists the DAG nodes within the specified character node once, so find_node can look up many nodes quickly.
+        :param root: The character`s name.
+        :return: A dictionary with the short names as keys and the long DAG paths as values.
+        '''
+        nodeIndex = { }
+
+        if root is None:
+            return nodeIndex
+
+        nodes = mc.listRelatives( root, ad=True, c=True, f=True) or []
+
+        for node in nodes:
+            currentNode = self.short_name(node)
+
+            # Remove colons in case rig is referenced
+            if ':' in currentNode:
+                buff = currentNode.split(':')
+                currentNode = buff[len(buff) - 1]
+
+            # Keep the first match, just like find_node
+            if currentNode not in nodeIndex:
+                nodeIndex[ currentNode ] = node
+
+        return nodeIndex
+
     def get_active_char( self ):
         '''
         Gets the selected character from the character list.
@@ -241,8 +278,12 @@ class AniMeta( object ):
     def get_metaData( self, node, attr = aniMetaDataAttrName ):
         data = { }
         try:
-            if mc.attributeQuery( attr, exists = True, node = node ):
-                data = eval( mc.getAttr( node + '.' + attr ) )
+            # This runs for every node get_nodes looks at, so use the API rather than attributeQuery and getAttr
+            selList = om.MSelectionList()
+            selList.add( node )
+            nodeFn = om.MFnDependencyNode( selList.getDependNode( 0 ) )
+            if nodeFn.hasAttribute( attr ):
+                data = eval( nodeFn.findPlug( attr, False ).asString() )
         except:
             pass
         return data
@@ -721,18 +762,16 @@ class Transform(AniMeta):
         dag2WorldTMat  = self.get_matrix( dagPath_2, kWorld )
         dag3WorldTMat  = self.get_matrix( dagPath_3, kWorld )
 
-        # Redundant? Should be just identity ...
-        m1 = dag1WorldTMat
-        m2 = dag2WorldTMat * self.invert_matrix( dag1WorldTMat )
-        m3 = dag3WorldTMat * self.invert_matrix( dag1WorldTMat )
+        # Positions of the effector and the handle relative to the start node
+        dag1WorldInvMat = self.invert_matrix( dag1WorldTMat )
+        m2 = dag2WorldTMat * dag1WorldInvMat
+        m3 = dag3WorldTMat * dag1WorldInvMat
 
-        L1 = self.get_translate( m1 )
         L2 = self.get_translate( m2 )
         L3 = self.get_translate( m3 )
 
-        V1 = self.get_translate( m2 ) #- L1
+        V1 = L2
         V2 = L3 - L2
-        V3 = self.get_translate( m3 ) #L1 - L3
 
         angle = V1.angle(V2)
 
@@ -741,8 +780,9 @@ class Transform(AniMeta):
         if abs(angle) > 0.001:
             # There is an angle
 
-            a_vec = self.get_translate( m2 )
-            c_vec = self.get_translate( m3 )
+            # c_vec gets scaled in place below, so work on copies
+            a_vec = om.MVector( L2 )
+            c_vec = om.MVector( L3 )
 
             # Get the angle beta
             beta = a_vec.angle(c_vec)
@@ -1268,16 +1308,23 @@ class Rig( Transform ):
 
         # Create Joints
         for joint in joints.keys():
-            newJoint = mc.createNode( joints[ joint ][ 'nodeType' ], name = joint, ss = True )
+            newJoint = mc.createNode( joints[ joint ].get( 'nodeType', 'joint' ), name = joint, ss = True )
             new_joints[ joint ] = self.get_path( newJoint )
 
+        # Parents that are not part of the template are looked up once per name
+        parent_paths = { }
+
         # Parenting
         for joint in joints.keys():
-            if 'parent' in skeleton[ 'Skeleton' ][ 'Joints' ][ joint ]:
-                parent = skeleton[ 'Skeleton' ][ 'Joints' ][ joint ][ 'parent' ]
+            if 'parent' in joints[ joint ]:
+                parent = joints[ joint ][ 'parent' ]
 
                 if parent in new_joints:
                     parent = new_joints[ parent ]
+                else:
+                    if parent not in parent_paths:
+                        parent_paths[ parent ] = self.get_path( self.find_node( char, parent ) )
+                    parent = parent_paths[ parent ]
 
                 self.parent_joints( new_joints[ joint ], parent, char )
             else:
@@ -1286,11 +1333,11 @@ class Rig( Transform ):
         # Set Attributes
         for joint in joints.keys():
 
-            for attr in skeleton[ 'Skeleton' ][ 'Joints' ][ joint ]:
+            for attr in joints[ joint ]:
 
                 if attr != 'parent' and attr != 'nodeType':
                     try:
-                        value = skeleton[ 'Skeleton' ][ 'Joints' ][ joint ][ attr ]
+                        value = joints[ joint ][ attr ]
 
                         if attr == 'side':
                             value = self.hik_side.index( value )
@@ -1334,16 +1381,23 @@ class Rig( Transform ):
 
             # Create Joints
             for joint in joints.keys():
-                newJoint = mc.createNode( joints[ joint ][ 'nodeType' ], name = joint, ss = True )
+                newJoint = mc.createNode( joints[ joint ].get( 'nodeType', 'joint' ), name = joint, ss = True )
                 new_joints[ joint ] = self.get_path( newJoint )
 
+            # Parents that are not part of the template are looked up once per name
+            parent_paths = { }
+
             # Parenting
             for joint in joints.keys():
-                if 'parent' in skeleton[ 'Skeleton' ][ 'Joints' ][ joint ]:
-                    parent = skeleton[ 'Skeleton' ][ 'Joints' ][ joint ][ 'parent' ]
+                if 'parent' in joints[ joint ]:
+                    parent = joints[ joint ][ 'parent' ]
 
                     if parent in new_joints:
                         parent = new_joints[ parent ]
+                    else:
+                        if parent not in parent_paths:
+                            parent_paths[ parent ] = self.get_path( self.find_node( char, parent ) )
+                        parent = parent_paths[ parent ]
 
                     self.parent_skeleton( new_joints[ joint ], parent, char )
                 else:
@@ -1352,11 +1406,11 @@ class Rig( Transform ):
             # Set Attributes
             for joint in joints.keys():
 
-                for attr in skeleton[ 'Skeleton' ][ 'Joints' ][ joint ]:
+                for attr in joints[ joint ]:
 
                     if attr != 'parent' and attr != 'nodeType':
                         try:
-                            value = skeleton[ 'Skeleton' ][ 'Joints' ][ joint ][ attr ]
+                            value = joints[ joint ][ attr ]
 
                             if attr == 'side':
                                 value = self.hik_side.index( value )
@@ -2499,17 +2553,38 @@ class Rig( Transform ):
 
         if len( attrs ) > 0:
 
+            # Look at the incoming connections via the API instead of listConnections and nodeType per attribute
+            nodeObj = self.get_mobject( node )
+
+            if nodeObj is None:
+                mc.warning( 'aniMeta get_attributes: can not get an MObject for ', node )
+                return None
+
+            nodeFn = om.MFnDependencyNode( nodeObj )
+
             for attr in attrs:
                 attrDict = { }
                 status = 0
 
                 attrDict[ 'dataType' ] = mc.attributeQuery( attr, node = node, attributeType = True )
 
-                con = mc.listConnections( node + '.' + attr, s = True, d = False ) or [ ]
+                con = [ ]
+                isAnimCurve = False
+
+                try:
+                    source = nodeFn.findPlug( attr, False ).source()
+                    if not source.isNull:
+                        sourceNode = source.node()
+                        con = [ om.MFnDependencyNode( sourceNode ).name() ]
+                        isAnimCurve = sourceNode.hasFn( om.MFn.kAnimCurve )
+                except:
+                    con = mc.listConnections( node + '.' + attr, s = True, d = False ) or [ ]
+                    if len( con ) > 0:
+                        isAnimCurve = mc.nodeType( con ) in curveType
 
                 if len( con ) > 0:
 
-                    if mc.nodeType( con ) in curveType:
+                    if isAnimCurve:
                         attrDict[ 'input' ] = attrInput[ animCurve ]
                         # Either get the actual keyframe animation
                         if getAnimKeys:
@@ -2701,7 +2776,7 @@ class Rig( Transform ):
             for i in range( len( joints )):
                 xform_data = data['Skeleton']['Joints'][joints[i]]
                 if not mc.objExists( joints[i] ):
-                    mc.createNode( xform_data['nodeType'], name=self.short_name(joints[i] ) )
+                    mc.createNode( xform_data.get( 'nodeType', 'joint' ), name=self.short_name(joints[i] ) )
 
                 else:
                     mc.warning('aniMeta.import_joints: There is already a node called: ' + joints[i] )
@@ -3308,6 +3383,10 @@ class Rig( Transform ):
 
 class Char( Rig ):
 
+    # Skeleton templates per rig type, shared by all instances
+    skeletonTemplates = { }
+    auxSkeletonTemplates = { }
+
     def __init__(self):
         super( Char, self ).__init__()
 
@@ -3454,7 +3533,7 @@ class Char( Rig ):
         if sel:
             metaData = self.get_metaData( sel )
             if 'RigType' in metaData:
-                if metaData[ 'RigType' ] == kBiped or metaData[ 'RigType' ] == kBipedUE  or metaData[ 'RigType' ] == kQuadruped :
+                if metaData[ 'RigType' ] in kBipedTypes or metaData[ 'RigType' ] == kQuadruped :
                     charRoot = sel
                 type = metaData[ 'RigType' ]
 
@@ -4008,8 +4087,6 @@ class Char( Rig ):
 
     def build_constraints( self, rootNode, type ):
 
-        offset = om.MEulerRotation( math.radians( 180.0 ), 0.0, 0.0, 0 ).asMatrix()
-
         if type == kBipedUE:
 
             GUIDE_SIDE = ['Lft', 'Rgt']
@@ -4290,7 +4367,7 @@ class Char( Rig ):
         # Display Type for Geo Grp
 
         # Lock attributes
-        self.lock_attrs(rootGrp, ['tx', 'ty', 'tz', 'rx', 'ry', 'rz', 'sx', 'sy', 'sz'])
+        self.lock_attrs(rootGrp, kTransformAttrs)
 
         return {'Main': rootGrp, 'Geo': geoGrp, 'Joint': jointGrp, 'Rig': rigGrp, 'Mocap': mocapGrp}
 
@@ -5342,38 +5419,45 @@ class Char( Rig ):
                 except:
                     pass
 
-    def get_aux_joints(self, type ):
+    def get_aux_joints( self, type ):
+        '''
+        Returns the aux joint template for the given rig type.
+        The template is only built once and shared by all callers, it must not be modified.
+        :param type: the rig type, i.e. kBiped
+        :return: the skeleton dictionary
+        '''
+        if type not in self.auxSkeletonTemplates:
+            self.auxSkeletonTemplates[ type ] = self.get_aux_joints_template( type )
+
+        return self.auxSkeletonTemplates[ type ]
+
+    def get_aux_joints_template( self, type ):
         if type == kBiped:
           return  {
              "Skeleton": {
               "Joints": {
                "Middle3_Blend_Lft_Jnt": {
-                "nodeType": "joint",
                 "radius": 2.0,
                 "parent": "Middle2_Lft_Jnt",
                 "tx": 3.1684
                },
                "Shoulder_Blend_Lft_Jnt": {
                 "parent": "Clavicle_Lft_Jnt",
-                "nodeType": "joint",
                 "radius": 2.0,
                 "rz": -20.0,
                 "tx": 10.5751
                },
                "LegUp_Aux2_Lft_Jnt": {
-                "nodeType": "joint",
                 "radius": 3.0,
                 "parent": "LegUp_Lft_Jnt",
                 "ty": -19.5
                },
                "Pinky2_Blend_Lft_Jnt": {
-                "nodeType": "joint",
                 "radius": 2.0,
                 "parent": "Pinky1_Lft_Jnt",
                 "tx": 4.7646
                },
                "Ring2_Blend_Lft_Jnt": {
-                "nodeType": "joint",
                 "radius": 2.0,
                 "parent": "Ring1_Lft_Jnt",
                 "tx": 5.2284
@@ -5381,36 +5465,30 @@ class Char( Rig ):
                "Ball_Rgt_Jnt_Blend": {
                 "radius": 2.0,
                 "tz": -11.97,
-                "nodeType": "joint",
                 "parent": "Foot_Rgt_Jnt",
                 "ty": 6.335
                },
                "ArmUp_Aux2_Lft_Jnt": {
-                "nodeType": "joint",
                 "radius": 3.0,
                 "parent": "ArmUp_Lft_Jnt",
                 "tx": 11.5
                },
                "Middle4_Blend_Lft_Jnt": {
-                "nodeType": "joint",
                 "radius": 2.0,
                 "parent": "Middle3_Lft_Jnt",
                 "tx": 2.7589
                },
                "LegLo_Lft_Jnt_Blend": {
-                "nodeType": "joint",
                 "radius": 2.0,
                 "parent": "LegUp_Lft_Jnt",
                 "ty": -39.0
                },
                "Index2_Blend_Lft_Jnt": {
-                "nodeType": "joint",
                 "radius": 2.0,
                 "parent": "Index1_Lft_Jnt",
                 "tx": 5.7251
                },
                "LegLo_Aux2_Rgt_Jnt": {
-                "nodeType": "joint",
                 "radius": 3.0,
                 "parent": "LegLo_Rgt_Jnt",
                 "ty": 20.5
@@ -5423,23 +5501,19 @@ class Char( Rig ):
                 "jox": 119.0176,
                 "joy": -29.5243,
                 "joz": -36.8969,
-                "radius": 2.0,
-                "nodeType": "joint"
+                "radius": 2.0
                },
                "Index2_Blend_Rgt_Jnt": {
-                "nodeType": "joint",
                 "radius": 2.0,
                 "parent": "Index1_Rgt_Jnt",
                 "tx": -5.7251
                },
                "Pinky4_Blend_Rgt_Jnt": {
-                "nodeType": "joint",
                 "radius": 2.0,
                 "parent": "Pinky3_Rgt_Jnt",
                 "tx": -2.2206
                },
                "Middle2_Blend_Rgt_Jnt": {
-                "nodeType": "joint",
                 "radius": 2.0,
                 "parent": "Middle1_Rgt_Jnt",
                 "tx": -5.6311
@@ -5447,24 +5521,20 @@ class Char( Rig ):
                "Foot_Lft_Jnt_Blend": {
                 "radius": 2.0,
                 "rx": -1.9255,
-                "nodeType": "joint",
                 "parent": "LegLo_Lft_Jnt",
                 "ty": -41.0
                },
                "Ring2_Blend_Rgt_Jnt": {
-                "nodeType": "joint",
                 "radius": 2.0,
                 "parent": "Ring1_Rgt_Jnt",
                 "tx": -5.2284
                },
                "LegLo_Aux3_Rgt_Jnt": {
-                "nodeType": "joint",
                 "radius": 3.0,
                 "parent": "LegLo_Rgt_Jnt",
                 "ty": 30.75
                },
                "Shoulder_Blend_Rgt_Jnt": {
-                "nodeType": "joint",
                 "tx": -10.575,
                 "parent": "Clavicle_Rgt_Jnt",
                 "ty": -0.0005,
@@ -5472,61 +5542,51 @@ class Char( Rig ):
                 "radius": 2.0
                },
                "Pinky3_Blend_Lft_Jnt": {
-                "nodeType": "joint",
                 "radius": 2.0,
                 "parent": "Pinky2_Lft_Jnt",
                 "tx": 2.6751
                },
                "ArmLo_Aux1_Lft_Jnt": {
-                "nodeType": "joint",
                 "radius": 3.0,
                 "parent": "ArmLo_Lft_Jnt",
                 "tx": 5.4
                },
                "LegUp_Aux1_Lft_Jnt": {
-                "nodeType": "joint",
                 "radius": 3.0,
                 "parent": "LegUp_Lft_Jnt",
                 "ty": -9.75
                },
                "ArmUp_Aux3_Lft_Jnt": {
-                "nodeType": "joint",
                 "radius": 3.0,
                 "parent": "ArmUp_Lft_Jnt",
                 "tx": 17.25
                },
                "LegLo_Aux1_Rgt_Jnt": {
-                "nodeType": "joint",
                 "radius": 3.0,
                 "parent": "LegLo_Rgt_Jnt",
                 "ty": 10.25
                },
                "Middle2_Blend_Lft_Jnt": {
-                "nodeType": "joint",
                 "radius": 2.0,
                 "parent": "Middle1_Lft_Jnt",
                 "tx": 5.6311
                },
                "ArmUp_Aux3_Rgt_Jnt": {
-                "nodeType": "joint",
                 "radius": 3.0,
                 "parent": "ArmUp_Rgt_Jnt",
                 "tx": -17.25
                },
                "LegUp_Aux3_Lft_Jnt": {
-                "nodeType": "joint",
                 "radius": 3.0,
                 "parent": "LegUp_Lft_Jnt",
                 "ty": -29.25
                },
                "Middle3_Blend_Rgt_Jnt": {
-                "nodeType": "joint",
                 "radius": 2.0,
                 "parent": "Middle2_Rgt_Jnt",
                 "tx": -3.1684
                },
                "Thumb1_Blend_Rgt_Jnt": {
-                "nodeType": "joint",
                 "tx": 0.4241,
                 "parent": "Palm_Rgt_Jnt",
                 "ty": 1.0611,
@@ -5534,79 +5594,66 @@ class Char( Rig ):
                 "tz": -2.3289
                },
                "Thumb3_Blend_Lft_Jnt": {
-                "nodeType": "joint",
                 "radius": 2.0,
                 "parent": "Thumb2_Lft_Jnt",
                 "tx": 3.7769
                },
                "Index4_Blend_Rgt_Jnt": {
-                "nodeType": "joint",
                 "radius": 2.0,
                 "parent": "Index3_Rgt_Jnt",
                 "tx": -2.2613
                },
                "Wrist_Blend_Lft_Jnt": {
-                "nodeType": "joint",
                 "radius": 2.0,
                 "parent": "ArmLo_Lft_Jnt",
                 "tx": 21.6
                },
                "Index4_Blend_Lft_Jnt": {
-                "nodeType": "joint",
                 "radius": 2.0,
                 "parent": "Index3_Lft_Jnt",
                 "tx": 2.2613
                },
                "Pinky3_Blend_Rgt_Jnt": {
-                "nodeType": "joint",
                 "radius": 2.0,
                 "parent": "Pinky2_Rgt_Jnt",
                 "tx": -2.6751
                },
                "ArmUp_Aux1_Rgt_Jnt": {
-                "nodeType": "joint",
                 "radius": 3.0,
                 "parent": "ArmUp_Rgt_Jnt",
                 "tx": -5.75
                },
                "Ring3_Blend_Lft_Jnt": {
-                "nodeType": "joint",
                 "radius": 2.0,
                 "parent": "Ring2_Lft_Jnt",
                 "tx": 2.7781
                },
                "Ring3_Blend_Rgt_Jnt": {
-                "nodeType": "joint",
                 "radius": 2.0,
                 "parent": "Ring2_Rgt_Jnt",
                 "tx": -2.7781
                },
                "LegUp_Aux3_Rgt_Jnt": {
-                "nodeType": "joint",
                 "radius": 3.0,
                 "parent": "LegUp_Rgt_Jnt",
                 "ty": 29.25
                },
                "ArmLo_Aux1_Rgt_Jnt": {
-                "nodeType": "joint",
                 "radius": 3.0,
                 "parent": "ArmLo_Rgt_Jnt",
                 "tx": -5.4
                },
                "Pinky4_Blend_Lft_Jnt": {
-                "nodeType": "joint",
                 "radius": 2.0,
                 "parent": "Pinky3_Lft_Jnt",
                 "tx": 2.2206
                },
                "LegLo_Aux1_Lft_Jnt": {
-                "nodeType": "joint",
                 "radius": 3.0,
                 "parent": "LegLo_Lft_Jnt",
                 "ty": -10.25
                },
                "Middle4_Blend_Rgt_Jnt": {
-                "nodeType": "joint",
                 "radius": 2.0,
                 "parent": "Middle3_Rgt_Jnt",
                 "tx": -2.7589
@@ -5617,17 +5664,14 @@ class Char( Rig ):
                 "parent": "Hips_Jnt",
                 "ty": -5.9865,
                 "rx": -178.0243,
-                "radius": 2.0,
-                "nodeType": "joint"
+                "radius": 2.0
                },
                "Wrist_Blend_Rgt_Jnt": {
-                "nodeType": "joint",
                 "radius": 2.0,
                 "parent": "ArmLo_Rgt_Jnt",
                 "tx": -21.6
                },
                "Thumb2_Blend_Lft_Jnt": {
-                "nodeType": "joint",
                 "radius": 2.0,
                 "parent": "Thumb1_Lft_Jnt",
                 "tx": 3.6395
@@ -5635,12 +5679,10 @@ class Char( Rig ):
                "Foot_Rgt_Jnt_Blend": {
                 "radius": 2.0,
                 "rx": -1.9255,
-                "nodeType": "joint",
                 "parent": "LegLo_Rgt_Jnt",
                 "ty": 41.0
                },
                "Ring4_Blend_Lft_Jnt": {
-                "nodeType": "joint",
                 "radius": 2.0,
                 "parent": "Ring3_Lft_Jnt",
                 "tx": 2.6052
@@ -5651,95 +5693,79 @@ class Char( Rig ):
                 "parent": "Hips_Jnt",
                 "ty": -5.9865,
                 "rx": 1.9757,
-                "radius": 2.0,
-                "nodeType": "joint"
+                "radius": 2.0
                },
                "ArmLo_Blend_Rgt_Jnt": {
-                "nodeType": "joint",
                 "radius": 2.0,
                 "parent": "ArmUp_Rgt_Jnt",
                 "tx": -23.0
                },
                "ArmLo_Aux3_Rgt_Jnt": {
-                "nodeType": "joint",
                 "radius": 3.0,
                 "parent": "ArmLo_Rgt_Jnt",
                 "tx": -16.2
                },
                "ArmLo_Aux3_Lft_Jnt": {
-                "nodeType": "joint",
                 "radius": 3.0,
                 "parent": "ArmLo_Lft_Jnt",
                 "tx": 16.2
                },
                "LegUp_Aux2_Rgt_Jnt": {
-                "nodeType": "joint",
                 "radius": 3.0,
                 "parent": "LegUp_Rgt_Jnt",
                 "ty": 19.5
                },
                "ArmLo_Aux2_Lft_Jnt": {
-                "nodeType": "joint",
                 "radius": 3.0,
                 "parent": "ArmLo_Lft_Jnt",
                 "tx": 10.8
                },
                "LegLo_Rgt_Jnt_Blend": {
-                "nodeType": "joint",
                 "radius": 2.0,
                 "parent": "LegUp_Rgt_Jnt",
                 "ty": 39.0
                },
                "Thumb2_Blend_Rgt_Jnt": {
-                "nodeType": "joint",
                 "radius": 2.0,
                 "parent": "Thumb1_Rgt_Jnt",
                 "tx": -3.6395
                },
                "Ring4_Blend_Rgt_Jnt": {
-                "nodeType": "joint",
                 "radius": 2.0,
                 "parent": "Ring3_Rgt_Jnt",
                 "tx": -2.6052
                },
                "LegLo_Aux2_Lft_Jnt": {
-                "nodeType": "joint",
                 "radius": 3.0,
                 "parent": "LegLo_Lft_Jnt",
                 "ty": -20.5
                },
                "Index3_Blend_Lft_Jnt": {
-                "nodeType": "joint",
                 "radius": 2.0,
                 "parent": "Index2_Lft_Jnt",
                 "tx": 3.1627
                },
                "Index3_Blend_Rgt_Jnt": {
-                "nodeType": "joint",
                 "radius": 2.0,
                 "parent": "Index2_Rgt_Jnt",
                 "tx": -3.1627
                },
                "Thumb3_Blend_Rgt_Jnt": {
-                "nodeType": "joint",
                 "radius": 2.0,
                 "parent": "Thumb2_Rgt_Jnt",
                 "tx": -3.7769
                },
                "ArmUp_Aux1_Lft_Jnt": {
-                "nodeType": "joint",
                 "radius": 3.0,
                 "parent": "ArmUp_Lft_Jnt",
                 "tx": 5.75
                },
                "Pinky2_Blend_Rgt_Jnt": {
-                "nodeType": "joint",
                 "radius": 2.0,
                 "parent": "Pinky1_Rgt_Jnt",
                 "tx": -4.7646
                },
                "ArmLo_Blend_Lft_Jnt": {
-                "nodeType": "joint",
                 "radius": 2.0,
                 "parent": "ArmUp_Lft_Jnt",
                 "tx": 23.0
@@ -5747,36 +5773,30 @@ class Char( Rig ):
                "Ball_Lft_Jnt_Blend": {
                 "radius": 2.0,
                 "tz": 11.9696,
-                "nodeType": "joint",
                 "parent": "Foot_Lft_Jnt",
                 "ty": -6.3351
                },
                "LegLo_Aux3_Lft_Jnt": {
-                "nodeType": "joint",
                 "radius": 3.0,
                 "parent": "LegLo_Lft_Jnt",
                 "ty": -30.75
                },
                "ArmLo_Aux2_Rgt_Jnt": {
-                "nodeType": "joint",
                 "radius": 3.0,
                 "parent": "ArmLo_Rgt_Jnt",
                 "tx": -10.8
                },
                "ArmUp_Aux2_Rgt_Jnt": {
-                "nodeType": "joint",
                 "radius": 3.0,
                 "parent": "ArmUp_Rgt_Jnt",
                 "tx": -11.5
                },
                "LegUp_Aux1_Rgt_Jnt": {
-                "nodeType": "joint",
                 "radius": 3.0,
                 "parent": "LegUp_Rgt_Jnt",
                 "ty": 9.75
                },
                "Head_Jnt_Blend": {
-                "nodeType": "joint",
                 "radius": 2.0,
                 "parent": "Neck_Jnt",
                 "ty": 15.1352
@@ -5788,6 +5808,18 @@ class Char( Rig ):
           return  None
 
     def get_joints( self, type ):
+        '''
+        Returns the skeleton template for the given rig type.
+        The template is only built once and shared by all callers, it must not be modified.
+        :param type: the rig type, i.e. kBiped
+        :return: the skeleton dictionary
+        '''
+        if type not in self.skeletonTemplates:
+            self.skeletonTemplates[ type ] = self.get_joints_template( type )
+
+        return self.skeletonTemplates[ type ]
+
+    def get_joints_template( self, type ):
 
         if type == kBiped:
             return {
@@ -5800,11 +5832,9 @@ class Char( Rig ):
                             "ty": -0.7544,
                             "jox": 3.3828,
                             "joy": -8.0771,
-                            "joz": 0.0538,
-                            "nodeType": "joint"
+                            "joz": 0.0538
                         },
                         "Pinky4_Rgt_Jnt": {
-                            "nodeType": "joint",
                             "parent": "Pinky3_Rgt_Jnt",
                             "tx": -2.2206
                         },
@@ -5815,17 +5845,14 @@ class Char( Rig ):
                             "ty": 0.899,
                             "jox": 3.4171,
                             "joy": 7.7111,
-                            "joz": 0.6353,
-                            "nodeType": "joint"
+                            "joz": 0.6353
                         },
                         "Jaw_Jnt_Tip": {
                             "radius": 5.0,
                             "tz": 8.6143,
-                            "nodeType": "joint",
                             "parent": "Jaw_Jnt"
                         },
                         "Eye_Lft_Jnt": {
-                            "nodeType": "joint",
                             "tx": 3.2461,
                             "parent": "Head_Jnt",
                             "ty": 3.604,
@@ -5833,7 +5860,6 @@ class Char( Rig ):
                             "tz": 6.4812
                         },
                         "Chest_Jnt": {
-                            "nodeType": "joint",
                             "radius": 5.0,
                             "parent": "Spine3_Jnt",
                             "ty": 4.7069
@@ -5841,28 +5867,23 @@ class Char( Rig ):
                         "Toes_Rgt_Jnt": {
                             "radius": 5.0,
                             "tz": -11.97,
-                            "nodeType": "joint",
                             "parent": "Foot_Rgt_Jnt",
                             "ty": 6.335
                         },
                         "Index4_Rgt_Jnt": {
-                            "nodeType": "joint",
                             "parent": "Index3_Rgt_Jnt",
                             "tx": -2.2613
                         },
                         "Root_Jnt": {
-                            "nodeType": "joint",
                             "parent": "Joint_Grp"
                         },
                         "ArmUp_Lft_Jnt": {
                             "parent": "Clavicle_Lft_Jnt",
-                            "nodeType": "joint",
                             "radius": 5.0,
                             "rz": -40.0,
                             "tx": 10.5751
                         },
                         "Pinky3_Rgt_Jnt": {
-                            "nodeType": "joint",
                             "parent": "Pinky2_Rgt_Jnt",
                             "tx": -2.6751
                         },
@@ -5877,7 +5898,6 @@ class Char( Rig ):
                             "rz": -40.0
                         },
                         "Index3_Lft_Jnt": {
-                            "nodeType": "joint",
                             "parent": "Index2_Lft_Jnt",
                             "tx": 3.1627
                         },
@@ -5890,12 +5910,10 @@ class Char( Rig ):
                             "tz": -0.0597
                         },
                         "Middle2_Lft_Jnt": {
-                            "nodeType": "joint",
                             "parent": "Middle1_Lft_Jnt",
                             "tx": 5.6311
                         },
                         "Hand_Lft_Jnt": {
-                            "nodeType": "joint",
                             "radius": 5.0,
                             "parent": "ArmLo_Lft_Jnt",
                             "tx": 21.6
@@ -5906,16 +5924,13 @@ class Char( Rig ):
                             "parent": "Chest_Jnt",
                             "ty": 17.0561,
                             "rx": 180.0,
-                            "radius": 5.0,
-                            "nodeType": "joint"
+                            "radius": 5.0
                         },
                         "Middle2_Rgt_Jnt": {
-                            "nodeType": "joint",
                             "parent": "Middle1_Rgt_Jnt",
                             "tx": -5.6311
                         },
                         "Clavicle_Lft_Jnt": {
-                            "nodeType": "joint",
                             "tx": 1.7794,
                             "parent": "Chest_Jnt",
                             "ty": 17.0561,
@@ -5923,7 +5938,6 @@ class Char( Rig ):
                             "tz": -2.3918
                         },
                         "Eye_Rgt_Jnt": {
-                            "nodeType": "joint",
                             "tx": -3.246,
                             "parent": "Head_Jnt",
                             "ty": 3.604,
@@ -5933,7 +5947,6 @@ class Char( Rig ):
                         "Heel_Lft_Jnt": {
                             "radius": 5.0,
                             "tz": -4.5,
-                            "nodeType": "joint",
                             "parent": "Foot_Lft_Jnt",
                             "ty": -7.7
                         },
@@ -5943,7 +5956,6 @@ class Char( Rig ):
                             "rz": -40.0
                         },
                         "Ring3_Rgt_Jnt": {
-                            "nodeType": "joint",
                             "parent": "Ring2_Rgt_Jnt",
                             "tx": -2.7781
                         },
@@ -5954,30 +5966,25 @@ class Char( Rig ):
                             "ty": -1.0611,
                             "jox": 119.0176,
                             "joy": -29.5243,
-                            "joz": -36.8969,
-                            "nodeType": "joint"
+                            "joz": -36.8969
                         },
                         "Foot_Rgt_Jnt": {
                             "radius": 5.0,
                             "rx": -3.8509,
-                            "nodeType": "joint",
                             "parent": "LegLo_Rgt_Jnt",
                             "ty": 41.0
                         },
                         "Heel_Rgt_Jnt": {
                             "radius": 5.0,
                             "tz": 4.5,
-                            "nodeType": "joint",
                             "parent": "Foot_Rgt_Jnt",
                             "ty": 7.7
                         },
                         "Thumb2_Lft_Jnt": {
-                            "nodeType": "joint",
                             "parent": "Thumb1_Lft_Jnt",
                             "tx": 3.6395
                         },
                         "Palm_Rgt_Jnt": {
-                            "nodeType": "joint",
                             "parent": "Hand_Rgt_Jnt",
                             "tx": -1.9237,
                             "ty": 0.0003
@@ -5991,12 +5998,10 @@ class Char( Rig ):
                             "tz": -0.0597
                         },
                         "Index2_Lft_Jnt": {
-                            "nodeType": "joint",
                             "parent": "Index1_Lft_Jnt",
                             "tx": 5.7251
                         },
                         "LegLo_Rgt_Jnt": {
-                            "nodeType": "joint",
                             "radius": 5.0,
                             "parent": "LegUp_Rgt_Jnt",
                             "ty": 39.0
@@ -6004,7 +6009,6 @@ class Char( Rig ):
                         "ToesTip_Rgt_Jnt": {
                             "radius": 5.0,
                             "tz": -5.6,
-                            "nodeType": "joint",
                             "parent": "Toes_Rgt_Jnt",
                             "ty": 1.4
                         },
@@ -6015,16 +6019,13 @@ class Char( Rig ):
                             "ty": 1.0611,
                             "jox": 119.0176,
                             "joy": -29.5243,
-                            "joz": -36.8969,
-                            "nodeType": "joint"
+                            "joz": -36.8969
                         },
                         "Pinky4_Lft_Jnt": {
-                            "nodeType": "joint",
                             "parent": "Pinky3_Lft_Jnt",
                             "tx": 2.2206
                         },
                         "ArmLo_Rgt_Jnt": {
-                            "nodeType": "joint",
                             "radius": 5.0,
                             "parent": "ArmUp_Rgt_Jnt",
                             "tx": -23.0
@@ -6041,7 +6042,6 @@ class Char( Rig ):
                             "ty": 9.3456
                         },
                         "ArmUp_Rgt_Jnt": {
-                            "nodeType": "joint",
                             "tx": -10.575,
                             "parent": "Clavicle_Rgt_Jnt",
                             "ty": -0.0005,
@@ -6049,7 +6049,6 @@ class Char( Rig ):
                             "radius": 5.0
                         },
                         "Middle4_Lft_Jnt": {
-                            "nodeType": "joint",
                             "parent": "Middle3_Lft_Jnt",
                             "tx": 2.7589
                         },
@@ -6059,7 +6058,6 @@ class Char( Rig ):
                             "tx": -10.0
                         },
                         "Ring2_Lft_Jnt": {
-                            "nodeType": "joint",
                             "parent": "Ring1_Lft_Jnt",
                             "tx": 5.2284
                         },
@@ -6070,8 +6068,7 @@ class Char( Rig ):
                             "ty": -0.899,
                             "jox": 3.4171,
                             "joy": 7.7111,
-                            "joz": 0.6353,
-                            "nodeType": "joint"
+                            "joz": 0.6353
                         },
                         "Ankle_Lft_upVec": {
                             "nodeType": "transform",
@@ -6079,17 +6076,14 @@ class Char( Rig ):
                             "tx": 10.0
                         },
                         "Ring2_Rgt_Jnt": {
-                            "nodeType": "joint",
                             "parent": "Ring1_Rgt_Jnt",
                             "tx": -5.2284
                         },
                         "Index2_Rgt_Jnt": {
-                            "nodeType": "joint",
                             "parent": "Index1_Rgt_Jnt",
                             "tx": -5.7251
                         },
                         "Pinky2_Lft_Jnt": {
-                            "nodeType": "joint",
                             "parent": "Pinky1_Lft_Jnt",
                             "tx": 4.7646
                         },
@@ -6100,7 +6094,6 @@ class Char( Rig ):
                             "ty": -9.9104
                         },
                         "Ring4_Lft_Jnt": {
-                            "nodeType": "joint",
                             "parent": "Ring3_Lft_Jnt",
                             "tx": 2.6052
                         },
@@ -6111,22 +6104,18 @@ class Char( Rig ):
                             "ty": 0.7544,
                             "jox": 3.3828,
                             "joy": -8.0771,
-                            "joz": 0.0538,
-                            "nodeType": "joint"
+                            "joz": 0.0538
                         },
                         "ArmLo_Lft_Jnt": {
-                            "nodeType": "joint",
                             "radius": 5.0,
                             "parent": "ArmUp_Lft_Jnt",
                             "tx": 23.0
                         },
                         "Ring4_Rgt_Jnt": {
-                            "nodeType": "joint",
                             "parent": "Ring3_Rgt_Jnt",
                             "tx": -2.6052
                         },
                         "Middle4_Rgt_Jnt": {
-                            "nodeType": "joint",
                             "parent": "Middle3_Rgt_Jnt",
                             "tx": -2.7589
                         },
@@ -6137,24 +6126,20 @@ class Char( Rig ):
                             "tx": 5.0
                         },
                         "LegLo_Lft_Jnt": {
-                            "nodeType": "joint",
                             "radius": 5.0,
                             "parent": "LegUp_Lft_Jnt",
                             "ty": -39.0
                         },
                         "Middle3_Rgt_Jnt": {
-                            "nodeType": "joint",
                             "parent": "Middle2_Rgt_Jnt",
                             "tx": -3.1684
                         },
                         "Spine3_Jnt": {
-                            "nodeType": "joint",
                             "radius": 5.0,
                             "parent": "Spine2_Jnt",
                             "ty": 4.2884
                         },
                         "Hips_Jnt": {
-                            "nodeType": "joint",
                             "radius": 5.0,
                             "parent": "Root_Jnt",
                             "ty": 93.9799
@@ -6162,12 +6147,10 @@ class Char( Rig ):
                         "Foot_Lft_Jnt": {
                             "radius": 5.0,
                             "rx": -3.851,
-                            "nodeType": "joint",
                             "parent": "LegLo_Lft_Jnt",
                             "ty": -41.0
                         },
                         "Hand_Rgt_Jnt": {
-                            "nodeType": "joint",
                             "radius": 5.0,
                             "parent": "ArmLo_Rgt_Jnt",
                             "tx": -21.6
@@ -6182,11 +6165,9 @@ class Char( Rig ):
                             "joz": 0.6429,
                             "rx": -0.0254,
                             "ry": 1.481,
-                            "rz": -0.9841,
-                            "nodeType": "joint"
+                            "rz": -0.9841
                         },
                         "Spine1_Jnt": {
-                            "nodeType": "joint",
                             "radius": 5.0,
                             "parent": "Hips_Jnt",
                             "ty": 1.7192
@@ -6196,23 +6177,19 @@ class Char( Rig ):
                             "parent": "Chest_Jnt",
                             "ty": 19.8097,
                             "jox": 10.0,
-                            "radius": 5.0,
-                            "nodeType": "joint"
+                            "radius": 5.0
                         },
                         "Thumb3_Rgt_Jnt": {
-                            "nodeType": "joint",
                             "parent": "Thumb2_Rgt_Jnt",
                             "tx": -3.7769
                         },
                         "Head_Jnt": {
                             "jox": -10.0,
-                            "nodeType": "joint",
                             "radius": 5.0,
                             "parent": "Neck_Jnt",
                             "ty": 15.1352
                         },
                         "Pinky3_Lft_Jnt": {
-                            "nodeType": "joint",
                             "parent": "Pinky2_Lft_Jnt",
                             "tx": 2.6751
                         },
@@ -6226,8 +6203,7 @@ class Char( Rig ):
                             "joz": 0.6429,
                             "rx": -11.4889,
                             "ry": 1.2559,
-                            "rz": -1.2588,
-                            "nodeType": "joint"
+                            "rz": -1.2588
                         },
                         "Middle1_Rgt_Jnt": {
                             "tz": -1.2301,
@@ -6236,40 +6212,33 @@ class Char( Rig ):
                             "ty": -0.8052,
                             "jox": 3.3507,
                             "joy": 1.7115,
-                            "joz": 0.6298,
-                            "nodeType": "joint"
+                            "joz": 0.6298
                         },
                         "Palm_Lft_Jnt": {
-                            "nodeType": "joint",
                             "parent": "Hand_Lft_Jnt",
                             "tx": 1.9233
                         },
                         "Prop_Lft_Jnt": {
-                            "nodeType": "joint",
                             "parent": "Palm_Lft_Jnt",
                             "tx": 5,
                             "ty": -2
                         },
                         "Prop_Rgt_Jnt": {
-                            "nodeType": "joint",
                             "parent": "Palm_Rgt_Jnt",
                             "tx": -5,
                             "ty": 2
                         },
                         "Index3_Rgt_Jnt": {
-                            "nodeType": "joint",
                             "parent": "Index2_Rgt_Jnt",
                             "tx": -3.1627
                         },
                         "Toes_Lft_Jnt": {
                             "radius": 5.0,
                             "tz": 11.9696,
-                            "nodeType": "joint",
                             "parent": "Foot_Lft_Jnt",
                             "ty": -6.3351
                         },
                         "Ring3_Lft_Jnt": {
-                            "nodeType": "joint",
                             "parent": "Ring2_Lft_Jnt",
                             "tx": 2.7781
                         },
@@ -6278,16 +6247,13 @@ class Char( Rig ):
                             "parent": "Head_Jnt",
                             "ty": -1.172,
                             "jox": 16.2,
-                            "radius": 5.0,
-                            "nodeType": "joint"
+                            "radius": 5.0
                         },
                         "Middle3_Lft_Jnt": {
-                            "nodeType": "joint",
                             "parent": "Middle2_Lft_Jnt",
                             "tx": 3.1684
                         },
                         "Spine2_Jnt": {
-                            "nodeType": "joint",
                             "radius": 5.0,
                             "parent": "Spine1_Jnt",
                             "ty": 3.5746
@@ -6295,7 +6261,6 @@ class Char( Rig ):
                         "ToesTip_Lft_Jnt": {
                             "radius": 5.0,
                             "tz": 5.6,
-                            "nodeType": "joint",
                             "parent": "Toes_Lft_Jnt",
                             "ty": -1.4
                         },
@@ -6311,8 +6276,7 @@ class Char( Rig ):
                             "parent": "Hips_Jnt",
                             "ty": -5.9865,
                             "rx": -176.0486,
-                            "radius": 5.0,
-                            "nodeType": "joint"
+                            "radius": 5.0
                         },
                         "LegUp_Lft_Jnt": {
                             "tz": -0.0597,
@@ -6320,16 +6284,13 @@ class Char( Rig ):
                             "parent": "Hips_Jnt",
                             "ty": -5.9865,
                             "rx": 3.9514,
-                            "radius": 5.0,
-                            "nodeType": "joint"
+                            "radius": 5.0
                         },
                         "Thumb2_Rgt_Jnt": {
-                            "nodeType": "joint",
                             "parent": "Thumb1_Rgt_Jnt",
                             "tx": -3.6395
                         },
                         "Head_Jnt_Tip": {
-                            "nodeType": "joint",
                             "radius": 5.0,
                             "parent": "Head_Jnt",
                             "ty": 10.7265
@@ -6341,21 +6302,17 @@ class Char( Rig ):
                             "ty": 0.8052,
                             "jox": 3.3507,
                             "joy": 1.7115,
-                            "joz": 0.6298,
-                            "nodeType": "joint"
+                            "joz": 0.6298
                         },
                         "Index4_Lft_Jnt": {
-                            "nodeType": "joint",
                             "parent": "Index3_Lft_Jnt",
                             "tx": 2.2613
                         },
                         "Pinky2_Rgt_Jnt": {
-                            "nodeType": "joint",
                             "parent": "Pinky1_Rgt_Jnt",
                             "tx": -4.7646
                         },
                         "Thumb3_Lft_Jnt": {
-                            "nodeType": "joint",
                             "parent": "Thumb2_Lft_Jnt",
                             "tx": 3.7769
                         }
@@ -6370,8 +6327,7 @@ class Char( Rig ):
                         "root": {
                             "jox": -90,
                             "radius": 3.0,
-                            "parent": "Joint_Grp",
-                            "nodeType": "joint"
+                            "parent": "Joint_Grp"
                         },
                         "pelvis": {
                             "ty": -2.3795,
@@ -6380,64 +6336,56 @@ class Char( Rig ):
                             "ry": -86.3974,
                             "rz": 90.0,
                             "radius": 3.0,
-                            "parent": "root",
-                            "nodeType": "joint"
+                            "parent": "root"
                         },
                         "spine_01": {
                             "tx": 2.4719,
                             "rx": 0.0001,
                             "rz": -17.2467,
                             "radius": 3.0,
-                            "parent": "pelvis",
-                            "nodeType": "joint"
+                            "parent": "pelvis"
                         },
                         "spine_02": {
                             "tx": 4.9875,
                             "rx": -0.0002,
                             "rz": 6.825,
                             "radius": 3.0,
-                            "parent": "spine_01",
-                            "nodeType": "joint"
+                            "parent": "spine_01"
                         },
                         "spine_03": {
                             "tx": 7.6259,
                             "rx": 0.0002,
                             "rz": 10.3212,
                             "radius": 3.0,
-                            "parent": "spine_02",
-                            "nodeType": "joint"
+                            "parent": "spine_02"
                         },
                         "spine_04": {
                             "tx": 8.8511,
                             "rx": 0.0002,
                             "rz": 8.4786,
                             "radius": 3.0,
-                            "parent": "spine_03",
-                            "nodeType": "joint"
+                            "parent": "spine_03"
                         },
                         "spine_05": {
                             "tx": 17.4988,
                             "rx": -0.0002,
                             "rz": 0.2585,
                             "radius": 3.0,
-                            "parent": "spine_04",
-                            "nodeType": "joint"
+                            "parent": "spine_04"
                         },
                         "neck_01": {
                             "tx": 11.915,
                             "ry": -0.0001,
                             "rz": -25.1344,
                             "radius": 3.0,
-                            "parent": "spine_05",
-                            "nodeType": "joint"
+                            "parent": "spine_05"
                         },
                         "neck_02": {
                             "tx": 5.8488,
                             "rx": -0.0005,
                             "rz": 0.604,
                             "radius": 3.0,
-                            "parent": "neck_01",
-                            "nodeType": "joint"
+                            "parent": "neck_01"
                         },
                         "head": {
                             "tx": 5.7585,
@@ -6445,8 +6393,7 @@ class Char( Rig ):
                             "ry": -0.0001,
                             "rz": 12.2912,
                             "radius": 3.0,
-                            "parent": "neck_02",
-                            "nodeType": "joint"
+                            "parent": "neck_02"
                         },
                         "clavicle_l": {
                             "tx": 5.8309,
@@ -6456,8 +6403,7 @@ class Char( Rig ):
                             "ry": 81.6483,
                             "rz": 156.7854,
                             "radius": 3.0,
-                            "parent": "spine_05",
-                            "nodeType": "joint"
+                            "parent": "spine_05"
                         },
                         "upperarm_l": {
                             "tx": 15.2861,
@@ -6465,15 +6411,13 @@ class Char( Rig ):
                             "ry": 44.6755,
                             "rz": -3.614,
                             "radius": 3.0,
-                            "parent": "clavicle_l",
-                            "nodeType": "joint"
+                            "parent": "clavicle_l"
                         },
                         "lowerarm_l": {
                             "tx": 27.0904,
                             "rz": -36.7004,
                             "radius": 3.0,
-                            "parent": "upperarm_l",
-                            "nodeType": "joint"
+                            "parent": "upperarm_l"
                         },
                         "lowerarm_twist_02_l": {
                             "tx": 8.6984,
@@ -6481,8 +6425,7 @@ class Char( Rig ):
                             "ry": -0.192,
                             "rz": 0.0669,
                             "radius": 3.0,
-                            "parent": "lowerarm_l",
-                            "nodeType": "joint"
+                            "parent": "lowerarm_l"
                         },
                         "lowerarm_twist_01_l": {
                             "tx": 17.3968,
@@ -6490,8 +6433,7 @@ class Char( Rig ):
                             "ry": -0.192,
                             "rz": 0.0669,
                             "radius": 3.0,
-                            "parent": "lowerarm_l",
-                            "nodeType": "joint"
+                            "parent": "lowerarm_l"
                         },
                         "hand_l": {
                             "tx": 26.0952,
@@ -6499,8 +6441,7 @@ class Char( Rig ):
                             "ry": 10.4382,
                             "rz": 3.7481,
                             "radius": 3.0,
-                            "parent": "lowerarm_l",
-                            "nodeType": "joint"
+                            "parent": "lowerarm_l"
                         },
                         "middle_metacarpal_l": {
                             "tx": 3.1166,
@@ -6510,8 +6451,7 @@ class Char( Rig ):
                             "ry": -2.0096,
                             "rz": -7.1628,
                             "radius": 3.0,
-                            "parent": "hand_l",
-                            "nodeType": "joint"
+                            "parent": "hand_l"
                         },
                         "middle_01_l": {
                             "tx": 5.5605,
@@ -6519,8 +6459,7 @@ class Char( Rig ):
                             "ry": -4.2859,
                             "rz": 24.0416,
                             "radius": 3.0,
-                            "parent": "middle_metacarpal_l",
-                            "nodeType": "joint"
+                            "parent": "middle_metacarpal_l"
                         },
                         "middle_02_l": {
                             "tx": 4.9197,
@@ -6528,8 +6467,7 @@ class Char( Rig ):
                             "ry": 0.4761,
                             "rz": 19.1529,
                             "radius": 3.0,
-                            "parent": "middle_01_l",
-                            "nodeType": "joint"
+                            "parent": "middle_01_l"
                         },
                         "middle_03_l": {
                             "tx": 2.9021,
@@ -6537,8 +6475,7 @@ class Char( Rig ):
                             "ry": -0.2186,
                             "rz": 2.8503,
                             "radius": 3.0,
-                            "parent": "middle_02_l",
-                            "nodeType": "joint"
+                            "parent": "middle_02_l"
                         },
                         "pinky_metacarpal_l": {
                             "tx": 2.9831,
@@ -6548,8 +6485,7 @@ class Char( Rig ):
                             "ry": -21.6206,
                             "rz": 9.1694,
                             "radius": 3.0,
-                            "parent": "hand_l",
-                            "nodeType": "joint"
+                            "parent": "hand_l"
                         },
                         "pinky_01_l": {
                             "tx": 4.7179,
@@ -6557,8 +6493,7 @@ class Char( Rig ):
                             "ry": 1.1126,
                             "rz": 11.7384,
                             "radius": 3.0,
-                            "parent": "pinky_metacarpal_l",
-                            "nodeType": "joint"
+                            "parent": "pinky_metacarpal_l"
                         },
                         "pinky_02_l": {
                             "tx": 2.8933,
@@ -6566,8 +6501,7 @@ class Char( Rig ):
                             "ry": -0.1857,
                             "rz": 20.2972,
                             "radius": 3.0,
-                            "parent": "pinky_01_l",
-                            "nodeType": "joint"
+                            "parent": "pinky_01_l"
                         },
                         "pinky_03_l": {
                             "tx": 1.7915,
@@ -6575,8 +6509,7 @@ class Char( Rig ):
                             "ry": -0.0838,
                             "rz": 3.2541,
                             "radius": 3.0,
-                            "parent": "pinky_02_l",
-                            "nodeType": "joint"
+                            "parent": "pinky_02_l"
                         },
                         "ring_metacarpal_l": {
                             "tx": 3.1086,
@@ -6586,8 +6519,7 @@ class Char( Rig ):
                             "ry": -13.6762,
                             "rz": -2.8714,
                             "radius": 3.0,
-                            "parent": "hand_l",
-                            "nodeType": "joint"
+                            "parent": "hand_l"
                         },
                         "ring_01_l": {
                             "tx": 4.9928,
@@ -6595,8 +6527,7 @@ class Char( Rig ):
                             "ry": 0.7738,
                             "rz": 17.9148,
                             "radius": 3.0,
-                            "parent": "ring_metacarpal_l",
-                            "nodeType": "joint"
+                            "parent": "ring_metacarpal_l"
                         },
                         "ring_02_l": {
                             "tx": 4.2514,
@@ -6604,8 +6535,7 @@ class Char( Rig ):
                             "ry": 0.4462,
                             "rz": 26.3775,
                             "radius": 3.0,
-                            "parent": "ring_01_l",
-                            "nodeType": "joint"
+                            "parent": "ring_01_l"
                         },
                         "ring_03_l": {
                             "tx": 3.2348,
@@ -6613,8 +6543,7 @@ class Char( Rig ):
                             "ry": -0.3676,
                             "rz": 4.6278,
                             "radius": 3.0,
-                            "parent": "ring_02_l",
-                            "nodeType": "joint"
+                            "parent": "ring_02_l"
                         },
                         "thumb_01_l": {
                             "tx": 2.31,
@@ -6624,8 +6553,7 @@ class Char( Rig ):
                             "ry": 33.1928,
                             "rz": 20.2681,
                             "radius": 3.0,
-                            "parent": "hand_l",
-                            "nodeType": "joint"
+                            "parent": "hand_l"
                         },
                         "thumb_02_l": {
                             "tx": 4.6318,
@@ -6633,8 +6561,7 @@ class Char( Rig ):
                             "ry": -6.2937,
                             "rz": 20.2302,
                             "radius": 3.0,
-                            "parent": "thumb_01_l",
-                            "nodeType": "joint"
+                            "parent": "thumb_01_l"
                         },
                         "thumb_03_l": {
                             "tx": 2.7106,
@@ -6642,8 +6569,7 @@ class Char( Rig ):
                             "ry": 0.195,
                             "rz": 8.4044,
                             "radius": 3.0,
-                            "parent": "thumb_02_l",
-                            "nodeType": "joint"
+                            "parent": "thumb_02_l"
                         },
                         "index_metacarpal_l": {
                             "tx": 3.4527,
@@ -6653,8 +6579,7 @@ class Char( Rig ):
                             "ry": 5.6408,
                             "rz": -3.8649,
                             "radius": 3.0,
-                            "parent": "hand_l",
-                            "nodeType": "joint"
+                            "parent": "hand_l"
                         },
                         "index_01_l": {
                             "tx": 5.3769,
@@ -6662,8 +6587,7 @@ class Char( Rig ):
                             "ry": -4.4455,
                             "rz": 19.2285,
                             "radius": 3.0,
-                            "parent": "index_metacarpal_l",
-                            "nodeType": "joint"
+                            "parent": "index_metacarpal_l"
                         },
                         "index_02_l": {
                             "tx": 4.5645,
@@ -6671,30 +6595,26 @@ class Char( Rig ):
                             "ry": 0.2475,
                             "rz": 11.7142,
                             "radius": 3.0,
-                            "parent": "index_01_l",
-                            "nodeType": "joint"
+                            "parent": "index_01_l"
                         },
                         "index_03_l": {
                             "tx": 2.4865,
                             "ry": 0.0602,
                             "rz": -0.0124,
                             "radius": 3.0,
-                            "parent": "index_02_l",
-                            "nodeType": "joint"
+                            "parent": "index_02_l"
                         },
                         "upperarm_twist_01_l": {
                             "tx": 9.0301,
                             "ry": -0.2393,
                             "rz": 0.0137,
                             "radius": 3.0,
-                            "parent": "upperarm_l",
-                            "nodeType": "joint"
+                            "parent": "upperarm_l"
                         },
                         "upperarm_twist_02_l": {
                             "tx": 18.0602,
                             "radius": 3.0,
-                            "parent": "upperarm_l",
-                            "nodeType": "joint"
+                            "parent": "upperarm_l"
                         },
                         "clavicle_r": {
                             "tx": 5.8304,
@@ -6704,8 +6624,7 @@ class Char( Rig ):
                             "ry": 81.6482,
                             "rz": -23.2162,
                             "radius": 3.0,
-                            "parent": "spine_05",
-                            "nodeType": "joint"
+                            "parent": "spine_05"
                         },
                         "upperarm_r": {
                             "tx": -15.286,
@@ -6714,15 +6633,13 @@ class Char( Rig ):
                             "ry": 44.6755,
                             "rz": -3.614,
                             "radius": 3.0,
-                            "parent": "clavicle_r",
-                            "nodeType": "joint"
+                            "parent": "clavicle_r"
                         },
                         "lowerarm_r": {
                             "tx": -27.0899,
                             "rz": -36.7004,
                             "radius": 3.0,
-                            "parent": "upperarm_r",
-                            "nodeType": "joint"
+                            "parent": "upperarm_r"
                         },
                         "lowerarm_twist_02_r": {
                             "tx": -8.6985,
@@ -6730,8 +6647,7 @@ class Char( Rig ):
                             "ry": -0.192,
                             "rz": 0.0669,
                             "radius": 3.0,
-                            "parent": "lowerarm_r",
-                            "nodeType": "joint"
+                            "parent": "lowerarm_r"
                         },
                         "lowerarm_twist_01_r": {
                             "tx": -17.397,
@@ -6739,8 +6655,7 @@ class Char( Rig ):
                             "ry": -0.192,
                             "rz": 0.0669,
                             "radius": 3.0,
-                            "parent": "lowerarm_r",
-                            "nodeType": "joint"
+                            "parent": "lowerarm_r"
                         },
                         "hand_r": {
                             "tx": -26.0955,
@@ -6748,8 +6663,7 @@ class Char( Rig ):
                             "ry": 10.4382,
                             "rz": 3.7481,
                             "radius": 3.0,
-                            "parent": "lowerarm_r",
-                            "nodeType": "joint"
+                            "parent": "lowerarm_r"
                         },
                         "middle_metacarpal_r": {
                             "tx": -3.1166,
@@ -6759,8 +6673,7 @@ class Char( Rig ):
                             "ry": -2.0096,
                             "rz": -7.1628,
                             "radius": 3.0,
-                            "parent": "hand_r",
-                            "nodeType": "joint"
+                            "parent": "hand_r"
                         },
                         "middle_01_r": {
                             "tx": -5.5606,
@@ -6768,8 +6681,7 @@ class Char( Rig ):
                             "ry": -4.2859,
                             "rz": 24.0416,
                             "radius": 3.0,
-                            "parent": "middle_metacarpal_r",
-                            "nodeType": "joint"
+                            "parent": "middle_metacarpal_r"
                         },
                         "middle_02_r": {
                             "tx": -4.9196,
@@ -6777,8 +6689,7 @@ class Char( Rig ):
                             "ry": 0.4761,
                             "rz": 19.1529,
                             "radius": 3.0,
-                            "parent": "middle_01_r",
-                            "nodeType": "joint"
+                            "parent": "middle_01_r"
                         },
                         "middle_03_r": {
                             "tx": -2.9021,
@@ -6786,8 +6697,7 @@ class Char( Rig ):
                             "ry": -0.2186,
                             "rz": 2.8503,
                             "radius": 3.0,
-                            "parent": "middle_02_r",
-                            "nodeType": "joint"
+                            "parent": "middle_02_r"
                         },
                         "pinky_metacarpal_r": {
                             "tx": -2.9831,
@@ -6797,8 +6707,7 @@ class Char( Rig ):
                             "ry": -21.6206,
                             "rz": 9.1694,
                             "radius": 3.0,
-                            "parent": "hand_r",
-                            "nodeType": "joint"
+                            "parent": "hand_r"
                         },
                         "pinky_01_r": {
                             "tx": -4.718,
@@ -6806,8 +6715,7 @@ class Char( Rig ):
                             "ry": 1.1126,
                             "rz": 11.7384,
                             "radius": 3.0,
-                            "parent": "pinky_metacarpal_r",
-                            "nodeType": "joint"
+                            "parent": "pinky_metacarpal_r"
                         },
                         "pinky_02_r": {
                             "tx": -2.8933,
@@ -6816,8 +6724,7 @@ class Char( Rig ):
                             "ry": -0.1857,
                             "rz": 20.2972,
                             "radius": 3.0,
-                            "parent": "pinky_01_r",
-                            "nodeType": "joint"
+                            "parent": "pinky_01_r"
                         },
                         "pinky_03_r": {
                             "tx": -1.7915,
@@ -6825,8 +6732,7 @@ class Char( Rig ):
                             "ry": -0.0838,
                             "rz": 3.2541,
                             "radius": 3.0,
-                            "parent": "pinky_02_r",
-                            "nodeType": "joint"
+                            "parent": "pinky_02_r"
                         },
                         "ring_metacarpal_r": {
                             "tx": -3.1086,
@@ -6836,8 +6742,7 @@ class Char( Rig ):
                             "ry": -13.6762,
                             "rz": -2.8714,
                             "radius": 3.0,
-                            "parent": "hand_r",
-                            "nodeType": "joint"
+                            "parent": "hand_r"
                         },
                         "ring_01_r": {
                             "tx": -4.9928,
@@ -6846,8 +6751,7 @@ class Char( Rig ):
                             "ry": 0.7738,
                             "rz": 17.9148,
                             "radius": 3.0,
-                            "parent": "ring_metacarpal_r",
-                            "nodeType": "joint"
+                            "parent": "ring_metacarpal_r"
                         },
                         "ring_02_r": {
                             "tx": -4.2514,
@@ -6856,8 +6760,7 @@ class Char( Rig ):
                             "ry": 0.4462,
                             "rz": 26.3775,
                             "radius": 3.0,
-                            "parent": "ring_01_r",
-                            "nodeType": "joint"
+                            "parent": "ring_01_r"
                         },
                         "ring_03_r": {
                             "tx": -3.2347,
@@ -6866,8 +6769,7 @@ class Char( Rig ):
                             "ry": -0.3676,
                             "rz": 4.6278,
                             "radius": 3.0,
-                            "parent": "ring_02_r",
-                            "nodeType": "joint"
+                            "parent": "ring_02_r"
                         },
                         "thumb_01_r": {
                             "tx": -2.3101,
@@ -6877,8 +6779,7 @@ class Char( Rig ):
                             "ry": 33.1928,
                             "rz": 20.2681,
                             "radius": 3.0,
-                            "parent": "hand_r",
-                            "nodeType": "joint"
+                            "parent": "hand_r"
                         },
                         "thumb_02_r": {
                             "tx": -4.6318,
@@ -6886,8 +6787,7 @@ class Char( Rig ):
                             "ry": -6.2937,
                             "rz": 20.2302,
                             "radius": 3.0,
-                            "parent": "thumb_01_r",
-                            "nodeType": "joint"
+                            "parent": "thumb_01_r"
                         },
                         "thumb_03_r": {
                             "tx": -2.7106,
@@ -6896,8 +6796,7 @@ class Char( Rig ):
                             "ry": 0.195,
                             "rz": 8.4044,
                             "radius": 3.0,
-                            "parent": "thumb_02_r",
-                            "nodeType": "joint"
+                            "parent": "thumb_02_r"
                         },
                         "index_metacarpal_r": {
                             "tx": -3.4527,
@@ -6907,8 +6806,7 @@ class Char( Rig ):
                             "ry": 5.6408,
                             "rz": -3.8649,
                             "radius": 3.0,
-                            "parent": "hand_r",
-                            "nodeType": "joint"
+                            "parent": "hand_r"
                         },
                         "index_01_r": {
                             "tx": -5.3769,
@@ -6916,8 +6814,7 @@ class Char( Rig ):
                             "ry": -4.4455,
                             "rz": 19.2285,
                             "radius": 3.0,
-                            "parent": "index_metacarpal_r",
-                            "nodeType": "joint"
+                            "parent": "index_metacarpal_r"
                         },
                         "index_02_r": {
                             "tx": -4.5646,
@@ -6926,16 +6823,14 @@ class Char( Rig ):
                             "ry": 0.2475,
                             "rz": 11.7142,
                             "radius": 3.0,
-                            "parent": "index_01_r",
-                            "nodeType": "joint"
+                            "parent": "index_01_r"
                         },
                         "index_03_r": {
                             "tx": -2.4864,
                             "ry": 0.0602,
                             "rz": -0.0124,
                             "radius": 3.0,
-                            "parent": "index_02_r",
-                            "nodeType": "joint"
+                            "parent": "index_02_r"
                         },
                         "upperarm_twist_01_r": {
                             "tx": -9.03,
@@ -6943,15 +6838,13 @@ class Char( Rig ):
                             "ry": -0.2393,
                             "rz": 0.0137,
                             "radius": 3.0,
-                            "parent": "upperarm_r",
-                            "nodeType": "joint"
+                            "parent": "upperarm_r"
                         },
                         "upperarm_twist_02_r": {
                             "tx": -18.0599,
                             "tz": -0.0003,
                             "radius": 3.0,
-                            "parent": "upperarm_r",
-                            "nodeType": "joint"
+                            "parent": "upperarm_r"
                         },
                         "thigh_r": {
                             "tx": -3.232,
@@ -6961,15 +6854,13 @@ class Char( Rig ):
                             "ry": -2.3902,
                             "rz": 175.2025,
                             "radius": 3.0,
-                            "parent": "pelvis",
-                            "nodeType": "joint"
+                            "parent": "pelvis"
                         },
                         "calf_r": {
                             "tx": 45.7519,
                             "rz": -1.0935,
                             "radius": 3.0,
-                            "parent": "thigh_r",
-                            "nodeType": "joint"
+                            "parent": "thigh_r"
                         },
                         "foot_r": {
                             "tx": 41.7055,
@@ -6977,8 +6868,7 @@ class Char( Rig ):
                             "ry": 2.5398,
                             "rz": 0.1138,
                             "radius": 3.0,
-                            "parent": "calf_r",
-                            "nodeType": "joint"
+                            "parent": "calf_r"
                         },
                         "ball_r": {
                             "tx": 6.5368,
@@ -6986,8 +6876,7 @@ class Char( Rig ):
                             "tz": -0.0439,
                             "rz": -90.0,
                             "radius": 3.0,
-                            "parent": "foot_r",
-                            "nodeType": "joint"
+                            "parent": "foot_r"
                         },
                         "calf_twist_02_r": {
                             "tx": 13.9018,
@@ -6996,8 +6885,7 @@ class Char( Rig ):
                             "ry": -0.2832,
                             "rz": 0.1135,
                             "radius": 3.0,
-                            "parent": "calf_r",
-                            "nodeType": "joint"
+                            "parent": "calf_r"
                         },
                         "calf_twist_01_r": {
                             "tx": 27.8036,
@@ -7006,8 +6894,7 @@ class Char( Rig ):
                             "ry": -0.2832,
                             "rz": 0.1135,
                             "radius": 3.0,
-                            "parent": "calf_r",
-                            "nodeType": "joint"
+                            "parent": "calf_r"
                         },
                         "thigh_twist_01_r": {
                             "tx": 15.2506,
@@ -7015,8 +6902,7 @@ class Char( Rig ):
                             "ry": -0.2833,
                             "rz": 0.0533,
                             "radius": 3.0,
-                            "parent": "thigh_r",
-                            "nodeType": "joint"
+                            "parent": "thigh_r"
                         },
                         "thigh_twist_02_r": {
                             "tx": 30.5013,
@@ -7024,8 +6910,7 @@ class Char( Rig ):
                             "ry": -0.2833,
                             "rz": 0.0533,
                             "radius": 3.0,
-                            "parent": "thigh_r",
-                            "nodeType": "joint"
+                            "parent": "thigh_r"
                         },
                         "thigh_l": {
                             "tx": -3.232,
@@ -7035,15 +6920,13 @@ class Char( Rig ):
                             "ry": -2.3902,
                             "rz": -4.7975,
                             "radius": 3.0,
-                            "parent": "pelvis",
-                            "nodeType": "joint"
+                            "parent": "pelvis"
                         },
                         "calf_l": {
                             "tx": -45.752,
                             "rz": -1.0935,
                             "radius": 3.0,
-                            "parent": "thigh_l",
-                            "nodeType": "joint"
+                            "parent": "thigh_l"
                         },
                         "foot_l": {
                             "tx": -41.7054,
@@ -7051,8 +6934,7 @@ class Char( Rig ):
                             "ry": 2.5398,
                             "rz": 0.1138,
                             "radius": 3.0,
-                            "parent": "calf_l",
-                            "nodeType": "joint"
+                            "parent": "calf_l"
                         },
                         "ball_l": {
                             "tx": -6.5368,
@@ -7060,8 +6942,7 @@ class Char( Rig ):
                             "tz": 0.0439,
                             "rz": -90.0,
                             "radius": 3.0,
-                            "parent": "foot_l",
-                            "nodeType": "joint"
+                            "parent": "foot_l"
                         },
                         "calf_twist_02_l": {
                             "tx": -13.9018,
@@ -7070,8 +6951,7 @@ class Char( Rig ):
                             "ry": -0.2832,
                             "rz": 0.1135,
                             "radius": 3.0,
-                            "parent": "calf_l",
-                            "nodeType": "joint"
+                            "parent": "calf_l"
                         },
                         "calf_twist_01_l": {
                             "tx": -27.8036,
@@ -7080,8 +6960,7 @@ class Char( Rig ):
                             "ry": -0.2832,
                             "rz": 0.1135,
                             "radius": 3.0,
-                            "parent": "calf_l",
-                            "nodeType": "joint"
+                            "parent": "calf_l"
                         },
                         "thigh_twist_01_l": {
                             "tx": -15.2507,
@@ -7089,8 +6968,7 @@ class Char( Rig ):
                             "ry": -0.2833,
                             "rz": 0.0533,
                             "radius": 3.0,
-                            "parent": "thigh_l",
-                            "nodeType": "joint"
+                            "parent": "thigh_l"
                         },
                         "thigh_twist_02_l": {
                             "tx": -30.5014,
@@ -7098,13 +6976,11 @@ class Char( Rig ):
                             "ry": -0.2833,
                             "rz": 0.0533,
                             "radius": 3.0,
-                            "parent": "thigh_l",
-                            "nodeType": "joint"
+                            "parent": "thigh_l"
                         },
                         "ik_foot_root": {
                             "radius": 3.0,
-                            "parent": "root",
-                            "nodeType": "joint"
+                            "parent": "root"
                         },
                         "ik_foot_l": {
                             "tx": 14.7118,
@@ -7114,8 +6990,7 @@ class Char( Rig ):
                             "ry": -89.3347,
                             "rz": -60.6186,
                             "radius": 3.0,
-                            "parent": "ik_foot_root",
-                            "nodeType": "joint"
+                            "parent": "ik_foot_root"
                         },
                         "ik_foot_r": {
                             "tx": -14.7118,
@@ -7125,13 +7000,11 @@ class Char( Rig ):
                             "ry": 89.3347,
                             "rz": 60.619,
                             "radius": 3.0,
-                            "parent": "ik_foot_root",
-                            "nodeType": "joint"
+                            "parent": "ik_foot_root"
                         },
                         "ik_hand_root": {
                             "radius": 3.0,
-                            "parent": "root",
-                            "nodeType": "joint"
+                            "parent": "root"
                         },
                         "ik_hand_gun": {
                             "tx": -45.5549,
@@ -7141,8 +7014,7 @@ class Char( Rig ):
                             "ry": -51.6072,
                             "rz": 34.7704,
                             "radius": 3.0,
-                            "parent": "ik_hand_root",
-                            "nodeType": "joint"
+                            "parent": "ik_hand_root"
                         },
                         "ik_hand_l": {
                             "tx": 46.4804,
@@ -7152,23 +7024,19 @@ class Char( Rig ):
                             "ry": -20.2165,
                             "rz": -120.7276,
                             "radius": 3.0,
-                            "parent": "ik_hand_gun",
-                            "nodeType": "joint"
+                            "parent": "ik_hand_gun"
                         },
                         "ik_hand_r": {
                             "radius": 3.0,
-                            "parent": "ik_hand_gun",
-                            "nodeType": "joint"
+                            "parent": "ik_hand_gun"
                         },
                         "interaction": {
                             "radius": 3.0,
-                            "parent": "root",
-                            "nodeType": "joint"
+                            "parent": "root"
                         },
                         "center_of_mass": {
                             "radius": 3.0,
-                            "parent": "root",
-                            "nodeType": "joint"
+                            "parent": "root"
                         }
                     }
                 }
@@ -7181,7 +7049,6 @@ class Char( Rig ):
                         "Pelvis_Jnt": {
                             "radius": 0.5,
                             "tz": -4.1285,
-                            "nodeType": "joint",
                             "parent": "Root_Jnt",
                             "ty": 10.9146
                         },
@@ -7189,13 +7056,11 @@ class Char( Rig ):
                             "jox": 1.7534,
                             "radius": 0.5,
                             "tz": -2.7777,
-                            "nodeType": "joint",
                             "parent": "Radius_Rgt_Jnt"
                         },
                         "HoofFrontTip_Rgt_Jnt": {
                             "radius": 0.5,
                             "tz": -0.4491,
-                            "nodeType": "joint",
                             "parent": "HoofFront_Rgt_Jnt"
                         },
                         "HoofFront_Rgt_Jnt": {
@@ -7203,8 +7068,7 @@ class Char( Rig ):
                             "parent": "PasternFront_Rgt_Jnt",
                             "ty": -0.02,
                             "jox": -11.5177,
-                            "radius": 0.5,
-                            "nodeType": "joint"
+                            "radius": 0.5
                         },
                         "Scapula_Rgt_Jnt": {
                             "tz": -0.428,
@@ -7214,52 +7078,44 @@ class Char( Rig ):
                             "jox": -130.5331,
                             "joy": -1.5141,
                             "joz": 1.2943,
-                            "radius": 0.5,
-                            "nodeType": "joint"
+                            "radius": 0.5
                         },
                         "Radius_Rgt_Jnt": {
                             "tz": -2.426,
                             "parent": "Humerus_Rgt_Jnt",
                             "jox": -49.1197,
                             "joz": 180.0,
-                            "radius": 0.5,
-                            "nodeType": "joint"
+                            "radius": 0.5
                         },
                         "Neck8_Jnt": {
                             "radius": 0.5,
                             "tz": 0.9588,
-                            "nodeType": "joint",
                             "parent": "Neck7_Jnt"
                         },
                         "Neck7_Jnt": {
                             "radius": 0.5,
                             "tz": 0.9588,
-                            "nodeType": "joint",
                             "parent": "Neck6_Jnt"
                         },
                         "Spine5_Jnt": {
                             "jox": -3.2086,
                             "radius": 0.5,
                             "tz": 1.2891,
-                            "nodeType": "joint",
                             "parent": "Spine4_Jnt"
                         },
                         "Neck5_Jnt": {
                             "radius": 0.5,
                             "tz": 0.9588,
-                            "nodeType": "joint",
                             "parent": "Neck4_Jnt"
                         },
                         "Neck4_Jnt": {
                             "radius": 0.5,
                             "tz": 0.9588,
-                            "nodeType": "joint",
                             "parent": "Neck3_Jnt"
                         },
                         "Neck3_Jnt": {
                             "radius": 0.5,
                             "tz": 0.9588,
-                            "nodeType": "joint",
                             "parent": "Neck2_Jnt"
                         },
                         "Neck2_Jnt": {
@@ -7267,17 +7123,14 @@ class Char( Rig ):
                             "parent": "Neck1_Jnt",
                             "ty": 0.2143,
                             "jox": -9.026,
-                            "radius": 0.5,
-                            "nodeType": "joint"
+                            "radius": 0.5
                         },
                         "Neck1_Jnt": {
                             "radius": 0.5,
                             "tz": 0.2611,
-                            "nodeType": "joint",
                             "parent": "Shoulder_Jnt"
                         },
                         "Eye_Lft_Jnt": {
-                            "nodeType": "joint",
                             "tx": 0.7298,
                             "parent": "Head_Jnt",
                             "ty": 0.4374,
@@ -7289,20 +7142,17 @@ class Char( Rig ):
                             "parent": "HoofBack_Lft_Jnt",
                             "ty": 0.02,
                             "jox": -5.1461,
-                            "radius": 0.5,
-                            "nodeType": "joint"
+                            "radius": 0.5
                         },
                         "HoofBack_Lft_Jnt": {
                             "radius": 0.5,
                             "tz": 0.7518,
-                            "nodeType": "joint",
                             "parent": "PasternBack_Lft_Jnt"
                         },
                         "PasternBack_Lft_Jnt": {
                             "jox": -32.0856,
                             "radius": 0.5,
                             "tz": 3.5052,
-                            "nodeType": "joint",
                             "parent": "CannonBack_Lft_Jnt"
                         },
                         "CannonBack_Lft_Jnt": {
@@ -7311,11 +7161,9 @@ class Char( Rig ):
                             "jox": -37.8725,
                             "joy": -1.4155,
                             "joz": -1.5105,
-                            "radius": 0.5,
-                            "nodeType": "joint"
+                            "radius": 0.5
                         },
                         "Fibula_Lft_Jnt": {
-                            "nodeType": "joint",
                             "tx": 0.1987,
                             "parent": "Femur_Lft_Jnt",
                             "jox": 77.9223,
@@ -7327,31 +7175,26 @@ class Char( Rig ):
                             "parent": "Pelvis_Jnt",
                             "ty": -0.0125,
                             "jox": 8.35,
-                            "radius": 0.5,
-                            "nodeType": "joint"
+                            "radius": 0.5
                         },
                         "Tail12_Jnt": {
                             "radius": 0.5,
                             "tz": -0.75,
-                            "nodeType": "joint",
                             "parent": "Tail11_Jnt"
                         },
                         "Tail10_Jnt": {
                             "radius": 0.5,
                             "tz": -0.75,
-                            "nodeType": "joint",
                             "parent": "Tail9_Jnt"
                         },
                         "Tail11_Jnt": {
                             "radius": 0.5,
                             "tz": -0.75,
-                            "nodeType": "joint",
                             "parent": "Tail10_Jnt"
                         },
                         "JawTip_Jnt": {
                             "radius": 0.5,
                             "tz": 2.2192,
-                            "nodeType": "joint",
                             "parent": "Jaw_Jnt"
                         },
                         "Jaw_Jnt": {
@@ -7359,8 +7202,7 @@ class Char( Rig ):
                             "parent": "Head_Jnt",
                             "ty": -0.6034,
                             "jox": 4.3305,
-                            "radius": 0.5,
-                            "nodeType": "joint"
+                            "radius": 0.5
                         },
                         "Eye_Rgt_Jnt": {
                             "tz": 0.587,
@@ -7368,8 +7210,7 @@ class Char( Rig ):
                             "parent": "Head_Jnt",
                             "ty": 0.4374,
                             "jox": 180.0,
-                            "radius": 0.5,
-                            "nodeType": "joint"
+                            "radius": 0.5
                         },
                         "Humerus_Rgt_Jnt": {
                             "tz": -3.9995,
@@ -7377,14 +7218,12 @@ class Char( Rig ):
                             "parent": "Scapula_Rgt_Jnt",
                             "jox": -87.8822,
                             "joz": 180.0,
-                            "radius": 0.5,
-                            "nodeType": "joint"
+                            "radius": 0.5
                         },
                         "Spine4_Jnt": {
                             "jox": -3.2086,
                             "radius": 0.5,
                             "tz": 1.2891,
-                            "nodeType": "joint",
                             "parent": "Spine3_Jnt"
                         },
                         "Ear_Rgt_Jnt": {
@@ -7394,18 +7233,15 @@ class Char( Rig ):
                             "ty": 0.2438,
                             "jox": 135.3,
                             "joz": 17.7,
-                            "radius": 0.5,
-                            "nodeType": "joint"
+                            "radius": 0.5
                         },
                         "Root_Jnt": {
-                            "nodeType": "joint",
                             "radius": 0.5,
                             "parent": "Joint_Grp"
                         },
                         "Neck6_Jnt": {
                             "radius": 0.5,
                             "tz": 0.9588,
-                            "nodeType": "joint",
                             "parent": "Neck5_Jnt"
                         },
                         "HoofFront_Lft_Jnt": {
@@ -7413,33 +7249,28 @@ class Char( Rig ):
                             "parent": "PasternFront_Lft_Jnt",
                             "ty": 0.02,
                             "jox": -5.1461,
-                            "radius": 0.5,
-                            "nodeType": "joint"
+                            "radius": 0.5
                         },
                         "CannonFront_Lft_Jnt": {
                             "parent": "Radius_Lft_Jnt",
                             "tz": 2.749,
-                            "radius": 0.5,
-                            "nodeType": "joint"
+                            "radius": 0.5
                         },
                         "PasternFront_Lft_Jnt": {
                             "jox": -30.1682,
                             "radius": 0.5,
                             "tz": 3.0313,
-                            "nodeType": "joint",
                             "parent": "CannonFront_Lft_Jnt"
                         },
                         "HeadTip_Jnt": {
                             "radius": 0.5,
                             "tz": 3.6066,
-                            "nodeType": "joint",
                             "parent": "Head_Jnt",
                             "ty": -0.1811
                         },
                         "HoofFrontTip_Lft_Jnt": {
                             "radius": 0.5,
                             "tz": 0.4491,
-                            "nodeType": "joint",
                             "parent": "HoofFront_Lft_Jnt"
                         },
                         "Scapula_Lft_Jnt": {
@@ -7450,14 +7281,12 @@ class Char( Rig ):
                             "jox": 49.4669,
                             "joy": 1.5141,
                             "joz": -1.2943,
-                            "radius": 0.5,
-                            "nodeType": "joint"
+                            "radius": 0.5
                         },
                         "Spine2_Jnt": {
                             "jox": -3.209,
                             "radius": 0.5,
                             "tz": 1.2891,
-                            "nodeType": "joint",
                             "parent": "Spine1_Jnt"
                         },
                         "Head_Jnt": {
@@ -7465,13 +7294,11 @@ class Char( Rig ):
                             "parent": "Neck8_Jnt",
                             "ty": -0.0333,
                             "jox": 67.609,
-                            "radius": 0.5,
-                            "nodeType": "joint"
+                            "radius": 0.5
                         },
                         "HoofBack_Rgt_Jnt": {
                             "radius": 0.5,
                             "tz": -0.7518,
-                            "nodeType": "joint",
                             "parent": "PasternBack_Rgt_Jnt"
                         },
                         "HoofBackTip_Rgt_Jnt": {
@@ -7479,8 +7306,7 @@ class Char( Rig ):
                             "parent": "HoofBack_Rgt_Jnt",
                             "ty": -0.02,
                             "jox": -5.1461,
-                            "radius": 0.5,
-                            "nodeType": "joint"
+                            "radius": 0.5
                         },
                         "CannonBack_Rgt_Jnt": {
                             "tz": -3.1596,
@@ -7488,14 +7314,12 @@ class Char( Rig ):
                             "jox": -37.8932,
                             "joy": -3.199,
                             "joz": -2.4121,
-                            "radius": 0.5,
-                            "nodeType": "joint"
+                            "radius": 0.5
                         },
                         "PasternBack_Rgt_Jnt": {
                             "jox": -32.0856,
                             "radius": 0.5,
                             "tz": -3.5053,
-                            "nodeType": "joint",
                             "parent": "CannonBack_Rgt_Jnt"
                         },
                         "Femur_Rgt_Jnt": {
@@ -7506,8 +7330,7 @@ class Char( Rig ):
                             "jox": -130.444,
                             "joy": 2.060,
                             "joz": 1.788,
-                            "radius": 0.5,
-                            "nodeType": "joint"
+                            "radius": 0.5
                         },
                         "Fibula_Rgt_Jnt": {
                             "tz": -3.7827,
@@ -7516,14 +7339,12 @@ class Char( Rig ):
                             "jox": 78.093,
                             "joy": 0.974,
                             "joz": 3.0262,
-                            "radius": 0.5,
-                            "nodeType": "joint"
+                            "radius": 0.5
                         },
                         "Radius_Lft_Jnt": {
                             "jox": -49.1201,
                             "radius": 0.5,
                             "tz": 2.426,
-                            "nodeType": "joint",
                             "parent": "Humerus_Lft_Jnt"
                         },
                         "Ear_Lft_Jnt": {
@@ -7533,33 +7354,28 @@ class Char( Rig ):
                             "ty": 0.2438,
                             "jox": -44.7,
                             "joz": -17.7,
-                            "radius": 0.5,
-                            "nodeType": "joint"
+                            "radius": 0.5
                         },
                         "Shoulder_Jnt": {
                             "tz": 1.3656,
                             "parent": "Spine6_Jnt",
                             "ty": 0.0043,
                             "jox": 7.6931,
-                            "radius": 0.5,
-                            "nodeType": "joint"
+                            "radius": 0.5
                         },
                         "Humerus_Lft_Jnt": {
                             "tz": 3.9995,
                             "tx": 0.1987,
                             "parent": "Scapula_Lft_Jnt",
                             "jox": 87.8821,
-                            "radius": 0.5,
-                            "nodeType": "joint"
+                            "radius": 0.5
                         },
                         "Tail7_Jnt": {
                             "radius": 0.5,
                             "tz": -0.75,
-                            "nodeType": "joint",
                             "parent": "Tail6_Jnt"
                         },
                         "EarTip_Rgt_Jnt": {
-                            "nodeType": "joint",
                             "radius": 0.5,
                             "parent": "Ear_Rgt_Jnt",
                             "ty": -0.85
@@ -7568,17 +7384,14 @@ class Char( Rig ):
                             "jox": -30.1682,
                             "radius": 0.5,
                             "tz": -3.0313,
-                            "nodeType": "joint",
                             "parent": "CannonFront_Rgt_Jnt"
                         },
                         "Spine3_Jnt": {
                             "radius": 0.5,
                             "tz": 1.2891,
-                            "nodeType": "joint",
                             "parent": "Spine2_Jnt"
                         },
                         "EarTip_Lft_Jnt": {
-                            "nodeType": "joint",
                             "radius": 0.5,
                             "parent": "Ear_Lft_Jnt",
                             "ty": 0.85
@@ -7586,55 +7399,46 @@ class Char( Rig ):
                         "Spine6_Jnt": {
                             "radius": 0.5,
                             "tz": -0.75,
-                            "nodeType": "joint",
                             "parent": "Spine5_Jnt"
                         },
                         "Tail8_Jnt": {
                             "radius": 0.5,
                             "tz": -0.75,
-                            "nodeType": "joint",
                             "parent": "Tail7_Jnt"
                         },
                         "Tail9_Jnt": {
                             "tz": -0.75,
                             "parent": "Tail8_Jnt",
-                            "radius": 0.5,
-                            "nodeType": "joint"
+                            "radius": 0.5
                         },
                         "Tail4_Jnt": {
                             "radius": 0.5,
                             "tz": -0.75,
-                            "nodeType": "joint",
                             "parent": "Tail3_Jnt"
                         },
                         "Tail5_Jnt": {
                             "radius": 0.5,
                             "tz": -0.75,
-                            "nodeType": "joint",
                             "parent": "Tail4_Jnt"
                         },
                         "Tail6_Jnt": {
                             "radius": 0.5,
                             "tz": -0.75,
-                            "nodeType": "joint",
                             "parent": "Tail5_Jnt"
                         },
                         "Tail3_Jnt": {
                             "radius": 0.5,
                             "tz": -0.75,
-                            "nodeType": "joint",
                             "parent": "Tail2_Jnt"
                         },
                         "Tail1_Jnt": {
                             "tz": -1.0,
                             "parent": "Pelvis_Jnt",
-                            "radius": 0.5,
-                            "nodeType": "joint"
+                            "radius": 0.5
                         },
                         "Tail2_Jnt": {
                             "tz": -0.75,
                             "radius": 0.5,
-                            "nodeType": "joint",
                             "parent": "Tail1_Jnt"
                         },
                         "Femur_Lft_Jnt": {
@@ -7645,8 +7449,7 @@ class Char( Rig ):
                             "jox": 49.5564,
                             "joy": -2.0598,
                             "joz": -1.7875,
-                            "radius": 0.5,
-                            "nodeType": "joint"
+                            "radius": 0.5
                         }
                     }
                 }
@@ -7690,9 +7493,18 @@ class Char( Rig ):
 
             displayAttrs = [ 'show_Joints', 'show_Rig', 'show_Guides', 'display_Joint', 'display_Geo' ]
 
+            # The display attributes are enums, read them straight from the plugs
+            charObj = self.get_mobject( charRoot )
+
+            if charObj is None:
+                mc.warning( 'aniMeta: Can not find character ' + str( charRoot ) )
+                return False
+
+            charFn = om.MFnDependencyNode( charObj )
+
             for displayAttr in displayAttrs:
                 try:
-                    rigDisplay[ displayAttr ] = mc.getAttr( charRoot + '.' + displayAttr )
+                    rigDisplay[ displayAttr ] = charFn.findPlug( displayAttr, False ).asInt()
                 except:
                     mc.warning( 'Can not get attribute ', charRoot + '.' + displayAttr )
                     pass
@@ -7722,32 +7534,31 @@ class Char( Rig ):
                     handleDict = { }
 
                     if handles:
+                        nodeIndex = self.get_node_index( charRoot )
+
                         for handle in handles:
 
-                            handle = self.find_node( charRoot, handle )
+                            handle = self.find_node( charRoot, handle, nodeIndex )
 
                             handleShort = self.short_name( handle )
 
                             handleDict[ handleShort ] = self.get_attributes( handle, getAnimKeys = False )
 
-                            for attr in handleDict[ handleShort ].keys():
-
-                                if handleDict[ handleShort ][ attr ][ 'input' ] == 'animCurve':
+                            for attr, attrData in handleDict[ handleShort ].items():
 
-                                    src = handleDict[ handleShort ][ attr ][ 'animCurve' ] + '.output'
-                                    if not mc.objExists( src ):
-                                        mc.warning( 'aniMeta: source does not exist', src )
+                                if attrData[ 'input' ] == 'animCurve':
 
+                                    src = attrData[ 'animCurve' ] + '.output'
                                     dst = handle + '.' + attr
-                                    if not mc.objExists( dst ):
-                                        mc.warning( 'aniMeta: dest does not exist', dst )
-
-                                    if mc.isConnected( src, dst ):
-                                        try:
-                                            mc.disconnectAttr( src, dst )
-                                        except:
-                                            pass
-                                    else:
+
+                                    # Only look into why it failed if the disconnect fails
+                                    try:
+                                        mc.disconnectAttr( src, dst )
+                                    except:
+                                        if not mc.objExists( src ):
+                                            mc.warning( 'aniMeta: source does not exist', src )
+                                        if not mc.objExists( dst ):
+                                            mc.warning( 'aniMeta: dest does not exist', dst )
                                         mc.warning( 'Not connected:', src, dst )
                     metaData[ 'GuidePose' ] = handleDict
 
@@ -7756,7 +7567,7 @@ class Char( Rig ):
                     # delete control rig
                     self.delete_controls( charRoot )
 
-                    if type == kBiped or type == kBipedUE:
+                    if type in kBipedTypes:
                         self.delete_mocap( charRoot )
 
                     # create guides
@@ -7787,12 +7598,12 @@ class Char( Rig ):
                     self.delete_body_guides( charRoot, deleteOnlyConstraints=True )
 
                     # create control rig
-                    if type == kBiped or type == kBipedUE:
+                    if type in kBipedTypes:
                         biped = Biped()
-                        biped.build_control_rig( charRoot )
+                        biped.build_control_rig( charRoot, guidesDeleted=True )
                         biped.build_mocap( charRoot, type )
 
-                    if type == kQuadruped:
+                    elif type == kQuadruped:
                         self.rig_control_quadruped_create()
 
                     om.MGlobal.displayInfo( 'aniMeta: ' + charRoot + ' is now in control rig mode.' )
@@ -7805,37 +7616,51 @@ class Char( Rig ):
                             except:
                                 pass
 
-                    metaData = self.get_metaData( charRoot )
-
+                    # The control rig build only updates the RigState, the GuidePose we read earlier is still valid
                     if 'GuidePose' in metaData:
                         pose = metaData[ 'GuidePose' ]
 
-                        for handle in pose.keys():
-                            for attr in pose[ handle ].keys():
-                                if pose[ handle ][ attr ][ 'input' ] == 'static':
-                                    if pose[ handle ][ attr ][ 'dataType' ] == 'enum':
+                        for handle, attrs in pose.items():
+
+                            # Set translate and rotate with one command each, if that fails,
+                            # i.e. because a channel is locked, the single attributes are set below
+                            doneAttrs = [ ]
+                            for compound in [ 'translate', 'rotate' ]:
+                                channels = [ compound + 'X', compound + 'Y', compound + 'Z' ]
+                                values = [ ]
+                                for channel in channels:
+                                    if channel in attrs and attrs[ channel ][ 'input' ] == 'static':
+                                        values.append( attrs[ channel ][ 'value' ] )
+                                if len( values ) == 3:
+                                    try:
+                                        mc.setAttr( handle + '.' + compound, values[ 0 ], values[ 1 ], values[ 2 ] )
+                                        doneAttrs.extend( channels )
+                                    except:
                                         pass
-                                    else:
-                                        self.set_attr( handle, attr, pose[ handle ][ attr ][ 'value' ] )
 
-                                if pose[ handle ][ attr ][ 'input' ] == 'animCurve':
+                            for attr, attrData in attrs.items():
+                                if attrData[ 'input' ] == 'static':
+                                    if attrData[ 'dataType' ] == 'enum':
+                                        pass
+                                    elif attr not in doneAttrs:
+                                        self.set_attr( handle, attr, attrData[ 'value' ] )
 
-                                    src = pose[ handle ][ attr ][ 'animCurve' ] + '.output'
-                                    if not mc.objExists( src ):
-                                        mc.warning( 'aniMeta: source does not exist', src )
+                                if attrData[ 'input' ] == 'animCurve':
 
+                                    src = attrData[ 'animCurve' ] + '.output'
                                     dst = handle + '.' + attr
-                                    if not mc.objExists( dst ):
-                                        mc.warning( 'aniMeta: dest does not exist', dst )
 
-                                    if mc.objExists( src ) and mc.objExists( dst ):
+                                    # isConnected fails on missing plugs, only check for those on failure
+                                    try:
                                         if not mc.isConnected( src, dst ):
-                                            try:
-                                                mc.connectAttr( src, dst, f = True )
-                                            except:
-                                                pass
+                                            mc.connectAttr( src, dst, f = True )
                                         else:
                                             mc.warning( 'Not connected:', src, dst )
+                                    except:
+                                        if not mc.objExists( src ):
+                                            mc.warning( 'aniMeta: source does not exist', src )
+                                        if not mc.objExists( dst ):
+                                            mc.warning( 'aniMeta: dest does not exist', dst )
 
 
                     mc.undoInfo( closeChunk = True )
@@ -7862,7 +7687,20 @@ class Biped( Char ):
 
         self.DEBUG = False
 
-    def build_control_rig( self, *args ):
+    def build_control_rig( self, *args, **kwargs ):
+        '''
+        Builds the control rig with the viewport refresh suspended.
+        The previous refresh state is restored afterwards, even if the build fails.
+        '''
+        # Don't redraw the viewport for every node the build creates
+        refreshSuspended = mc.refresh( q=True, suspend=True )
+        mc.refresh( suspend=True )
+        try:
+            return self.build_control_rig_nodes( *args, **kwargs )
+        finally:
+            mc.refresh( suspend=refreshSuspended )
+
+    def build_control_rig_nodes( self, *args, **kwargs ):
 
         handleDict = {}
         controls   = {}          # Store the DAG Paths of created controls
@@ -7885,6 +7723,11 @@ class Biped( Char ):
             mc.warning('aniMeta: No Valid character specified. Aborting rig build.')
             return False
 
+        # The caller may have deleted the guide constraints already, i.e. toggle_guides
+        guidesDeleted = False
+        if 'guidesDeleted' in kwargs:
+            guidesDeleted = kwargs['guidesDeleted']
+
         ctrlsDict = {}
         ctrlsDict['character']      = rootNode
         ctrlsDict['globalScale']    = True
@@ -7918,17 +7761,10 @@ class Biped( Char ):
 
             self.set_metaData( rootNode, rootData )
 
-            offset = om.MEulerRotation(math.radians(180.0), 0.0, 0.0, 0).asMatrix()
-
-            def getParent(obj, index):
-                if obj is not None:
-                    if len (obj) > 0 and index < len(obj)-1:
-                        return obj[index]
-                return None
-
             rig_grp = self.find_node(rootNode,'Rig_Grp')
 
-            global_scale = mc.getAttr( rootNode + '.globalScale' )
+            global_scale_plug = rootNode + '.globalScale'
+            global_scale = mc.getAttr( global_scale_plug )
 
             prx_grp = self.find_node( rootNode, 'Proxy_Grp' )
             if prx_grp is None:
@@ -7951,10 +7787,11 @@ class Biped( Char ):
             ########################################################################################################
             #
             # Delete Guides
-            self.delete_body_guides( rootNode, deleteOnlyConstraints=True )
+            if not guidesDeleted:
+                self.delete_body_guides( rootNode, deleteOnlyConstraints=True )
 
             # Delete SymConstraints in Proxy Grp
-            nodes = mc.listRelatives( self.find_node(rootNode, 'Proxy_Grp'))
+            nodes = mc.listRelatives( prx_grp.fullPathName() )
             if nodes is not None:
                 for node in nodes:
                     con = mc.listConnections( node + '.t', s=True, d=False)
@@ -7971,30 +7808,33 @@ class Biped( Char ):
 
             joints  = {}
 
+            # The joints are looked up by name a lot, list the hierarchy only once
+            nodeIndex = self.get_node_index( rootNode )
+
             if type == kBiped:
                 leg_preferred_angle = [ 45,0,0 ]
                 arm_preferred_angle = [ 0,-45,0 ]
 
-                joints['Root_Ctr']    = self.get_path( self.find_node( rootNode, 'Root_Jnt' ))
-                joints['Hips_Ctr']    = self.get_path( self.find_node( rootNode, 'Hips_Jnt' ))
-                joints['Spine1_Ctr']  = self.get_path( self.find_node( rootNode, 'Spine1_Jnt' ))
-                joints['Spine2_Ctr']  = self.get_path( self.find_node( rootNode, 'Spine2_Jnt' ))
-                joints['Spine3_Ctr']  = self.get_path( self.find_node( rootNode, 'Spine3_Jnt' ))
-                joints['Chest_Ctr']   = self.get_path( self.find_node( rootNode, 'Chest_Jnt' ))
-                joints['Neck_Ctr']    = self.get_path( self.find_node( rootNode, 'Neck_Jnt' ))
-                joints['Head_Ctr']    = self.get_path( self.find_node( rootNode, 'Head_Jnt' ))
-                joints['Jaw_Ctr']     = self.get_path( self.find_node( rootNode, 'Jaw_Jnt' ))
+                joints['Root_Ctr']    = self.get_path( self.find_node( rootNode, 'Root_Jnt', nodeIndex ))
+                joints['Hips_Ctr']    = self.get_path( self.find_node( rootNode, 'Hips_Jnt', nodeIndex ))
+                joints['Spine1_Ctr']  = self.get_path( self.find_node( rootNode, 'Spine1_Jnt', nodeIndex ))
+                joints['Spine2_Ctr']  = self.get_path( self.find_node( rootNode, 'Spine2_Jnt', nodeIndex ))
+                joints['Spine3_Ctr']  = self.get_path( self.find_node( rootNode, 'Spine3_Jnt', nodeIndex ))
+                joints['Chest_Ctr']   = self.get_path( self.find_node( rootNode, 'Chest_Jnt', nodeIndex ))
+                joints['Neck_Ctr']    = self.get_path( self.find_node( rootNode, 'Neck_Jnt', nodeIndex ))
+                joints['Head_Ctr']    = self.get_path( self.find_node( rootNode, 'Head_Jnt', nodeIndex ))
+                joints['Jaw_Ctr']     = self.get_path( self.find_node( rootNode, 'Jaw_Jnt', nodeIndex ))
 
                 for i in range( 2 ):
 
-                    joints[ 'LegUp_'     + SIDES[i] ] = self.get_path( self.find_node( rootNode, 'LegUp_'+SIDES[i]+'_Jnt' ))
-                    joints[ 'LegLo_'     + SIDES[i] ] = self.get_path( self.find_node( rootNode, 'LegLo_'+SIDES[i]+'_Jnt' ))
-                    joints[ 'Foot_'      + SIDES[i] ] = self.get_path( self.find_node( rootNode, 'Foot_'+SIDES[i]+'_Jnt' ))
-                    joints[ 'Toes_'      + SIDES[i] ] = self.get_path( self.find_node( rootNode, 'Toes_'+SIDES[i]+'_Jnt' ))
-                    joints[ 'ArmUp_'     + SIDES[i] ] = self.get_path( self.find_node( rootNode, 'ArmUp_'+SIDES[i]+'_Jnt' ))
-                    joints[ 'ArmLo_'     + SIDES[i] ] = self.get_path( self.find_node( rootNode, 'ArmLo_'+SIDES[i]+'_Jnt' ))
-                    joints[ 'Hand_'      + SIDES[i] ] = self.get_path( self.find_node( rootNode, 'Hand_'+SIDES[i]+'_Jnt' ))
-                    joints[ 'Clavicle_'  + SIDES[i] ] = self.get_path( self.find_node( rootNode, 'Clavicle_'+SIDES[i]+'_Jnt' ))
+                    joints[ 'LegUp_'     + SIDES[i] ] = self.get_path( self.find_node( rootNode, 'LegUp_'+SIDES[i]+'_Jnt', nodeIndex ))
+                    joints[ 'LegLo_'     + SIDES[i] ] = self.get_path( self.find_node( rootNode, 'LegLo_'+SIDES[i]+'_Jnt', nodeIndex ))
+                    joints[ 'Foot_'      + SIDES[i] ] = self.get_path( self.find_node( rootNode, 'Foot_'+SIDES[i]+'_Jnt', nodeIndex ))
+                    joints[ 'Toes_'      + SIDES[i] ] = self.get_path( self.find_node( rootNode, 'Toes_'+SIDES[i]+'_Jnt', nodeIndex ))
+                    joints[ 'ArmUp_'     + SIDES[i] ] = self.get_path( self.find_node( rootNode, 'ArmUp_'+SIDES[i]+'_Jnt', nodeIndex ))
+                    joints[ 'ArmLo_'     + SIDES[i] ] = self.get_path( self.find_node( rootNode, 'ArmLo_'+SIDES[i]+'_Jnt', nodeIndex ))
+                    joints[ 'Hand_'      + SIDES[i] ] = self.get_path( self.find_node( rootNode, 'Hand_'+SIDES[i]+'_Jnt', nodeIndex ))
+                    joints[ 'Clavicle_'  + SIDES[i] ] = self.get_path( self.find_node( rootNode, 'Clavicle_'+SIDES[i]+'_Jnt', nodeIndex ))
 
             if type == kBipedUE:
 
@@ -8004,29 +7844,27 @@ class Biped( Char ):
                 leg_preferred_angle = [ 0,0,-45 ]
                 arm_preferred_angle = [ 0,-45,0 ]
 
-                joints['Root_Ctr']    = self.get_path( self.find_node( rootNode, 'root' ))
-                joints['Hips_Ctr']    = self.get_path( self.find_node( rootNode, 'pelvis' ))
-                joints['Spine1_Ctr']  = self.get_path( self.find_node( rootNode, 'spine_01' ))
-                joints['Spine2_Ctr']  = self.get_path( self.find_node( rootNode, 'spine_02' ))
-                joints['Spine3_Ctr']  = self.get_path( self.find_node( rootNode, 'spine_03' ))
-                joints['Spine4_Ctr']  = self.get_path( self.find_node( rootNode, 'spine_04' ))
-                joints['Spine5_Ctr']  = self.get_path( self.find_node( rootNode, 'spine_05' ))
-                joints['Chest_Ctr']   = None
-                joints['Neck_Ctr']    = self.get_path( self.find_node( rootNode, 'neck_01' ))
-                joints['Neck2_Ctr']   = self.get_path( self.find_node( rootNode, 'neck_02' ))
-                joints['Head_Ctr']    = self.get_path( self.find_node( rootNode, 'head' ))
-                joints['Jaw_Ctr']     = None
+                joints['Root_Ctr']    = self.get_path( self.find_node( rootNode, 'root', nodeIndex ))
+                joints['Hips_Ctr']    = self.get_path( self.find_node( rootNode, 'pelvis', nodeIndex ))
+                joints['Spine1_Ctr']  = self.get_path( self.find_node( rootNode, 'spine_01', nodeIndex ))
+                joints['Spine2_Ctr']  = self.get_path( self.find_node( rootNode, 'spine_02', nodeIndex ))
+                joints['Spine3_Ctr']  = self.get_path( self.find_node( rootNode, 'spine_03', nodeIndex ))
+                joints['Spine4_Ctr']  = self.get_path( self.find_node( rootNode, 'spine_04', nodeIndex ))
+                joints['Spine5_Ctr']  = self.get_path( self.find_node( rootNode, 'spine_05', nodeIndex ))
+                joints['Neck_Ctr']    = self.get_path( self.find_node( rootNode, 'neck_01', nodeIndex ))
+                joints['Neck2_Ctr']   = self.get_path( self.find_node( rootNode, 'neck_02', nodeIndex ))
+                joints['Head_Ctr']    = self.get_path( self.find_node( rootNode, 'head', nodeIndex ))
 
                 for i in range( 2 ):
 
-                    joints[ 'LegUp_'     + SIDES[i] ] = self.get_path( self.find_node( rootNode, 'thigh_'    +sides[i] ))
-                    joints[ 'LegLo_'     + SIDES[i] ] = self.get_path( self.find_node( rootNode, 'calf_'     +sides[i] ))
-                    joints[ 'Foot_'      + SIDES[i] ] = self.get_path( self.find_node( rootNode, 'foot_'     +sides[i] ))
-                    joints[ 'Toes_'      + SIDES[i] ] = self.get_path( self.find_node( rootNode, 'ball_'     +sides[i] ))
-                    joints[ 'ArmUp_'     + SIDES[i] ] = self.get_path( self.find_node( rootNode, 'upperarm_' +sides[i] ))
-                    joints[ 'ArmLo_'     + SIDES[i] ] = self.get_path( self.find_node( rootNode, 'lowerarm_' +sides[i] ))
-                    joints[ 'Hand_'      + SIDES[i] ] = self.get_path( self.find_node( rootNode, 'hand_'     +sides[i] ))
-                    joints[ 'Clavicle_'  + SIDES[i] ] = self.get_path( self.find_node( rootNode, 'clavicle_' +sides[i] ))
+                    joints[ 'LegUp_'     + SIDES[i] ] = self.get_path( self.find_node( rootNode, 'thigh_'    +sides[i], nodeIndex ))
+                    joints[ 'LegLo_'     + SIDES[i] ] = self.get_path( self.find_node( rootNode, 'calf_'     +sides[i], nodeIndex ))
+                    joints[ 'Foot_'      + SIDES[i] ] = self.get_path( self.find_node( rootNode, 'foot_'     +sides[i], nodeIndex ))
+                    joints[ 'Toes_'      + SIDES[i] ] = self.get_path( self.find_node( rootNode, 'ball_'     +sides[i], nodeIndex ))
+                    joints[ 'ArmUp_'     + SIDES[i] ] = self.get_path( self.find_node( rootNode, 'upperarm_' +sides[i], nodeIndex ))
+                    joints[ 'ArmLo_'     + SIDES[i] ] = self.get_path( self.find_node( rootNode, 'lowerarm_' +sides[i], nodeIndex ))
+                    joints[ 'Hand_'      + SIDES[i] ] = self.get_path( self.find_node( rootNode, 'hand_'     +sides[i], nodeIndex ))
+                    joints[ 'Clavicle_'  + SIDES[i] ] = self.get_path( self.find_node( rootNode, 'clavicle_' +sides[i], nodeIndex ))
 
             # Joint Mapping
             #
@@ -8038,359 +7876,305 @@ class Biped( Char ):
             if type ==kBipedUE:
                 hand_space_switch_list[2] = 'Spine5_Ctr_Ctrl'
 
+            # create_handle parent constrains the constraintNode with maintained offset unless told otherwise
             handleDict[ 'Torso_Ctr_Ctrl' ] = {
                 'name': 'Torso_Ctr_Ctrl',
                 'parent': 'Main_Ctr_Ctrl',
                 'matchTransform': 'Hips_Guide',
-                'size': [ 30, 6, 6 ]
+                'size': ( 30, 6, 6 )
             }
             handleDict[ 'Hips_Ctr_Ctrl' ] = {
                 'name': 'Hips_Ctr_Ctrl',
                 'parent': 'Torso_Ctr_Ctrl',
                 'matchTransform': 'Spine1_Guide',
-                'size': [ 20, 2, 20 ],
-                'constraint': self.kParent,
-                'constraintNode': joints['Hips_Ctr'],
-                'maintainOffset': True
+                'size': ( 20, 2, 20 ),
+                'constraintNode': joints['Hips_Ctr']
             }
             handleDict[ 'Spine1_Ctr_Ctrl' ] = {
                 'name': 'Spine1_Ctr_Ctrl',
                 'parent': 'Torso_Ctr_Ctrl',
                 'matchTransform': 'Spine1_Guide',
-                'size': [ 20, 2, 2 ],
-                'constraint': self.kParent,
-                'constraintNode': joints['Spine1_Ctr'] ,
-                'maintainOffset': True
+                'size': ( 20, 2, 2 ),
+                'constraintNode': joints['Spine1_Ctr']
             }
             handleDict[ 'Spine2_Ctr_Ctrl' ] = {
                 'name': 'Spine2_Ctr_Ctrl',
                 'parent': 'Spine1_Ctr_Ctrl',
                 'matchTransform': 'Spine2_Guide',
-                'size': [ 20, 2, 2 ],
-                'constraint': self.kParent,
-                'constraintNode':  joints['Spine2_Ctr'],
-                'maintainOffset': True
+                'size': ( 20, 2, 2 ),
+                'constraintNode':  joints['Spine2_Ctr']
             }
             handleDict[ 'Spine3_Ctr_Ctrl' ] = {
                 'name': 'Spine3_Ctr_Ctrl',
                 'parent': 'Spine2_Ctr_Ctrl',
                 'matchTransform': 'Spine3_Guide',
-                'size': [ 20, 2, 2 ],
-                'constraint': self.kParent,
-                'constraintNode':  joints['Spine3_Ctr'] ,
-                'maintainOffset': True
+                'size': ( 20, 2, 2 ),
+                'constraintNode':  joints['Spine3_Ctr']
             }
             if type == kBiped:
                 handleDict[ 'Chest_Ctr_Ctrl' ] = {
                     'name': 'Chest_Ctr_Ctrl',
                     'parent': 'Spine3_Ctr_Ctrl',
                     'matchTransform': 'Chest_Guide',
-                    'size': [ 25, 4, 4 ],
-                    'constraint': self.kParent,
-                    'constraintNode':  joints['Chest_Ctr'] ,
-                    'maintainOffset': True
+                    'size': ( 25, 4, 4 ),
+                    'constraintNode':  joints['Chest_Ctr']
                 }
                 handleDict[ 'Jaw_Ctr_Ctrl' ] = {
                     'name': 'Jaw_Ctr_Ctrl',
                     'parent': 'Head_Ctr_Ctrl',
                     'matchTransform': 'Jaw_Guide',
-                    'size': [ 25, 4, 4 ],
-                    'constraint': self.kParent,
-                    'constraintNode':  joints['Jaw_Ctr'] ,
-                    'maintainOffset': True
+                    'size': ( 25, 4, 4 ),
+                    'constraintNode':  joints['Jaw_Ctr']
                 }
                 handleDict[ 'Neck_Ctr_Ctrl' ] = {
                     'name': 'Neck_Ctr_Ctrl',
                     'parent': 'Chest_Ctr_Ctrl',
                     'matchTransform': 'Neck_Guide',
-                    'size': [ 20, 2, 2 ],
-                    'constraint': self.kParent,
-                    'constraintNode':joints['Neck_Ctr'],
-                    'maintainOffset': True
+                    'size': ( 20, 2, 2 ),
+                    'constraintNode':joints['Neck_Ctr']
                 }
 
                 handleDict[ 'Head_Ctr_Ctrl' ] = {
                     'name': 'Head_Ctr_Ctrl',
                     'parent': 'Neck_Ctr_Ctrl',
                     'matchTransform': 'Head_Guide',
-                    'size': [ 20, 2, 2 ],
-                    'constraint': self.kParent,
-                    'constraintNode':joints['Head_Ctr'],
-                    'maintainOffset': True
+                    'size': ( 20, 2, 2 ),
+                    'constraintNode':joints['Head_Ctr']
                 }
             if type == kBipedUE:
                 handleDict['Spine4_Ctr_Ctrl'] = {
                     'name': 'Spine4_Ctr_Ctrl',
                     'parent': 'Spine3_Ctr_Ctrl',
                     'matchTransform': 'Spine4_Guide',
-                    'size': [20, 2, 2],
-                    'constraint': self.kParent,
-                    'constraintNode': joints['Spine4_Ctr'],
-                    'maintainOffset': True
+                    'size': (20, 2, 2),
+                    'constraintNode': joints['Spine4_Ctr']
                 }
                 handleDict['Spine5_Ctr_Ctrl'] = {
                     'name': 'Spine5_Ctr_Ctrl',
                     'parent': 'Spine4_Ctr_Ctrl',
                     'matchTransform': 'Spine5_Guide',
-                    'size': [20, 2, 2],
-                    'constraint': self.kParent,
-                    'constraintNode': joints['Spine5_Ctr'],
-                    'maintainOffset': True
+                    'size': (20, 2, 2),
+                    'constraintNode': joints['Spine5_Ctr']
                 }
 
                 handleDict[ 'Neck1_Ctr_Ctrl' ] = {
                     'name': 'Neck1_Ctr_Ctrl',
                     'parent': 'Spine5_Ctr_Ctrl',
                     'matchTransform': 'Neck1_Guide',
-                    'size': [ 20, 2, 2 ],
-                    'constraint': self.kParent,
-                    'constraintNode':joints['Neck_Ctr'],
-                    'maintainOffset': True
+                    'size': ( 20, 2, 2 ),
+                    'constraintNode':joints['Neck_Ctr']
                 }
 
                 handleDict['Neck2_Ctr_Ctrl'] = {
                     'name': 'Neck2_Ctr_Ctrl',
                     'parent': 'Neck1_Ctr_Ctrl',
                     'matchTransform': 'Neck2_Guide',
-                    'size': [20, 2, 2],
-                    'constraint': self.kParent,
-                    'constraintNode': joints['Neck2_Ctr'],
-                    'maintainOffset': True
+                    'size': (20, 2, 2),
+                    'constraintNode': joints['Neck2_Ctr']
                 }
 
                 handleDict[ 'Head_Ctr_Ctrl' ] = {
                     'name': 'Head_Ctr_Ctrl',
                     'parent': 'Neck2_Ctr_Ctrl',
                     'matchTransform': 'Head_Guide',
-                    'size': [ 20, 2, 2 ],
-                    'constraint': self.kParent,
-                    'constraintNode':joints['Head_Ctr'],
-                    'maintainOffset': True
+                    'size': ( 20, 2, 2 ),
+                    'constraintNode':joints['Head_Ctr']
                 }
 
             handleDict[ 'Root_Ctr_Ctrl' ] = {
                 'name': 'Root_Ctr_Ctrl',
                 'parent': 'Main_Ctr_Ctrl',
                 'matchTransform': 'root',
-                'size': [ 5, 5, 5 ],
-                'constraint': self.kParent,
-                'constraintNode':joints['Root_Ctr'],
-                'maintainOffset': True
+                'size': ( 5, 5, 5 ),
+                'constraintNode':joints['Root_Ctr']
             }
+            # The right foot control is flipped
+            foot_offset_matrix = Transform().create_matrix( rotate=om.MEulerRotation( math.radians(180),0,0 ))
+
             for i in range( 2 ):
 
-                handleDict[ 'Foot_IK_' + SIDES[ i ] + '_Ctrl' ] = {
-                    'name': 'Foot_IK_' + SIDES[ i ] + '_Ctrl',
+                SIDE  = SIDES[ i ]
+                side  = sides[ i ]
+                color = colors[ i ]
+
+                handleDict[ 'Foot_IK_' + SIDE + '_Ctrl' ] = {
+                    'name': 'Foot_IK_' + SIDE + '_Ctrl',
                     'parent': 'Main_Ctr_Ctrl',
-                    'matchTransform': 'Foot_' + SIDES[ i ] + '_Guide',
-                    'size': [ 5, 5, 5 ],
-                    'color': colors[ i ]
+                    'matchTransform': 'Foot_' + SIDE + '_Guide',
+                    'size': ( 5, 5, 5 ),
+                    'color': color
                 }
                 if i == 1:
-                    offset_matrix = Transform().create_matrix( rotate=om.MEulerRotation( math.radians(180),0,0 ))
-                    handleDict[ 'Foot_IK_' + SIDES[ i ] + '_Ctrl' ]['offsetMatrix'] = offset_matrix
-
-                handleDict[ 'Heel_IK_' + SIDES[ i ] + '_Ctrl' ] = {
-                    'name': 'Heel_IK_' + SIDES[ i ] + '_Ctrl',
-                    'parent': 'Foot_IK_' + SIDES[ i ] + '_Ctrl',
-                    'matchTransform': 'Heel_' + SIDES[ i ] + '_Guide',
-                    'size': [ 12, 2, 2 ],
+                    handleDict[ 'Foot_IK_' + SIDE + '_Ctrl' ]['offsetMatrix'] = foot_offset_matrix
+
+                handleDict[ 'Heel_IK_' + SIDE + '_Ctrl' ] = {
+                    'name': 'Heel_IK_' + SIDE + '_Ctrl',
+                    'parent': 'Foot_IK_' + SIDE + '_Ctrl',
+                    'matchTransform': 'Heel_' + SIDE + '_Guide',
+                    'size': ( 12, 2, 2 ),
                     'rotateOrder': kXYZ,
-                    'color': colors[ i ]
+                    'color': color
                 }
-                handleDict[ 'ToesTip_IK_' + SIDES[ i ] + '_Ctrl' ] = {
-                    'name': 'ToesTip_IK_' + SIDES[ i ] + '_Ctrl',
-                    'parent': 'Heel_IK_' + SIDES[ i ] + '_Ctrl',
-                    'matchTransform': 'ToesTip_' + SIDES[ i ] + '_Guide',
-                    'size': [ 12, 2, 2 ],
+                handleDict[ 'ToesTip_IK_' + SIDE + '_Ctrl' ] = {
+                    'name': 'ToesTip_IK_' + SIDE + '_Ctrl',
+                    'parent': 'Heel_IK_' + SIDE + '_Ctrl',
+                    'matchTransform': 'ToesTip_' + SIDE + '_Guide',
+                    'size': ( 12, 2, 2 ),
                     'rotateOrder': kXYZ,
-                    'color': colors[ i ]
+                    'color': color
                 }
-                handleDict[ 'Toes_IK_' + SIDES[ i ] + '_Ctrl' ] = {
-                    'name': 'Toes_IK_' + SIDES[ i ] + '_Ctrl',
-                    'parent': 'ToesTip_IK_' + SIDES[ i ] + '_Ctrl',
-                    'matchTransform': 'Ball_' + SIDES[ i ] + '_Guide',
-                    'size': [ 12, 2, 2 ],
+                handleDict[ 'Toes_IK_' + SIDE + '_Ctrl' ] = {
+                    'name': 'Toes_IK_' + SIDE + '_Ctrl',
+                    'parent': 'ToesTip_IK_' + SIDE + '_Ctrl',
+                    'matchTransform': 'Ball_' + SIDE + '_Guide',
+                    'size': ( 12, 2, 2 ),
                     'rotateOrder': kXYZ,
-                    'color': colors[ i ]
+                    'color': color
                 }
-                handleDict[ 'FootLift_IK_' + SIDES[ i ] + '_Ctrl' ] = {
-                    'name': 'FootLift_IK_' + SIDES[ i ] + '_Ctrl',
-                    'parent': 'ToesTip_IK_' + SIDES[ i ] + '_Ctrl',
-                    'matchTransform': 'Ball_' + SIDES[ i ] + '_Guide',
-                    'size': [ 12, 2, 2 ],
+                handleDict[ 'FootLift_IK_' + SIDE + '_Ctrl' ] = {
+                    'name': 'FootLift_IK_' + SIDE + '_Ctrl',
+                    'parent': 'ToesTip_IK_' + SIDE + '_Ctrl',
+                    'matchTransform': 'Ball_' + SIDE + '_Guide',
+                    'size': ( 12, 2, 2 ),
                     'rotateOrder': kXYZ,
-                    'color': colors[ i ],
+                    'color': color,
                     'offset': (0, 3 * global_scale * multi[ i ], -6 * global_scale * multi[ i ]),
                     'rotate': (30, 0, 0)
                 }
-                handleDict[ 'LegPole_IK_' + SIDES[ i ] + '_Ctrl' ] = {
-                    'name': 'LegPole_IK_' + SIDES[ i ] + '_Ctrl',
-                    'parent': 'Foot_IK_' + SIDES[ i ] + '_Ctrl',
-                    'matchTransform': 'LegLo_' + SIDES[ i ] + '_Guide',
-                    'color': colors[ i ],
+                handleDict[ 'LegPole_IK_' + SIDE + '_Ctrl' ] = {
+                    'name': 'LegPole_IK_' + SIDE + '_Ctrl',
+                    'parent': 'Foot_IK_' + SIDE + '_Ctrl',
+                    'matchTransform': 'LegLo_' + SIDE + '_Guide',
+                    'color': color,
                     'shapeType': self.kCube,
-                    'size': [ 2, 2, 2 ]
+                    'size': ( 2, 2, 2 )
                 }
-                handleDict[ 'HipsUpVec_' + SIDES[ i ] + '_Ctrl' ] = {
-                    'name': 'HipsUpVec_' + SIDES[ i ] + '_Ctrl',
+                handleDict[ 'HipsUpVec_' + SIDE + '_Ctrl' ] = {
+                    'name': 'HipsUpVec_' + SIDE + '_Ctrl',
                     'parent': 'Hips_Ctr_Ctrl',
-                    'matchTransform': 'Hips_' + SIDES[ i ] + '_upVec_Guide',
+                    'matchTransform': 'Hips_' + SIDE + '_upVec_Guide',
                     'shapeType': self.kSphere,
                     'radius': 2,
                     'rotateOrder': kXYZ,
-                    'color': colors[ i ],
-                    'constraint': self.kParent,
-                    'constraintNode':'Hips_' + SIDES[ i ] + '_upVec',
+                    'color': color,
+                    'constraintNode':'Hips_' + SIDE + '_upVec',
                     'maintainOffset': False
                 }
-                handleDict[ 'Clavicle_' + SIDES[ i ] + '_Ctrl' ] = {
-                    'name': 'Clavicle_' + SIDES[ i ] + '_Ctrl',
+                handleDict[ 'Clavicle_' + SIDE + '_Ctrl' ] = {
+                    'name': 'Clavicle_' + SIDE + '_Ctrl',
                     'parent': 'Chest_Ctr_Ctrl',
-                    'matchTransform': 'Clavicle_' + SIDES[ i ] + '_Guide',
-                    'color': colors[ i ],
-                    'size': [ 2, 2, 20 ],
+                    'matchTransform': 'Clavicle_' + SIDE + '_Guide',
+                    'color': color,
+                    'size': ( 2, 2, 20 ),
                     'offset': (3 * global_scale * multi[ i ], 0, 0)
                 }
                 if type == kBipedUE:
-                    handleDict[ 'Clavicle_' + SIDES[ i ] + '_Ctrl' ][ 'parent' ] = 'Spine5_Ctr_Ctrl'
+                    handleDict[ 'Clavicle_' + SIDE + '_Ctrl' ][ 'parent' ] = 'Spine5_Ctr_Ctrl'
 
-                handleDict[ 'ShoulderUpVec_' + SIDES[ i ] + '_Ctrl' ] = {
-                    'name': 'ShoulderUpVec_' + SIDES[ i ] + '_Ctrl',
-                    'parent': 'Clavicle_' + SIDES[ i ] + '_Ctrl',
-                    'matchTransform': 'Shoulder_' + SIDES[ i ] + '_upVec_Guide',
-                    'color': colors[ i ],
+                handleDict[ 'ShoulderUpVec_' + SIDE + '_Ctrl' ] = {
+                    'name': 'ShoulderUpVec_' + SIDE + '_Ctrl',
+                    'parent': 'Clavicle_' + SIDE + '_Ctrl',
+                    'matchTransform': 'Shoulder_' + SIDE + '_upVec_Guide',
+                    'color': color,
                     'shapeType': self.kSphere,
                     'radius': 2,
-                    'constraint': self.kParent,
-                    'constraintNode':'Shoulder_' + SIDES[ i ] + '_upVec',
+                    'constraintNode':'Shoulder_' + SIDE + '_upVec',
                     'maintainOffset': False
                 }
-                handleDict[ 'ArmUp_FK_' + SIDES[ i ] + '_Ctrl' ] = {
-                    'name': 'ArmUp_FK_' + SIDES[ i ] + '_Ctrl',
-                    'parent': 'Clavicle_' + SIDES[ i ] + '_Ctrl',
-                    'matchTransform': 'ArmUp_' + SIDES[ i ] + '_Guide',
-                    'color': colors[ i ],
-                    'shapeType': self.kSphere,
-                    'radius': 6
-                }
-                handleDict[ 'ArmLo_FK_' + SIDES[ i ] + '_Ctrl' ] = {
-                    'name': 'ArmLo_FK_' + SIDES[ i ] + '_Ctrl',
-                    'parent': 'ArmUp_FK_' + SIDES[ i ] + '_Ctrl',
-                    'matchTransform': 'ArmLo_' + SIDES[ i ] + '_Guide',
-                    'color': colors[ i ],
-                    'shapeType': self.kSphere,
-                    'radius': 4
-                }
-                handleDict[ 'Hand_FK_' + SIDES[ i ] + '_Ctrl' ] = {
-                    'name': 'Hand_FK_' + SIDES[ i ] + '_Ctrl',
-                    'parent': 'ArmLo_FK_' + SIDES[ i ] + '_Ctrl',
-                    'matchTransform': 'Hand_' + SIDES[ i ] + '_Guide',
-                    'color': colors[ i ],
+                handleDict[ 'Hand_FK_' + SIDE + '_Ctrl' ] = {
+                    'name': 'Hand_FK_' + SIDE + '_Ctrl',
+                    'parent': 'ArmLo_FK_' + SIDE + '_Ctrl',
+                    'matchTransform': 'Hand_' + SIDE + '_Guide',
+                    'color': color,
                     'shapeType': self.kSphere,
                     'radius': 4,
-                    'constraint': self.kParent,
-                    'constraintNode':joints[ 'Hand_' + SIDES[i] ] ,
-                    'maintainOffset': True
+                    'constraintNode':joints[ 'Hand_' + SIDE ]
                 }
-                for j in range( len( fingers ) ):
+                for finger in fingers:
 
                     for k in range( 1, 5 ):
 
-                        if fingers[j] == 'Thumb' and k==4:
+                        if finger == 'Thumb' and k==4:
                             continue
 
+                        finger_name = finger + str( k ) + '_' + SIDE
+
                         finger_dict = {
-                            'name': fingers[ j ] + str( k ) + '_' + SIDES[ i ] + '_Ctrl',
-                            'matchTransform':  fingers[ j ] + str( k ) + '_' + SIDES[ i ] + '_Guide',
-                            'color':           colors[ i ],
+                            'name': finger_name + '_Ctrl',
+                            'matchTransform':  finger_name + '_Guide',
+                            'color':           color,
                             'shapeType':       self.kSphere,
                             'radius':          1.5,
-                            'constraintNode':  fingers[ j ] + str( k ) + '_' + SIDES[ i ] + '_Jnt',
-                            'maintainOffset':  True,
-                            'constraint':      self.kParent
+                            'constraintNode':  finger_name + '_Jnt'
                         }
                         if k == 1:
-                            if fingers[j] == 'Thumb':
-                                finger_dict[ 'parent' ] = 'Hand_FK_' + SIDES[ i ] + '_Ctrl'
+                            if finger == 'Thumb':
+                                finger_dict[ 'parent' ] = 'Hand_FK_' + SIDE + '_Ctrl'
                             else:
                                 if type == kBipedUE:
-                                    finger_dict['parent'] = fingers[ j ] +'Meta_' + SIDES[i] + '_Ctrl'
+                                    finger_dict['parent'] = finger +'Meta_' + SIDE + '_Ctrl'
                                 else: 
-                                    finger_dict[ 'parent' ] = 'Hand_FK_' + SIDES[ i ] + '_Ctrl'
+                                    finger_dict[ 'parent' ] = 'Hand_FK_' + SIDE + '_Ctrl'
                         else:
-                            finger_dict[ 'parent' ] = fingers[ j ] + str( k - 1 ) + '_' + SIDES[ i ] + '_Ctrl'
+                            finger_dict[ 'parent' ] = finger + str( k - 1 ) + '_' + SIDE + '_Ctrl'
 
                         if type == kBipedUE:
-                            name = fingers[ j ].lower() + '_0'+str( k ) + '_' + sides[i]
-                            finger_dict[ 'constraintNode' ] = self.get_path( self.find_node( rootNode, name ))
+                            name = finger.lower() + '_0'+str( k ) + '_' + side
+                            finger_dict[ 'constraintNode' ] = self.get_path( self.find_node( rootNode, name, nodeIndex ))
 
-                        handleDict[ fingers[ j ] + str( k ) + '_' + SIDES[ i ] + '_Ctrl' ] = finger_dict
+                        handleDict[ finger_dict[ 'name' ] ] = finger_dict
 
                 if type == kBipedUE:
 
-                    for j in range(4):
+                    # The thumb has no metacarpal control
+                    for finger in fingers[ :4 ]:
+                        finger_name = finger + 'Meta_' + SIDE
+
                         finger_dict = {
-                            'name': fingers[j] + 'Meta_' + SIDES[i] + '_Ctrl',
-                            'parent': 'Hand_FK_' + SIDES[ i ] + '_Ctrl',
-                            'matchTransform': fingers[j] + 'Meta_' + SIDES[i] + '_Guide',
-                            'color': colors[i],
+                            'name': finger_name + '_Ctrl',
+                            'parent': 'Hand_FK_' + SIDE + '_Ctrl',
+                            'matchTransform': finger_name + '_Guide',
+                            'color': color,
                             'shapeType': self.kSphere,
                             'radius': 1.5,
-                            'constraintNode': fingers[j].lower()  +  '_metacarpal_' + sides[i],
-                            'maintainOffset': True,
-                            'constraint': self.kParent
+                            'constraintNode': finger.lower()  +  '_metacarpal_' + side
                         }
-                        handleDict[ fingers[ j ] + 'Meta_' + SIDES[ i ] + '_Ctrl' ] = finger_dict
+                        handleDict[ finger_dict[ 'name' ] ] = finger_dict
 
 
-                handleDict[ 'LegUp_FK_' + SIDES[ i ] + '_Ctrl' ] = {
-                    'name': 'LegUp_FK_' + SIDES[ i ] + '_Ctrl',
-                    'parent': 'Hips_Ctr_Ctrl',
-                    'matchTransform': 'LegUp_' + SIDES[ i ] + '_Guide',
-                    'color': colors[ i ],
-                    'shapeType': self.kSphere,
-                    'radius': 4
-                }
-                handleDict[ 'LegLo_FK_' + SIDES[ i ] + '_Ctrl' ] = {
-                    'name': 'LegLo_FK_' + SIDES[ i ] + '_Ctrl',
-                    'parent': 'LegUp_FK_' + SIDES[ i ] + '_Ctrl',
-                    'matchTransform': 'LegLo_' + SIDES[ i ] + '_Guide',
-                    'color': colors[ i ],
-                    'shapeType': self.kSphere,
-                    'radius': 4
-                }
-                handleDict[ 'Foot_FK_' + SIDES[ i ] + '_Ctrl' ] = {
-                    'name': 'Foot_FK_' + SIDES[ i ] + '_Ctrl',
-                    'parent': 'LegLo_FK_' + SIDES[ i ] + '_Ctrl',
-                    'matchTransform': 'Foot_' + SIDES[ i ] + '_Guide',
-                    'color': colors[ i ],
-                    'shapeType': self.kSphere,
-                    'radius': 4
-                }
-                handleDict[ 'Toes_FK_' + SIDES[ i ] + '_Ctrl' ] = {
-                    'name': 'Toes_FK_' + SIDES[ i ] + '_Ctrl',
-                    'parent': 'Foot_FK_' + SIDES[ i ] + '_Ctrl',
-                    'matchTransform': 'Ball_' + SIDES[ i ] + '_Guide',
-                    'color': colors[ i ],
-                    'shapeType': self.kSphere,
-                    'radius': 4
-                }
-                handleDict[ 'Hand_IK_' + SIDES[ i ] + '_Ctrl' ] = {
-                    'name': 'Hand_IK_' + SIDES[ i ] + '_Ctrl',
+                # The FK controls only differ in name, parent, guide and radius
+                fkChain = [
+                    [ 'ArmUp', 'Clavicle_' + SIDE + '_Ctrl', 'ArmUp', 6 ],
+                    [ 'ArmLo', 'ArmUp_FK_' + SIDE + '_Ctrl', 'ArmLo', 4 ],
+                    [ 'LegUp', 'Hips_Ctr_Ctrl',                    'LegUp', 4 ],
+                    [ 'LegLo', 'LegUp_FK_' + SIDE + '_Ctrl', 'LegLo', 4 ],
+                    [ 'Foot',  'LegLo_FK_' + SIDE + '_Ctrl', 'Foot',  4 ],
+                    [ 'Toes',  'Foot_FK_' + SIDE + '_Ctrl',  'Ball',  4 ]
+                ]
+                for fkName, fkParent, fkGuide, fkRadius in fkChain:
+                    handleDict[ fkName + '_FK_' + SIDE + '_Ctrl' ] = {
+                        'name': fkName + '_FK_' + SIDE + '_Ctrl',
+                        'parent': fkParent,
+                        'matchTransform': fkGuide + '_' + SIDE + '_Guide',
+                        'color': color,
+                        'shapeType': self.kSphere,
+                        'radius': fkRadius
+                    }
+                handleDict[ 'Hand_IK_' + SIDE + '_Ctrl' ] = {
+                    'name': 'Hand_IK_' + SIDE + '_Ctrl',
                     'parent': 'Main_Ctr_Ctrl',
-                    'matchTransform': 'Hand_' + SIDES[ i ] + '_Guide',
-                    'color': colors[ i ],
+                    'matchTransform': 'Hand_' + SIDE + '_Guide',
+                    'color': color,
                     'shapeType': self.kCube,
-                    'size': [ 2, 10, 2 ]
+                    'size': ( 2, 10, 2 )
                 }
-                handleDict[ 'ArmPole_IK_' + SIDES[ i ] + '_Ctrl' ] = {
-                    'name': 'ArmPole_IK_' + SIDES[ i ] + '_Ctrl',
+                handleDict[ 'ArmPole_IK_' + SIDE + '_Ctrl' ] = {
+                    'name': 'ArmPole_IK_' + SIDE + '_Ctrl',
                     'parent': 'Main_Ctr_Ctrl',
-                    'matchTransform': 'ArmLo_' + SIDES[ i ] + '_Guide',
-                    'color': colors[ i ],
+                    'matchTransform': 'ArmLo_' + SIDE + '_Guide',
+                    'color': color,
                     'shapeType': self.kCube,
-                    'size': [ 2, 2, 2 ]
+                    'size': ( 2, 2, 2 )
                 }
 
 
@@ -8402,7 +8186,7 @@ class Biped( Char ):
                 print ('Build Centre')
 
             # Main
-            ctrlDict                   = copy.deepcopy( ctrlsDict )
+            ctrlDict                   = dict( ctrlsDict )
             ctrlDict['name']           = 'Main_Ctr_Ctrl'
             ctrlDict['shapeType']      = self.kPipe
             ctrlDict['thickness']      = 3*global_scale
@@ -8414,10 +8198,10 @@ class Biped( Char ):
             ctrlDict['createBlendGrp'] = True
             controls['Main_Ctr_Ctrl']  = self.create_handle( **ctrlDict )
 
-            # We have to parent this one manually
-            parent = mc.listRelatives( controls['Main_Ctr_Ctrl'].fullPathName(), p=True, pa=True )[0]
-            parent = mc.listRelatives( parent, p=True, pa=True )[0]
-            mc.parent( parent, rig_grp )
+            # We have to parent this one manually, the group is two levels up
+            parent = om.MFnDagNode( controls['Main_Ctr_Ctrl'].node() ).parent( 0 )
+            parent = om.MFnDagNode( om.MFnDagNode( parent ).parent( 0 ) )
+            mc.parent( parent.fullPathName(), rig_grp )
 
             if type == kBiped:
                 controlsList = [
@@ -8450,25 +8234,29 @@ class Biped( Char ):
 
 
 
-            for SIDE in [ 'Lft', 'Rgt' ]:
-                controlsList.append( 'Foot_IK_'+SIDE+'_Ctrl'       )
-                controlsList.append( 'Heel_IK_'+SIDE+'_Ctrl'       )
-                controlsList.append( 'ToesTip_IK_'+SIDE+'_Ctrl'    )
-                controlsList.append( 'Toes_IK_'+SIDE+'_Ctrl'       )
-                controlsList.append( 'FootLift_IK_'+SIDE+'_Ctrl'   )
-                controlsList.append( 'LegPole_IK_'+SIDE+'_Ctrl'    )
-                controlsList.append( 'HipsUpVec_'+SIDE+'_Ctrl'     )
-                controlsList.append( 'Clavicle_'+SIDE+'_Ctrl'      )
-                controlsList.append( 'ArmUp_FK_'+SIDE+'_Ctrl'      )
-                controlsList.append( 'ArmLo_FK_'+SIDE+'_Ctrl'      )
-                controlsList.append( 'Hand_FK_'+SIDE+'_Ctrl'       )
-                controlsList.append( 'ShoulderUpVec_'+SIDE+'_Ctrl' )
-                controlsList.append( 'LegUp_FK_'+SIDE+'_Ctrl'      )
-                controlsList.append( 'LegLo_FK_'+SIDE+'_Ctrl'      )
-                controlsList.append( 'Foot_FK_'+SIDE+'_Ctrl'       )
-                controlsList.append( 'Toes_FK_'+SIDE+'_Ctrl'       )
-                controlsList.append( 'Hand_IK_'+SIDE+'_Ctrl'       )
-                controlsList.append( 'ArmPole_IK_'+SIDE+'_Ctrl'    )
+            sideControls = [
+                'Foot_IK_',
+                'Heel_IK_',
+                'ToesTip_IK_',
+                'Toes_IK_',
+                'FootLift_IK_',
+                'LegPole_IK_',
+                'HipsUpVec_',
+                'Clavicle_',
+                'ArmUp_FK_',
+                'ArmLo_FK_',
+                'Hand_FK_',
+                'ShoulderUpVec_',
+                'LegUp_FK_',
+                'LegLo_FK_',
+                'Foot_FK_',
+                'Toes_FK_',
+                'Hand_IK_',
+                'ArmPole_IK_'
+            ]
+
+            for SIDE in SIDES:
+                controlsList.extend( [ ctrl + SIDE + '_Ctrl' for ctrl in sideControls ] )
 
                 if type == kBiped:
                     for finger in fingers:
@@ -8487,12 +8275,13 @@ class Biped( Char ):
 
             # Loop over dictionary to build the actual controls
             for control in controlsList:
-                if control in handleDict:
-                    # Create a copy of the standard dict
-                    ctrlDict                    = copy.deepcopy( ctrlsDict )
+                handleData = handleDict.get( control )
+                if handleData is not None:
+                    # Create a copy of the standard dict, its values are immutable so a shallow copy will do
+                    ctrlDict                    = dict( ctrlsDict )
 
                     # Update the copy with the specifics
-                    ctrlDict.update( handleDict[control] )
+                    ctrlDict.update( handleData )
 
                     # Build the control
                     controls[control]           = self.create_handle( **ctrlDict )
@@ -8533,10 +8322,9 @@ class Biped( Char ):
                 mc.scaleConstraint(  target,  node,  mo=True )
 
             if type == kBiped:
-                create_constraint( controls['Hips_Ctr_Ctrl'].fullPathName(), self.find_node( rootNode,  'Hips_Jnt' ) )
-                create_constraint( controls['Spine1_Ctr_Ctrl'].fullPathName(), self.find_node( rootNode,  'Spine1_Jnt' )   )
-                create_constraint( controls['Spine2_Ctr_Ctrl'].fullPathName(), self.find_node( rootNode,  'Spine2_Jnt' )   )
-                create_constraint( controls['Spine3_Ctr_Ctrl'].fullPathName(), self.find_node( rootNode,  'Spine3_Jnt' )  )
+                # The spine joints were already resolved in the joint mapping
+                for spine in [ 'Hips', 'Spine1', 'Spine2', 'Spine3' ]:
+                    create_constraint( controls[ spine + '_Ctr_Ctrl' ].fullPathName(), joints[ spine + '_Ctr' ].fullPathName() )
 
              # Spine
             #
@@ -8551,37 +8339,16 @@ class Biped( Char ):
 
             poles = ['LegPole_IK_', 'ArmPole_IK_']
 
-            root_ctrls = ['LegUp_FK_', 'ArmUp_FK_']
-            eff_ctrls  = ['LegLo_FK_', 'ArmLo_FK_']
-            hndl_ctrls  = ['Foot_FK_', 'Hand_FK_']
-
-            for SIDE in [ 'Lft', 'Rgt'  ]:
-
-                for i in range( len ( poles ) ):
-
-                    for attr in ['tx', 'ty', 'tz', 'rx', 'ry', 'rz', 'sx', 'sy', 'sz'  ]:
-                        mc.setAttr( controls[poles[i]+SIDE+'_Ctrl'].fullPathName()+ '.'+attr, l=False)
-
-                    #legUp_jnt = controls[ root_ctrls[i]+SIDE+'_Ctrl' ]
-                    #legLo_jnt = controls[ eff_ctrls[i] +SIDE+'_Ctrl' ]
-                    #foot_jnt  = controls[ hndl_ctrls[i]+SIDE+'_Ctrl' ]
-
-                    #legUp_jnt = self.find_node( controls[ root_ctrls[i]+SIDE+'_Ctrl' ] )
-                    legLo_jnt = controls[ eff_ctrls[i] +SIDE+'_Ctrl' ]
-                    foot_jnt  = controls[ hndl_ctrls[i]+SIDE+'_Ctrl' ]
+            # The poles are placed during the IK setup, here their channels only get unlocked
+            for SIDE in SIDES:
 
-                    # Redundant? Wird beim IK Setup besser passen...
-                    '''
-                    pole_matrix = self.get_polevector_position( legUp_jnt, legLo_jnt, foot_jnt, preferred_angle )
+                for pole in poles:
 
-                    parent = mc.listRelatives ( controls[ poles[i]+SIDE+'_Ctrl' ].fullPathName(), p=True )[0]
-                    parent = mc.listRelatives ( parent, p=True )[0]
+                    pole = controls[pole+SIDE+'_Ctrl'].fullPathName()
 
-                    self.set_matrix( parent, pole_matrix, kWorld)
+                    for attr in kTransformAttrs:
+                        mc.setAttr( pole + '.'+attr, l=False)
 
-                    for attr in ['tx', 'ty', 'tz', 'rx', 'ry', 'rz', 'sx', 'sy', 'sz'  ]:
-                        mc.setAttr( parent + '.'+attr, l=True)
-                    '''
             if self.DEBUG:
                 print ( 'Position Pole Vector done' )
 
@@ -8589,7 +8356,7 @@ class Biped( Char ):
             #
             ######################################################################################
 
-            internal_grp = mc.createNode( 'transform', name='Internal_Grp', parent= self.find_node(rootNode, 'Rig_Grp' ) )
+            internal_grp = mc.createNode( 'transform', name='Internal_Grp', parent=rig_grp )
             grp = mc.createNode( 'transform', name='IKFoot_Grp', parent=internal_grp )
             mc.setAttr( internal_grp + '.v', False )
             mc.setAttr( internal_grp + '.inheritsTransform', False )
@@ -8604,41 +8371,37 @@ class Biped( Char ):
             if type == kBiped:
                 eyes_grp = mc.createNode( 'transform', name='Eyes_Grp', parent= controls['Main_Ctr_Ctrl']  , ss=True )
 
-                Eyes_Ctr_Ctrl = self.create_handle( name='Eyes_Ctr_Ctrl', matchTransform=self.find_node(rootNode, 'Eye_Lft_Jnt'), parent = eyes_grp,
+                Eyes_Ctr_Ctrl = self.create_handle( name='Eyes_Ctr_Ctrl', matchTransform=self.find_node(rootNode, 'Eye_Lft_Jnt', nodeIndex), parent = eyes_grp,
                                              shapeType=self.kCube, green=1, red=1, width=3, height=3, depth=3,   character = rootNode, globalScale = True )
 
-                eye_ctrl_grp = mc.listRelatives( Eyes_Ctr_Ctrl.fullPathName(), p=True, pa=True )[0]
+                # The control group is the direct parent of the control
+                eye_ctrl_grp = om.MFnDagNode( om.MFnDagNode( Eyes_Ctr_Ctrl.node() ).parent( 0 ) ).fullPathName()
                 mc.setAttr( eye_ctrl_grp + '.tx', l=0 )
                 mc.setAttr( eye_ctrl_grp + '.tz', l=0 )
 
                 # Move the control to the centre
                 mc.setAttr( eye_ctrl_grp + '.tx',  0 )
 
-                Eyes_Lft_Ctrl = self.create_handle(name='Eye_Lft_Ctrl', matchTransform=self.find_node(rootNode, 'Eye_Lft_Jnt'),   parent =  Eyes_Ctr_Ctrl.fullPathName()  ,
+                Eyes_Lft_Ctrl = self.create_handle(name='Eye_Lft_Ctrl', matchTransform=self.find_node(rootNode, 'Eye_Lft_Jnt', nodeIndex),   parent =  Eyes_Ctr_Ctrl.fullPathName()  ,
                                              shapeType=self.kCube, color=colors[0], width=2, height=2, depth=2,   character = rootNode, globalScale = True,
                                              constraint=self.kAim, aimVec=(0,0,1), upVec = (0,1,0))
 
-                Eyes_Rgt_Ctrl = self.create_handle(name='Eye_Rgt_Ctrl', matchTransform=self.find_node(rootNode, 'Eye_Rgt_Jnt'),   parent = Eyes_Ctr_Ctrl.fullPathName() ,
+                Eyes_Rgt_Ctrl = self.create_handle(name='Eye_Rgt_Ctrl', matchTransform=self.find_node(rootNode, 'Eye_Rgt_Jnt', nodeIndex),   parent = Eyes_Ctr_Ctrl.fullPathName() ,
                                              shapeType=self.kCube, color=colors[1], width=2, height=2, depth=2,  character = rootNode, globalScale = True,
                                              constraint=self.kAim, aimVec=(0,0,1), upVec = (0,1,0) )
 
-                eye_ctrl_grp_l = mc.listRelatives( Eyes_Lft_Ctrl.fullPathName(), p=True, pa=True )[0]
-                eye_ctrl_grp_r = mc.listRelatives( Eyes_Rgt_Ctrl.fullPathName(), p=True, pa=True )[0]
-
+                # Push the group forward and lock it in the same call
                 ty = mc.getAttr( eye_ctrl_grp + '.ty' )
-                mc.setAttr( eye_ctrl_grp+ '.tz', ty/3 )
+                mc.setAttr( eye_ctrl_grp + '.tz', ty/3.0, l=1 )
+                mc.setAttr( eye_ctrl_grp + '.tx', l=1 )
 
                 # zero out the rotation on the right side
-                mc.setAttr ( eye_ctrl_grp_r + '.rx', l=0 )
-                mc.setAttr ( eye_ctrl_grp_r + '.ry', l=0 )
-                mc.setAttr ( eye_ctrl_grp_r + '.rz', l=0 )
-                mc.setAttr ( eye_ctrl_grp_r + '.r', 0,0,0 )
-                mc.setAttr ( eye_ctrl_grp_r + '.rx', l=1 )
-                mc.setAttr ( eye_ctrl_grp_r + '.ry', l=1 )
-                mc.setAttr ( eye_ctrl_grp_r + '.rz', l=1 )
-
-                mc.setAttr( eye_ctrl_grp + '.tx', l=1 )
-                mc.setAttr( eye_ctrl_grp + '.tz', l=1 )
+                eye_ctrl_grp_r = om.MFnDagNode( om.MFnDagNode( Eyes_Rgt_Ctrl.node() ).parent( 0 ) ).fullPathName()
+                for attr in [ 'rx', 'ry', 'rz' ]:
+                    mc.setAttr( eye_ctrl_grp_r + '.' + attr, l=0 )
+                mc.setAttr( eye_ctrl_grp_r + '.r', 0, 0, 0 )
+                for attr in [ 'rx', 'ry', 'rz' ]:
+                    mc.setAttr( eye_ctrl_grp_r + '.' + attr, l=1 )
 
                 # Space Switch
                 self.create_space_switch( Eyes_Ctr_Ctrl, controls['Head_Ctr_Ctrl'], 'world', False )
@@ -8654,41 +8417,18 @@ class Biped( Char ):
 
             if self.DEBUG:
                 print ('Create IK Legs')
-            scale = mc.getAttr( rootNode + '.globalScale' )
-
-            # Creates a constraint like transform calculation
-            def matrix_multi(
-                    name='matrix_multi',
-                    inputs=['LegUpFK_Lft_Ctrl2', 'Hips_Ctr_Ctrl_LegUpFK_Lft_Ctrl2_Grp'],
-                    inputs_inv=['LegUp_Lft_Jnt'],
-                    inputs_inv_attr=['jointOrient'],
-                    inputs_inv_comp_attr=['inputRotate']):
-
-                name = self.short_name( name )
-                mult = mc.createNode( 'multMatrix', name=name + '_multi', ss=True)
-                decomp = mc.createNode( 'decomposeMatrix', name=name + '_decomp', ss=True)
 
-                save_for_cleanup( mult )
-                save_for_cleanup( decomp )
+            # Use the global Scale to make the rig scalable
+            # Neutralize global scale, non-one values will screw the rig, buggy if global scale is changed in control mode
+            # The factor is the same for every joint, so all global scale networks share this node
+            gs_multi = mc.createNode('multiplyDivide', name='GlobalScale_Multi', ss=True)
+            save_for_cleanup(gs_multi)
+            mc.connectAttr( global_scale_plug, gs_multi + '.input1X' )
+            mc.connectAttr( global_scale_plug, gs_multi + '.input1Y' )
+            mc.connectAttr( global_scale_plug, gs_multi + '.input1Z' )
 
-                mc.connectAttr( mult + '.matrixSum', decomp + '.inputMatrix' )
-
-                for i in range(len(inputs)):
-                    mc.connectAttr(inputs[i] + '.matrix', mult + '.matrixIn[{}]'.format(str(i + len(inputs_inv))))
-
-                for i in range(len(inputs_inv)):
-                    inv = mc.createNode('inverseMatrix', name=name + '_inv', ss=True)
-                    comp = mc.createNode('composeMatrix', name=name + '_comp', ss=True)
-                    for j in range(len(inputs_inv_attr)):
-                        mc.connectAttr( inputs_inv[i].fullPathName() + '.' + inputs_inv_attr[j], comp + '.' + inputs_inv_comp_attr[j])
-
-                    mc.connectAttr(comp + '.outputMatrix', inv + '.inputMatrix')
-                    mc.connectAttr(inv + '.outputMatrix', mult + '.matrixIn[{}]'.format(str(i)))
-
-                    save_for_cleanup(inv)
-                    save_for_cleanup(comp)
-
-                return decomp
+            gs = global_scale
+            mc.setAttr( gs_multi + '.input2', 1/gs, 1/gs, 1/gs )
 
             def hook_up_fk(joint, joint_ik, joint_fk, loc, name ):
                 name = self.short_name( name )
@@ -8698,36 +8438,11 @@ class Biped( Char ):
                 mc.connectAttr( loc.fullPathName() + '.' + ik_attr, pb + '.weight')
 
                 # Use the global Scale to make the rig scalable
-                mlt1 = mc.createNode('multiplyDivide', name=name + '_IK_' + SIDE + '_Multi1', ss=True)
                 mlt2 = mc.createNode('multiplyDivide', name=name + '_IK_' + SIDE + '_Multi2', ss=True)
-                save_for_cleanup(mlt1)
                 save_for_cleanup(mlt2)
-                mc.connectAttr( rootNode + '.globalScale', mlt1 + '.input1X' )
-                mc.connectAttr( rootNode + '.globalScale', mlt1 + '.input1Y' )
-                mc.connectAttr( rootNode + '.globalScale', mlt1 + '.input1Z' )
 
-                # Neutralize global scale, non-one values will screw the rig, buggy if global scale is changed in control mode
-                gs = mc.getAttr( rootNode + '.globalScale' )
-                mc.setAttr( mlt1 + '.input2', 1/gs, 1/gs, 1/gs )
-
-                mc.connectAttr( mlt1 + '.output', mlt2 + '.input1' )
-
-                '''
-                legUp_FK_decomp = matrix_multi(
-                    name=name + '_FK_' + SIDE,
-                    inputs=[
-                        name + '_FK_' + SIDE + '_Ctrl',
-                        name + '_FK_' + SIDE + '_Ctrl_Blnd_Grp',
-                        name + '_FK_' + SIDE + '_Ctrl_Grp'
-                    ],
-                    inputs_inv=[
-                        joints[ name + '_' + SIDE ]
-                    ]
-                )
-                mc.connectAttr( legUp_FK_decomp + '.outputRotate', pb + '.inRotate1' )
-                mc.connectAttr( legUp_FK_decomp + '.outputTranslate', pb + '.inTranslate1' )
+                mc.connectAttr( gs_multi + '.output', mlt2 + '.input1' )
 
-                '''
                 mc.connectAttr( joint_fk.fullPathName() + '.rotate', pb + '.inRotate1' )
                 mc.connectAttr( joint_fk.fullPathName() + '.translate', pb + '.inTranslate1' )
 
@@ -8736,9 +8451,19 @@ class Biped( Char ):
 
                 # Hook global scale here? We may need it pre PB
                 mc.connectAttr(pb + '.outTranslate', mlt2 + '.input2')
-                mc.connectAttr(mlt2 + '.output', joint.fullPathName() + '.translate')
 
-                mc.connectAttr(pb + '.outRotate', joint.fullPathName() + '.rotate')
+                # Leave joints that are driven already alone, connectAttr would stop the build on them
+                jointFn = om.MFnDependencyNode( joint.node() )
+
+                if not jointFn.findPlug( 'translate', False ).isDestination:
+                    mc.connectAttr(mlt2 + '.output', joint.fullPathName() + '.translate')
+                else:
+                    mc.warning( 'aniMeta.hook_up_fk: The translation is already connected:', joint.fullPathName() )
+
+                if not jointFn.findPlug( 'rotate', False ).isDestination:
+                    mc.connectAttr(pb + '.outRotate', joint.fullPathName() + '.rotate')
+                else:
+                    mc.warning( 'aniMeta.hook_up_fk: The rotation is already connected:', joint.fullPathName() )
 
                 # Is that a good idea? I don`t think so
                 #mc.setAttr(joint.fullPathName() + '.jointOrient', 0, 0, 0)
@@ -8746,92 +8471,32 @@ class Biped( Char ):
 
                 return pb
 
-            # Joints
-            def joint_copy( jointToCopy, jointName, jointParent ):
-
-                if not isinstance( jointToCopy, om.MDagPath ):
-                    jointToCopy = self.get_path( jointToCopy )
-                if not isinstance( jointParent, om.MDagPath ):
-                    jointParent = self.get_path( jointParent )
-
-                joint = mc.createNode('joint', parent=jointParent.fullPathName(), name=self.short_name( jointName ))
-                joint = self.get_path( joint )
-
-                mc.setAttr(
-                    joint.fullPathName() + '.jo',
-                    mc.getAttr(jointToCopy.fullPathName() + '.jo')[0][0],
-                    mc.getAttr(jointToCopy.fullPathName() + '.jo')[0][1],
-                    mc.getAttr(jointToCopy.fullPathName() + '.jo')[0][2]
-                )
-                mc.setAttr(
-                    joint.fullPathName()  + '.pa',
-                    mc.getAttr(jointToCopy.fullPathName() + '.pa')[0][0],
-                    mc.getAttr(jointToCopy.fullPathName() + '.pa')[0][1],
-                    mc.getAttr(jointToCopy.fullPathName() + '.pa')[0][2]
-                )
-                mc.matchTransform( joint.fullPathName(), jointToCopy.fullPathName() )
-                return joint
-
             def joint_global_scale( joint ):
-                joint = self.find_node( rootNode, joint )
+                joint = self.find_node( rootNode, joint, nodeIndex )
                 if joint is not None:
                     # Use the global Scale to make the rig scalable
-                    mlt1 = mc.createNode('multiplyDivide', name=self.short_name( joint ) + '_GS_' + SIDE + '_Multi1', ss=True)
                     mlt2 = mc.createNode('multiplyDivide', name=self.short_name( joint ) + '_GS_' + SIDE + '_Multi2', ss=True)
 
-                    save_for_cleanup(mlt1)
                     save_for_cleanup(mlt2)
 
-                    mc.connectAttr(rootNode + '.globalScale', mlt1 + '.input1X')
-                    mc.connectAttr(rootNode + '.globalScale', mlt1 + '.input1Y')
-                    mc.connectAttr(rootNode + '.globalScale', mlt1 + '.input1Z')
-
-                    # Neutralize global scale, non-one values will screw the rig
-                    gs = mc.getAttr(rootNode + '.globalScale')
-                    mc.setAttr(mlt1 + '.input2', 1 / gs, 1 / gs, 1 / gs)
-
-                    mc.connectAttr( mlt1 + '.output', mlt2 + '.input1')
+                    mc.connectAttr( gs_multi + '.output', mlt2 + '.input1')
 
-                    t = mc.getAttr( self.find_node( rootNode, joint ) + '.t')[0]
+                    t = mc.getAttr( joint + '.t')[0]
                     mc.setAttr( mlt2 + '.input2', t[0], t[1], t[2])
                     mc.connectAttr(mlt2 + '.output', joint + '.translate', force=True )
                 else:
                     mc.warning( 'aniMeta.joint_global_scale: Can not find node:', joint )
 
-            def createWorldOrient(node, root, value):
-                # root = 'Main_Ctr_Ctrl'
-                # node = 'ArmUp_FK_Lft_Ctrl'
-                root = self.find_node( rootNode, root )
-
-                node = self.find_node( rootNode, node )
-
-                if node is None:
-                    return None
-
-                parent = mc.listRelatives(node, p=True, pa=True)[0]
-
-                node_path = self.get_path( node )
-
-                wo = mc.createNode( 'transform', name=self.short_name(node.replace('Ctrl', 'WorldOrient')), ss=True, parent=parent )
-
-                mc.parent( node_path.fullPathName(), wo )
-
-
-                orient = mc.orientConstraint( root, wo, mo=True)
-
-                mc.addAttr(node_path.fullPathName(), ln='worldOrient', min=0, max=1)
-                mc.setAttr(node_path.fullPathName() + '.worldOrient', k=True)
-
-                target = mc.orientConstraint(orient, q=True, wal=True)[0]
-
-                mc.connectAttr(node_path.fullPathName() + '.worldOrient', orient[0] + '.' + target)
-                mc.setAttr(node_path.fullPathName() + '.worldOrient', value)
-
-
             ############################################################################################################
             # Sides
 
-            for SIDE in ['Lft', 'Rgt']:
+            # The character root is the World space of the space switches
+            root_path = self.get_path(rootNode)
+
+            for SIDE in SIDES:
+
+                # Visibility based on IK/FK mode, X inverts the leg switch and Y the arm switch
+                fkik_rev = mc.createNode( 'reverse', name='FKIK_' + SIDE + '_Rev', ss=True )
 
                 ######################################################################
                 # Leg
@@ -8852,35 +8517,32 @@ class Biped( Char ):
                 if SIDE == 'Rgt':
                     side=sides[1]
 
-                blue = 1
-                red = 0
-                green = 0
-
-                if SIDE == 'Rgt':
-                    blue = 0
-                    red = 1
+                # The side as it appears in the skeleton's joint names
+                jntSide = SIDE
+                if type == kBipedUE:
+                    jntSide = side
 
                 ########################################
                 # IK
                 # IK Loc
                 ik_loc = mc.createNode('locator', parent=controls['LegUp_FK_' + SIDE + '_Ctrl'].fullPathName(), name='Leg_IK_' + SIDE)
                 ik_loc = self.get_path( ik_loc )
+                ik_loc_path = ik_loc.fullPathName()
                 iks['Leg_IK_' + SIDE] = ik_loc
-                mc.setAttr(ik_loc.fullPathName() + '.localScale', 0, 0, 0)
-                mc.addAttr(ik_loc.fullPathName(), longName=ik_attr, min=0, max=1, at='float', defaultValue=1)
-                mc.setAttr(ik_loc.fullPathName() + '.' + ik_attr, k=True)
+                mc.setAttr(ik_loc_path + '.localScale', 0, 0, 0)
+                mc.addAttr(ik_loc_path, longName=ik_attr, min=0, max=1, at='float', defaultValue=1)
+                mc.setAttr(ik_loc_path + '.' + ik_attr, k=True)
 
                 # Hide Attrs
-                for attr in ['localScale', 'localPosition']:
-                    for axis in ['X', 'Y', 'Z']:
-                        mc.setAttr(ik_loc.fullPathName() + '.' + attr + axis, cb=False)
+                for attr in kLocatorAttrs:
+                    mc.setAttr(ik_loc_path + '.' + attr, cb=False)
 
                 for node in [ 'LegLo_FK_' + SIDE + '_Ctrl', 'Foot_FK_' + SIDE + '_Ctrl', 'Foot_IK_' + SIDE + '_Ctrl',
                              'FootLift_IK_' + SIDE + '_Ctrl', 'Toes_IK_' + SIDE + '_Ctrl',
                              'ToesTip_IK_' + SIDE + '_Ctrl', 'LegPole_IK_' + SIDE + '_Ctrl',
                              'Heel_IK_' + SIDE + '_Ctrl']:
                     if node in controls:
-                        mc.parent( ik_loc.fullPathName(), controls[node].fullPathName(), add=True, shape=True)
+                        mc.parent( ik_loc_path, controls[node].fullPathName(), add=True, shape=True)
 
                 # IK Grp
                 if self.DEBUG:
@@ -8889,24 +8551,17 @@ class Biped( Char ):
                 mc.setAttr( ik_nul + '.v', 0 )
                 mc.matchTransform(ik_nul, hipsJnt.fullPathName())
 
-                if type == kBiped:
-                    legUpJntIK_jnt_name = legUpJnt.partialPathName().replace( '_' + SIDE, '_IK_' + SIDE )
-                    legLoJntIK_jnt_name = legLoJnt.partialPathName().replace( '_' + SIDE, '_IK_' + SIDE )
-                    footJntIK_jnt_name  = footJnt.partialPathName().replace( '_' + SIDE, '_IK_' + SIDE )
-                    toesJntIK_jnt_name  = toesJnt.partialPathName().replace( '_' + SIDE, '_IK_' + SIDE )
-
-                elif type == kBipedUE:
-                    legUpJntIK_jnt_name = legUpJnt.partialPathName().replace( '_' + side, '_IK_' + side )
-                    legLoJntIK_jnt_name = legLoJnt.partialPathName().replace( '_' + side, '_IK_' + side )
-                    footJntIK_jnt_name  = footJnt.partialPathName().replace( '_' + side, '_IK_' + side )
-                    toesJntIK_jnt_name  = toesJnt.partialPathName().replace( '_' + side, '_IK_' + side )
+                legUpJntIK_jnt_name = legUpJnt.partialPathName().replace( '_' + jntSide, '_IK_' + jntSide )
+                legLoJntIK_jnt_name = legLoJnt.partialPathName().replace( '_' + jntSide, '_IK_' + jntSide )
+                footJntIK_jnt_name  = footJnt.partialPathName().replace( '_' + jntSide, '_IK_' + jntSide )
+                toesJntIK_jnt_name  = toesJnt.partialPathName().replace( '_' + jntSide, '_IK_' + jntSide )
 
-                legUpJntIK = joint_copy( legUpJnt, legUpJntIK_jnt_name, ik_nul     )
-                legLoJntIK = joint_copy( legLoJnt, legLoJntIK_jnt_name, legUpJntIK )
-                footJntIK  = joint_copy( footJnt,  footJntIK_jnt_name,  legLoJntIK )
-                toesJntIK  = joint_copy( toesJnt,  toesJntIK_jnt_name,  footJntIK  )
+                legUpJntIK = self.joint_copy( legUpJnt, legUpJntIK_jnt_name, ik_nul     )
+                legLoJntIK = self.joint_copy( legLoJnt, legLoJntIK_jnt_name, legUpJntIK )
+                footJntIK  = self.joint_copy( footJnt,  footJntIK_jnt_name,  legLoJntIK )
+                toesJntIK  = self.joint_copy( toesJnt,  toesJntIK_jnt_name,  footJntIK  )
 
-                mc.parentConstraint( controls['Toes_IK_{}_Ctrl'.format(SIDE)].fullPathName(), toesJntIK.fullPathName(), mo=True, skipTranslate=['x','y','z'] )
+                mc.orientConstraint( controls['Toes_IK_{}_Ctrl'.format(SIDE)].fullPathName(), toesJntIK.fullPathName(), mo=True )
 
                 ########################################################################################################
                 #
@@ -8914,40 +8569,39 @@ class Biped( Char ):
 
                 pole_matrix = self.get_polevector_position( legUpJntIK, legLoJntIK, footJntIK, leg_preferred_angle )
 
-                parent = mc.listRelatives( controls[ 'LegPole_IK_' + SIDE + '_Ctrl' ].fullPathName(), p = True )[ 0 ]
-                parent = mc.listRelatives( parent, p = True )[ 0 ]
+                # The pole group is two levels up
+                parent = om.MFnDagNode( controls[ 'LegPole_IK_' + SIDE + '_Ctrl' ].node() ).parent( 0 )
+                parent = om.MFnDagNode( om.MFnDagNode( parent ).parent( 0 ) ).fullPathName()
 
                 self.set_matrix( parent, pole_matrix, kWorld )
 
-                for attr in [ 'tx', 'ty', 'tz', 'rx', 'ry', 'rz', 'sx', 'sy', 'sz' ]:
+                # Locking the compounds locks their child channels as well
+                for attr in [ 't', 'r', 's' ]:
                     mc.setAttr( parent + '.' + attr, l = True )
 
                 # Pole vector Position
                 #
                 ########################################################################################################
 
+                # Proxy FK Joints
                 if type == kBiped:
                     hipsJntFK_jnt_name  = hipsJnt.partialPathName().replace( '_Jnt' , '_FK_Jnt' )
-                    legUpJntFK_jnt_name = legUpJnt.partialPathName().replace( '_' + SIDE, '_FK_' + SIDE )
-                    legLoJntFK_jnt_name = legLoJnt.partialPathName().replace( '_' + SIDE, '_FK_' + SIDE )
-                    footJntFK_jnt_name  = footJnt.partialPathName().replace( '_' + SIDE, '_FK_' + SIDE )
-                    toesJntFK_jnt_name  = toesJnt.partialPathName().replace( '_' + SIDE, '_FK_' + SIDE )
                 elif type == kBipedUE:
-                    # Proxy FK Joints
                     hipsJntFK_jnt_name  = hipsJnt.partialPathName() + '_FK'
-                    legUpJntFK_jnt_name = legUpJnt.partialPathName().replace( '_' + side, '_FK_' + side )
-                    legLoJntFK_jnt_name = legLoJnt.partialPathName().replace( '_' + side, '_FK_' + side )
-                    footJntFK_jnt_name  = footJnt.partialPathName().replace( '_' + side, '_FK_' + side )
-                    toesJntFK_jnt_name  = toesJnt.partialPathName().replace( '_' + side, '_FK_' + side )
+
+                legUpJntFK_jnt_name = legUpJnt.partialPathName().replace( '_' + jntSide, '_FK_' + jntSide )
+                legLoJntFK_jnt_name = legLoJnt.partialPathName().replace( '_' + jntSide, '_FK_' + jntSide )
+                footJntFK_jnt_name  = footJnt.partialPathName().replace( '_' + jntSide, '_FK_' + jntSide )
+                toesJntFK_jnt_name  = toesJnt.partialPathName().replace( '_' + jntSide, '_FK_' + jntSide )
 
                 if SIDE == 'Lft':
-                    hipsJntFK  = joint_copy( hipsJnt,  hipsJntFK_jnt_name,  prx_grp     )
+                    hipsJntFK  = self.joint_copy( hipsJnt,  hipsJntFK_jnt_name,  prx_grp     )
                     save_for_cleanup( hipsJntFK.fullPathName() )
 
-                legUpJntFK = joint_copy( legUpJnt, legUpJntFK_jnt_name, hipsJntFK   )
-                legLoJntFK = joint_copy( legLoJnt, legLoJntFK_jnt_name, legUpJntFK  )
-                footJntFK  = joint_copy( footJnt,  footJntFK_jnt_name,  legLoJntFK  )
-                toesJntFK  = joint_copy( toesJnt,  toesJntFK_jnt_name,  footJntFK   )
+                legUpJntFK = self.joint_copy( legUpJnt, legUpJntFK_jnt_name, hipsJntFK   )
+                legLoJntFK = self.joint_copy( legLoJnt, legLoJntFK_jnt_name, legUpJntFK  )
+                footJntFK  = self.joint_copy( footJnt,  footJntFK_jnt_name,  legLoJntFK  )
+                toesJntFK  = self.joint_copy( toesJnt,  toesJntFK_jnt_name,  footJntFK   )
 
                 mc.parentConstraint( controls['Hips_Ctr_Ctrl'].fullPathName(),          hipsJntFK.fullPathName(),  mo=True )
                 mc.parentConstraint( controls['LegUp_FK_'+SIDE+'_Ctrl'].fullPathName(), legUpJntFK.fullPathName(), mo=True )
@@ -8956,14 +8610,11 @@ class Biped( Char ):
                 mc.parentConstraint( controls['Toes_FK_'+SIDE+'_Ctrl'].fullPathName(),  toesJntFK.fullPathName(),  mo=True )
 
                 # Visibility based on IK/FK mode
-                rev = mc.createNode( 'reverse', name=self.short_name( ik_loc.partialPathName() ) +'_rev', ss=True  )
-                mc.connectAttr( ik_loc.fullPathName() + '.' + ik_attr, rev + '.inputX')
-
-                for ctl in [ 'LegUp_FK_' + SIDE + '_Ctrl', 'LegLo_FK_' + SIDE + '_Ctrl', 'Foot_FK_' + SIDE + '_Ctrl', 'Toes_FK_' + SIDE + '_Ctrl' ]:
-                    mc.connectAttr( rev + '.outputX', controls[ctl].fullPathName() + '.v')
+                mc.connectAttr( ik_loc_path + '.' + ik_attr, fkik_rev + '.inputX')
 
-                for ctl in [ 'Foot_IK_' + SIDE + '_Ctrl', 'FootLift_IK_' + SIDE + '_Ctrl', 'Heel_IK_' + SIDE + '_Ctrl', 'Toes_IK_' + SIDE + '_Ctrl', 'ToesTip_IK_' + SIDE + '_Ctrl' ]:
-                    mc.connectAttr( ik_loc.fullPathName() + '.' + ik_attr, controls[ctl].fullPathName() + '.v')
+                # The other FK and IK foot controls are children of these, so they are hidden with them
+                mc.connectAttr( fkik_rev + '.outputX', controls['LegUp_FK_' + SIDE + '_Ctrl'].fullPathName() + '.v')
+                mc.connectAttr( ik_loc_path + '.' + ik_attr, controls['Foot_IK_' + SIDE + '_Ctrl'].fullPathName() + '.v')
 
 
                 # IK Handle
@@ -8989,23 +8640,21 @@ class Biped( Char ):
                 hook_up_fk( footJnt,  footJntIK,  footJntFK,  ik_loc,  'Foot'  )
                 hook_up_fk( toesJnt,  toesJntIK,  toesJntFK,  ik_loc,  'Toes'  )
 
-                joint_global_scale( self.find_node( rootNode, 'Heel_'+SIDE+'_Jnt'    ))
-                joint_global_scale( self.find_node( rootNode, 'ToesTip_'+SIDE+'_Jnt' ))
-                joint_global_scale( self.find_node( rootNode, 'Eye_'+SIDE+'_Jnt'     ))
+                joint_global_scale( 'Heel_'+SIDE+'_Jnt'    )
+                joint_global_scale( 'ToesTip_'+SIDE+'_Jnt' )
+                joint_global_scale( 'Eye_'+SIDE+'_Jnt'     )
 
                 if SIDE == 'Lft':
-                    joint_global_scale( self.find_node( rootNode, 'Head_Jnt_Tip' ))
-                    joint_global_scale( self.find_node( rootNode, 'Jaw_Jnt'      ))
-                    joint_global_scale( self.find_node( rootNode, 'Jaw_Jnt_Tip'  ))
+                    joint_global_scale( 'Head_Jnt_Tip' )
+                    joint_global_scale( 'Jaw_Jnt'      )
+                    joint_global_scale( 'Jaw_Jnt_Tip'  )
 
-                mc.setAttr (  ik_loc.fullPathName() + '.FK_IK', 1)
+                mc.setAttr (  ik_loc_path + '.FK_IK', 1)
 
                 # Space Switch
 
                 feet_iks = [ controls[ 'Foot_IK_'+SIDE+'_Ctrl' ] ]
 
-                root_path = self.get_path(rootNode)
-
                 for node in feet_iks:
                     self.create_multi_space_switch(
                         node,
@@ -9026,6 +8675,7 @@ class Biped( Char ):
                 handJnt     = joints[ 'Hand_'  + SIDE  ]
                 main        = controls['Main_Ctr_Ctrl' ]
                 poleVec     = controls['ArmPole_IK_' + SIDE + '_Ctrl']
+                handIK      = controls['Hand_IK_' + SIDE + '_Ctrl']
                 ikName      = 'ArmIKHandle_' + SIDE
 
                 # Clavicle
@@ -9034,56 +8684,41 @@ class Biped( Char ):
                 # IK Loc
                 ik_loc = mc.createNode('locator', parent=controls['ArmUp_FK_'+SIDE+'_Ctrl'].fullPathName(), name='Arm_IK_' + SIDE)
                 ik_loc = self.get_path( ik_loc )
+                ik_loc_path = ik_loc.fullPathName()
                 iks['Arm_IK_' + SIDE] = ik_loc
-                mc.setAttr(ik_loc.fullPathName() + '.localScale', 0, 0, 0)
-                mc.addAttr(ik_loc.fullPathName(), longName=ik_attr, min=0, max=1, at='float', defaultValue=0)
-                mc.setAttr(ik_loc.fullPathName() + '.' + ik_attr, k=True)
+                mc.setAttr(ik_loc_path + '.localScale', 0, 0, 0)
+                mc.addAttr(ik_loc_path, longName=ik_attr, min=0, max=1, at='float', defaultValue=0)
+                mc.setAttr(ik_loc_path + '.' + ik_attr, k=True)
 
                 # Hide Attrs
-                for attr in ['localScale', 'localPosition']:
-                    for axis in ['X', 'Y', 'Z']:
-                        mc.setAttr(ik_loc.fullPathName() + '.' + attr + axis, cb=False)
+                for attr in kLocatorAttrs:
+                    mc.setAttr(ik_loc_path + '.' + attr, cb=False)
 
                 # Parent IK Shape under Ctrl transforms for easy access
                 for node in [ 'ArmLo_FK_' + SIDE + '_Ctrl',
                               'Hand_FK_' + SIDE + '_Ctrl',
                               'ArmPole_IK_' + SIDE + '_Ctrl',
                               'Hand_IK_' + SIDE + '_Ctrl' ]:
-                    mc.parent(ik_loc.fullPathName(), controls[node].fullPathName(), add=True, shape=True)
+                    mc.parent(ik_loc_path, controls[node].fullPathName(), add=True, shape=True)
 
                 clav = controls['Clavicle_'+SIDE+'_Ctrl']
 
                 # Proxy FK Joints
-                if type == kBiped:
-                    clavJntIK_jnt_name  = clavJnt.partialPathName().replace(  '_' + SIDE, '_FK_' + SIDE )
-                    armUpJntIK_jnt_name = armUpJnt.partialPathName().replace( '_' + SIDE, '_FK_' + SIDE )
-                    armLoJntIK_jnt_name = armLoJnt.partialPathName().replace( '_' + SIDE, '_FK_' + SIDE )
-                    handJntIK_jnt_name  = handJnt.partialPathName().replace(  '_' + SIDE, '_FK_' + SIDE )
-
-                    armUpJntIK_jnt_name = armUpJnt.partialPathName().replace( '_' + SIDE, '_IK_' + SIDE )
-                    armLoJntIK_jnt_name = armLoJnt.partialPathName().replace( '_' + SIDE, '_IK_' + SIDE )
-                    handJntIK_jnt_name  = handJnt.partialPathName().replace(  '_' + SIDE, '_IK_' + SIDE )
-
-                elif type == kBipedUE:
-                    clavJntIK_jnt_name  = clavJnt.partialPathName().replace(  '_' + side, '_FK_' + side )
-                    armUpJntIK_jnt_name = armUpJnt.partialPathName().replace( '_' + side, '_FK_' + side )
-                    armLoJntIK_jnt_name = armLoJnt.partialPathName().replace( '_' + side, '_FK_' + side )
-                    handJntIK_jnt_name  = handJnt.partialPathName().replace(  '_' + side, '_FK_' + side )
-
-                    armUpJntIK_jnt_name = armUpJnt.partialPathName().replace( '_' + side, '_IK_' + side )
-                    armLoJntIK_jnt_name = armLoJnt.partialPathName().replace( '_' + side, '_IK_' + side )
-                    handJntIK_jnt_name  = handJnt.partialPathName().replace(  '_' + side, '_IK_' + side )
-
-                armUpJntIK = joint_copy( armUpJnt, armUpJntIK_jnt_name, clav         )
-                armLoJntIK = joint_copy( armLoJnt, armLoJntIK_jnt_name, armUpJntIK   )
-                handJntIK  = joint_copy( handJnt,  handJntIK_jnt_name, armLoJntIK    )
+                clavJntIK_jnt_name  = clavJnt.partialPathName().replace(  '_' + jntSide, '_FK_' + jntSide )
+                armUpJntIK_jnt_name = armUpJnt.partialPathName().replace( '_' + jntSide, '_IK_' + jntSide )
+                armLoJntIK_jnt_name = armLoJnt.partialPathName().replace( '_' + jntSide, '_IK_' + jntSide )
+                handJntIK_jnt_name  = handJnt.partialPathName().replace(  '_' + jntSide, '_IK_' + jntSide )
+
+                armUpJntIK = self.joint_copy( armUpJnt, armUpJntIK_jnt_name, clav         )
+                armLoJntIK = self.joint_copy( armLoJnt, armLoJntIK_jnt_name, armUpJntIK   )
+                handJntIK  = self.joint_copy( handJnt,  handJntIK_jnt_name, armLoJntIK    )
                 mc.setAttr( armUpJntIK.fullPathName() + '.v', False )
 
-                clavJntFK  = joint_copy( clavJnt,  clavJntIK_jnt_name, prx_grp       )
+                clavJntFK  = self.joint_copy( clavJnt,  clavJntIK_jnt_name, prx_grp       )
                 save_for_cleanup( clavJntFK.fullPathName() )
-                armUpJntFK = joint_copy( armUpJnt, armUpJntIK_jnt_name, clavJntFK   )
-                armLoJntFK = joint_copy( armLoJnt, armLoJntIK_jnt_name, armUpJntFK  )
-                handJntFK  = joint_copy( handJnt,  handJntIK_jnt_name,  armLoJntFK   )
+                armUpJntFK = self.joint_copy( armUpJnt, armUpJntIK_jnt_name, clavJntFK   )
+                armLoJntFK = self.joint_copy( armLoJnt, armLoJntIK_jnt_name, armUpJntFK  )
+                handJntFK  = self.joint_copy( handJnt,  handJntIK_jnt_name,  armLoJntFK   )
 
                 mc.parentConstraint( controls['Clavicle_'+SIDE+'_Ctrl'].fullPathName(), clavJntFK.fullPathName(), mo=True )
                 mc.parentConstraint( controls['ArmUp_FK_'+SIDE+'_Ctrl'].fullPathName(), armUpJntFK.fullPathName(), mo=True )
@@ -9100,7 +8735,7 @@ class Biped( Char ):
                 mc.setAttr(ikHandle + '.v', 0)
                 mc.setAttr(ikHandle + '.stickiness', True)
                 mc.setAttr(ikHandle + '.snapEnable', False)
-                mc.parent(ikHandle, controls['Hand_IK_'+SIDE+'_Ctrl'].fullPathName() )
+                mc.parent(ikHandle, handIK.fullPathName() )
                 #mc.orientConstraint('FootLift_IK_' + SIDE + '_Ctrl', footJntIK, mo=True)
 
                 hook_up_fk( armUpJnt, armUpJntIK,  armUpJntFK, ik_loc,  'ArmUp' )
@@ -9113,12 +8748,14 @@ class Biped( Char ):
 
                 pole_matrix = self.get_polevector_position( armUpJntIK, armLoJntIK, handJntIK, arm_preferred_angle )
 
-                parent = mc.listRelatives( controls[ 'ArmPole_IK_' + SIDE + '_Ctrl' ].fullPathName(), p = True )[ 0 ]
-                parent = mc.listRelatives( parent, p = True )[ 0 ]
+                # The pole group is two levels up
+                parent = om.MFnDagNode( poleVec.node() ).parent( 0 )
+                parent = om.MFnDagNode( om.MFnDagNode( parent ).parent( 0 ) ).fullPathName()
 
                 self.set_matrix( parent, pole_matrix, kWorld )
 
-                for attr in [ 'tx', 'ty', 'tz', 'rx', 'ry', 'rz', 'sx', 'sy', 'sz' ]:
+                # Locking the compounds locks their child channels as well
+                for attr in [ 't', 'r', 's' ]:
                     mc.setAttr( parent + '.' + attr, l = True )
 
                 # Pole vector Position
@@ -9127,9 +8764,8 @@ class Biped( Char ):
 
 
                 # Create Switch to orient the hand to the IK Ctrl
-                hand_ctrl =  self.find_node(rootNode, 'Hand_FK_'+SIDE+'_Ctrl')
-                hand_parent = mc.listRelatives( hand_ctrl, p=True, pa=True )[0]
-                hand_parent = mc.listRelatives( hand_parent, p=True, pa=True )[0]
+                hand_parent = om.MFnDagNode( controls['Hand_FK_'+SIDE+'_Ctrl'].node() ).parent( 0 )
+                hand_parent = om.MFnDagNode( om.MFnDagNode( hand_parent ).parent( 0 ) ).fullPathName()
 
                 # Make the Hand follow the arm joint for IK/FK Blending
                 for attr in ['tx', 'ty', 'tz', 'rx', 'ry', 'rz']:
@@ -9138,7 +8774,7 @@ class Biped( Char ):
 
                 cnst = mc.parentConstraint(
                     armLoJnt,
-                    controls['Hand_IK_'+SIDE+'_Ctrl'].fullPathName(),
+                    handIK.fullPathName(),
                     hand_parent,
                     mo=True
                 )
@@ -9147,13 +8783,13 @@ class Biped( Char ):
 
                 alias = mc.parentConstraint( cnst[0], q=True, wal=True )
 
-                mc.addAttr( ik_loc.fullPathName(), longName='lockHandRot', min=0, max=1, dv=0 )
-                mc.setAttr( ik_loc.fullPathName()+ '.lockHandRot', k=True )
+                mc.addAttr( ik_loc_path, longName='lockHandRot', min=0, max=1, dv=0 )
+                mc.setAttr( ik_loc_path+ '.lockHandRot', k=True )
 
-                mc.connectAttr( ik_loc.fullPathName()+ '.lockHandRot', cnst[0] + '.' + alias[1] )
+                mc.connectAttr( ik_loc_path+ '.lockHandRot', cnst[0] + '.' + alias[1] )
 
-                rev = mc.createNode('reverse', ss=True, name=self.short_name( controls['Hand_IK_'+SIDE+'_Ctrl'].fullPathName() )+'_Lock_Rev')
-                mc.connectAttr( ik_loc.fullPathName() + '.lockHandRot', rev + '.inputX' )
+                rev = mc.createNode('reverse', ss=True, name=self.short_name( handIK.fullPathName() )+'_Lock_Rev')
+                mc.connectAttr( ik_loc_path + '.lockHandRot', rev + '.inputX' )
                 mc.connectAttr( rev + '.outputX', cnst[0] + '.' + alias[0] )
 
                 mc.parent( hand_parent, controls['Main_Ctr_Ctrl'] )
@@ -9163,10 +8799,8 @@ class Biped( Char ):
                 for node in hand_space_switch_list:
                     hand_space_ctrls.append( controls[node] )
 
-                root_path = self.get_path(rootNode)
-
                 # Space Switch
-                for node in [ controls['Hand_IK_'+SIDE+'_Ctrl'], controls['ArmPole_IK_'+SIDE+'_Ctrl'], root_path ]:
+                for node in [ handIK, poleVec, root_path ]:
                     self.create_multi_space_switch(
                         node,
                         hand_space_ctrls,
@@ -9175,30 +8809,26 @@ class Biped( Char ):
                     )
                 # Hide the attribute on the pole Vector
                 #ArmPoleVecIK_Ctrl[0] = self.find_node( rootNode, ArmPoleVecIK_Ctrl[0] )
-                mc.setAttr ( controls['ArmPole_IK_'+SIDE+'_Ctrl'].fullPathName() + '.space', k=False )
+                mc.setAttr ( poleVec.fullPathName() + '.space', k=False )
 
                 # Connect the Hand Ik to the PoleVec space to have matching spaces
                 #HandIK_Ctrl[0] = self.find_node( rootNode, HandIK_Ctrl[0] )
                 mc.connectAttr(
-                    controls['Hand_IK_'+SIDE+'_Ctrl'].fullPathName() + '.space',
-                    controls['ArmPole_IK_'+SIDE+'_Ctrl'].fullPathName() + '.space'
+                    handIK.fullPathName() + '.space',
+                    poleVec.fullPathName() + '.space'
                 )
 
                 # Visibility based on IK/FK mode
-                rev = mc.createNode( 'reverse', name=self.short_name( ik_loc.fullPathName() )+'_rev', ss=True  )
-                mc.connectAttr( ik_loc.fullPathName() + '.' + ik_attr, rev + '.inputX')
-
-                for node in [
-                    controls['ArmUp_FK_' + SIDE + '_Ctrl'],
-                    controls['ArmLo_FK_' + SIDE + '_Ctrl']
-                ]:
-                    node = mc.listRelatives( node.fullPathName(), p=True, pa=True )[0]
-                    mc.setAttr( node + '.v', l=False )
-                    mc.connectAttr( rev + '.outputX', node + '.v')
-
-                for node in [ controls['Hand_IK_'+SIDE+'_Ctrl'], controls['ArmPole_IK_'+SIDE+'_Ctrl']]:
+                mc.connectAttr( ik_loc_path + '.' + ik_attr, fkik_rev + '.inputY')
+
+                # ArmLo_FK is a child of ArmUp_FK and is hidden with it
+                node = om.MFnDagNode( om.MFnDagNode( controls['ArmUp_FK_' + SIDE + '_Ctrl'].node() ).parent( 0 ) ).fullPathName()
+                mc.setAttr( node + '.v', l=False )
+                mc.connectAttr( fkik_rev + '.outputY', node + '.v')
+
+                for node in [ handIK, poleVec ]:
                     mc.setAttr( node.fullPathName() + '.v', l=False )
-                    mc.connectAttr(  ik_loc.fullPathName() + '.' + ik_attr, node.fullPathName() + '.v' )
+                    mc.connectAttr(  ik_loc_path + '.' + ik_attr, node.fullPathName() + '.v' )
 
                 # Arm
                 ######################################################################
@@ -9209,16 +8839,14 @@ class Biped( Char ):
             if self.DEBUG:
                 print ('Create Orients')
 
-            for SIDE in ['Lft', 'Rgt']:
-                armUp = self.find_node( rootNode, 'ArmUp_FK_' + SIDE + '_Ctrl' )
-                createWorldOrient( armUp, controls['Main_Ctr_Ctrl'], 1)
+            for SIDE in SIDES:
+                self.create_world_orient( controls['ArmUp_FK_' + SIDE + '_Ctrl'], controls['Main_Ctr_Ctrl'], 1)
 
-            createWorldOrient( controls['Head_Ctr_Ctrl'], controls['Main_Ctr_Ctrl'], 1)
+            self.create_world_orient( controls['Head_Ctr_Ctrl'], controls['Main_Ctr_Ctrl'], 1)
 
 
             for node in ['Spine1_Ctr_Ctrl', 'Spine2_Ctr_Ctrl', 'Spine3_Ctr_Ctrl', 'Chest_Ctr_Ctrl']:
-                node = self.find_node( rootNode, node )
-                createWorldOrient( node, controls['Main_Ctr_Ctrl'], 0 )
+                self.create_world_orient( controls.get( node ), controls['Main_Ctr_Ctrl'], 0 )
 
             # World Orient
             #
@@ -9233,7 +8861,18 @@ class Biped( Char ):
                 for handle in handles:
                     self.set_metaData(handle, data)
 
-            for SIDE in ['Lft', 'Rgt']:
+            # Sort the control names by side once, the passes below only need one side each
+            controlsBySide = { 'Lft': [], 'Rgt': [], 'Ctr': [] }
+
+            for ctl in controls.keys():
+                if 'Lft' in ctl:
+                    controlsBySide[ 'Lft' ].append( ctl )
+                if 'Rgt' in ctl:
+                    controlsBySide[ 'Rgt' ].append( ctl )
+                if '_Ctr_' in ctl:
+                    controlsBySide[ 'Ctr' ].append( ctl )
+
+            for SIDE in SIDES:
 
                 data = {}
                 data['Type'] = kHandle
@@ -9249,11 +8888,7 @@ class Biped( Char ):
 
                 data['Mirror'] = kSymmetricRotation
 
-                handles = []
-
-                for ctl in controls.keys():
-                    if SIDE in ctl:
-                        handles.append( controls[ctl] )
+                handles = [ controls[ ctl ] for ctl in controlsBySide[ SIDE ] ]
 
                 set_data(  handles, data )
 
@@ -9286,10 +8921,7 @@ class Biped( Char ):
             data['Side'] = kCenter
             data['Mirror'] = kBasic
 
-            handles_Ctr = []
-            for ctl in controls.keys():
-                if '_Ctr_' in ctl:
-                    handles_Ctr.append( controls[ctl] )
+            handles_Ctr = [ controls[ ctl ] for ctl in controlsBySide[ 'Ctr' ] ]
 
             set_data(  handles_Ctr, data )
 
@@ -9311,6 +8943,9 @@ class Biped( Char ):
             if len(self.rigCustomCtrls):
                 self.create_custom_control( **self.rigCustomCtrls )
 
+            # The hierarchy is complete now, list it once for the look-ups below
+            ctrlIndex = self.get_node_index( rootNode )
+
             data = {}
             data['Type'] = kHandle
             handles = self.get_nodes( main, data)
@@ -9319,7 +8954,7 @@ class Biped( Char ):
             attrs = ['visibility']
 
             for handle in handles:
-                handle = self.find_node( rootNode, handle )
+                handle = self.find_node( rootNode, handle, ctrlIndex )
                 for attr in attrs:
                     mc.setAttr(handle + '.' + attr, l=True, k=False, cb=False)
 
@@ -9332,7 +8967,7 @@ class Biped( Char ):
 
                 ctrlData = rootData['ControlShapeData']
                 for node in ctrlData.keys():
-                    actual_node = self.find_node( rootNode, node )
+                    actual_node = self.find_node( rootNode, node, ctrlIndex )
                     if len ( ctrlData[node]) > 0:
                         for attr in ctrlData[node].keys():
                             try:
@@ -9360,25 +8995,34 @@ class Biped( Char ):
 
             # Connect the visibility
             visNode = rootNode
+
+            def connect_visibility( visPlug, node ):
+                mc.setAttr( node + '.v', lock=False )
+                mc.connectAttr( visPlug, node + '.v', force=True )
+
+            # One query for the switches the character already has
+            visAttrs = set( mc.listAttr( visNode, userDefined=True ) or [] )
+
             for key in dict.keys():
                 attrName = 'show_'+key
-                if not mc.attributeQuery( 'show_'+key, node=visNode, exists=True):
+                if attrName not in visAttrs:
                     mc.addAttr( visNode, longName=attrName, enumName='off:on', defaultValue=1, at='enum' )
                     mc.setAttr(visNode+'.' + attrName, k=True)
+                visPlug = visNode + '.' + attrName
+
                 for node in dict[key]:
-                    try:
-                        node = self.find_node( rootNode, node )
-                        mc.setAttr( node + '.v', lock=False )
-                        mc.connectAttr( visNode + '.' + attrName, node + '.v', force=True )
-
-                        if 'Lft' in node:
-                            rgtNode = node.replace('Lft', 'Rgt')
-                            rgtNode = self.find_node( rootNode, rgtNode )
-                            if mc.objExists(rgtNode):
-                                mc.setAttr( rgtNode + '.v', lock=False )
-                                mc.connectAttr( visNode + '.' + attrName, rgtNode + '.v', force=True )
-                    except:
-                        pass
+                    node = self.find_node( rootNode, node, ctrlIndex )
+                    if node is None:
+                        continue
+
+                    connect_visibility( visPlug, node )
+
+                    if 'Lft' in node:
+                        rgtNode = node.replace('Lft', 'Rgt')
+                        rgtNode = self.find_node( rootNode, rgtNode, ctrlIndex )
+                        # The index only holds existing nodes, no need to ask Maya again
+                        if rgtNode is not None:
+                            connect_visibility( visPlug, rgtNode )
 
             # Hide Up Vectors per default
             mc.setAttr( visNode + '.show_UpVectors', False )
@@ -9406,32 +9050,18 @@ class Biped( Char ):
             if self.DEBUG:
                 print( 'Lock attributes IKs and UpVecs')
 
+            # Both sides come straight from controls, no need to search or check them per channel
             for node in nodes:
-                node = controls[node].fullPathName()
-
-                if node is not None:
-                    for attr in ['rx','ry','rz','sx','sy','sz']:
-                        if mc.objExists( node ):
-                            try:
-                                mc.setAttr( node + '.' + attr, l=True, k=False )
-                            except:
-                                pass
-                        rgtNode = node.replace('Lft', 'Rgt')
-                        rgtNode = self.find_node( rootNode, rgtNode )
-                        if mc.objExists(rgtNode):
-                            try:
-                                mc.setAttr( rgtNode + '.' + attr, l=True, k=False)
-                            except:
-                                pass
-                else:
-                    mc.warning( 'aniMeta: Can not find node ' + str( node ) )
+                for sideNode in [ node, node.replace( 'Lft', 'Rgt' ) ]:
+                    if sideNode in controls:
+                        path = controls[ sideNode ].fullPathName()
+                        for attr in ['rx','ry','rz','sx','sy','sz']:
+                            mc.setAttr( path + '.' + attr, l=True, k=False )
+                    else:
+                        mc.warning( 'aniMeta: Can not find node ' + sideNode )
 
             #handles_Lft = self.get_nodes(rootNode, {'Side': kLeft, 'Type': kHandle }, hierarchy=True)
-            handles_Lft = []
-
-            for node in controls.keys():
-                if 'Lft' in node:
-                    handles_Lft.append( node )
+            handles_Lft = controlsBySide[ 'Lft' ]
 
             if self.DEBUG:
                 print ( 'Connect Control Sizes')
@@ -9440,20 +9070,20 @@ class Biped( Char ):
 
                 lft = controls[ handles_Lft[i] ].fullPathName()
                 rgt = handles_Lft[i].replace('Lft', 'Rgt')
-                rgt = controls[ rgt ].fullPathName()
+                rgt_path = controls.get( rgt )
 
-                if mc.objExists(rgt):
+                if rgt_path is not None:
+                    rgt = rgt_path.fullPathName()
 
-                    try:
-                        mc.connectAttr(lft + '.controlSize', rgt + '.controlSize')
-                    except:
-                        pass
-                    try:
-                        mc.connectAttr(lft + '.controlSizeX', rgt + '.controlSizeX')
-                        mc.connectAttr(lft + '.controlSizeY', rgt + '.controlSizeY')
-                        mc.connectAttr(lft + '.controlSizeZ', rgt + '.controlSizeZ')
-                    except:
-                        pass
+                    lftFn = om.MFnDependencyNode( controls[ handles_Lft[i] ].node() )
+                    rgtFn = om.MFnDependencyNode( rgt_path.node() )
+
+                    # Handles have either a uniform or a per axis size, skip what is missing or driven already
+                    for attr in [ 'controlSize', 'controlSizeX', 'controlSizeY', 'controlSizeZ' ]:
+                        if lftFn.hasAttribute( attr ) and rgtFn.hasAttribute( attr ):
+                            rgtPlug = rgtFn.findPlug( attr, False )
+                            if not rgtPlug.isDestination:
+                                mc.connectAttr( lft + '.' + attr, rgt + '.' + attr )
 
                     data = self.get_metaData( lft )
 
@@ -9467,19 +9097,76 @@ class Biped( Char ):
                         if data['Mirror'] == kBasic:
                             x = -1
 
-                        try:
-                            rev = mc.createNode('multiplyDivide', name=self.short_name( rgt ) + '_controlOffset_inv', ss=True)
-                            mc.setAttr(rev + '.input2', x, y, z )
-                            mc.connectAttr(lft + '.controlOffset', rev + '.input1')
-                            mc.connectAttr(rev + '.output', rgt + '.controlOffset')
-                        except:
-                            pass
+                        if lftFn.hasAttribute( 'controlOffset' ) and rgtFn.hasAttribute( 'controlOffset' ):
+                            rgtPlug = rgtFn.findPlug( 'controlOffset', False )
+                            if not rgtPlug.isDestination:
+                                rev = mc.createNode('multiplyDivide', name=self.short_name( rgt ) + '_controlOffset_inv', ss=True)
+                                mc.setAttr(rev + '.input2', x, y, z )
+                                mc.connectAttr(lft + '.controlOffset', rev + '.input1')
+                                mc.connectAttr(rev + '.output', rgt + '.controlOffset')
                 else:
                     mc.warning('aniMeta: invalid right handle', rgt)
 
             #self.build_pickwalking( rootNode )
 
 
+    def joint_copy( self, jointToCopy, jointName, jointParent ):
+        '''
+        Creates a joint under jointParent that matches the transform, joint orient and preferred angle of jointToCopy
+        :return: the MDagPath of the new joint
+        '''
+        if not isinstance( jointToCopy, om.MDagPath ):
+            jointToCopy = self.get_path( jointToCopy )
+        if not isinstance( jointParent, om.MDagPath ):
+            jointParent = self.get_path( jointParent )
+
+        joint = mc.createNode('joint', parent=jointParent.fullPathName(), name=self.short_name( jointName ))
+        joint = self.get_path( joint )
+
+        jointPath       = joint.fullPathName()
+        jointToCopyPath = jointToCopy.fullPathName()
+
+        jo = mc.getAttr( jointToCopyPath + '.jo' )[0]
+        pa = mc.getAttr( jointToCopyPath + '.pa' )[0]
+
+        mc.setAttr( jointPath + '.jo', jo[0], jo[1], jo[2] )
+        mc.setAttr( jointPath + '.pa', pa[0], pa[1], pa[2] )
+
+        mc.matchTransform( jointPath, jointToCopyPath )
+        return joint
+
+    def create_world_orient( self, node, root, value ):
+        '''
+        Inserts a group above the control that can follow the orientation of root, the control`s worldOrient attribute blends it in
+        '''
+        if node is None:
+            return None
+
+        root = root.fullPathName()
+
+        node_path = node
+        node = node_path.fullPathName()
+
+        parent = om.MFnDagNode( om.MFnDagNode( node_path.node() ).parent( 0 ) ).fullPathName()
+
+        wo = mc.createNode( 'transform', name=self.short_name(node.replace('Ctrl', 'WorldOrient')), ss=True, parent=parent )
+
+        mc.parent( node, wo )
+
+        # The control's path changed with the new parent
+        node = node_path.fullPathName()
+
+        orient = mc.orientConstraint( root, wo, mo=True)
+
+        mc.addAttr(node, ln='worldOrient', min=0, max=1)
+        mc.setAttr(node + '.worldOrient', k=True)
+
+        # Maya picks the weight alias, so ask the constraint for it
+        target = mc.orientConstraint(orient, q=True, wal=True)[0]
+
+        mc.connectAttr(node + '.worldOrient', orient[0] + '.' + target)
+        mc.setAttr(node + '.worldOrient', value)
+
     # TODO: Evaluate if this should rather be in Rig or Transform
 
     def switch_fkik(self, **kwargs):
@@ -9502,6 +9189,9 @@ class Biped( Char ):
 
         if char and limb and side:
 
+            # List the character once, every switch looks up a handful of controls and joints
+            nodeIndex = self.get_node_index( char )
+
             ctrl = 'Foot_IK_Lft_Ctrl'
 
             if limb == 'Leg' and side == 'Lft':
@@ -9516,7 +9206,7 @@ class Biped( Char ):
             if limb == 'Arm' and side == 'Lft':
                 ctrl = 'Hand_IK_Lft_Ctrl'
 
-            ik_node = self.find_node( char, ctrl )
+            ik_node = self.find_node( char, ctrl, nodeIndex )
 
             newMode = 1 - int(mc.getAttr(ik_node + '.FK_IK'))
 
@@ -9531,11 +9221,14 @@ class Biped( Char ):
                     nodes  = ['LegUp_FK_{}_Ctrl', 'LegLo_FK_{}_Ctrl', 'Foot_FK_{}_Ctrl', 'Toes_FK_{}_Ctrl']
                     joints = ['LegUp_IK_{}_Jnt', 'LegLo_IK_{}_Jnt', 'Foot_IK_{}_Jnt', 'Toes_IK_{}_Jnt']
 
+                    # Read all joint matrices first, then pose the controls in one go
+                    matrices = []
+
                     for i in range(len(nodes)):
                         ctrlName = nodes[i].format(side)
                         jntName  = joints[i].format(side)
-                        ctrl     = am.find_node(char, ctrlName)
-                        jnt      = am.find_node(char, jntName)
+                        ctrl     = am.find_node(char, ctrlName, nodeIndex)
+                        jnt      = am.find_node(char, jntName, nodeIndex)
 
                         if ctrl is None:
                             mc.warning('aniMeta: can not find ' + ctrlName)
@@ -9544,8 +9237,9 @@ class Biped( Char ):
                             mc.warning('aniMeta: can not find ' + jntName)
                             break
 
-                        m = self.get_matrix( jnt, kWorld )
+                        matrices.append( ( ctrl, self.get_matrix( jnt, kWorld ) ) )
 
+                    for ctrl, m in matrices:
                         self.set_matrix(ctrl, m, kWorld, setScale=False )
 
                     mc.setAttr(ik_node + '.FK_IK', 0)
@@ -9559,7 +9253,7 @@ class Biped( Char ):
                     footLift_ctrl = 'FootLift_IK_{}_Ctrl'.format(side)
 
                     for node in [heel_ctrl, toesTip_ctrl, footLift_ctrl]:
-                        node = am.find_node(char, node)
+                        node = am.find_node(char, node, nodeIndex)
                         if node:
                             self.reset_handle( node )
 
@@ -9570,16 +9264,16 @@ class Biped( Char ):
                     foot_ik      = 'Foot_IK_{}_Ctrl'.format(side)
                     foot_jnt     = 'Foot_{}_Jnt'.format(side)
 
-                    legUp_ik_jnt = am.find_node(char, legUp_ik_jnt)
-                    legLo_ik_jnt = am.find_node(char, legLo_ik_jnt)
-                    pole_ik      = am.find_node(char, pole_ik)
-                    foot_ik      = am.find_node(char, foot_ik)
-                    foot_jnt     = am.find_node(char, foot_jnt)
+                    legUp_ik_jnt = am.find_node(char, legUp_ik_jnt, nodeIndex)
+                    legLo_ik_jnt = am.find_node(char, legLo_ik_jnt, nodeIndex)
+                    pole_ik      = am.find_node(char, pole_ik, nodeIndex)
+                    foot_ik      = am.find_node(char, foot_ik, nodeIndex)
+                    foot_jnt     = am.find_node(char, foot_jnt, nodeIndex)
 
                     m = self.get_matrix( foot_jnt, kWorld )
 
                     if side == 'Rgt':
-                        m = om.MEulerRotation( math.radians(180),0,0 ).asMatrix() * m
+                        m = kFlipX * m
 
                     self.set_matrix(foot_ik, m, kWorld, setScale = False )
 
@@ -9606,11 +9300,14 @@ class Biped( Char ):
                     nodes  = ['ArmUp_FK_{}_Ctrl', 'ArmLo_FK_{}_Ctrl', 'Hand_FK_{}_Ctrl' ]
                     joints = ['ArmUp_{}_Jnt', 'ArmLo_{}_Jnt', 'Hand_{}_Jnt' ]
 
+                    # Read all joint matrices first, then pose the controls in one go
+                    matrices = []
+
                     for i in range(len(nodes)):
                         ctrlName = nodes[i].format(side)
                         jntName  = joints[i].format(side)
-                        ctrl     = am.find_node(char, ctrlName)
-                        jnt      = am.find_node(char, jntName)
+                        ctrl     = am.find_node(char, ctrlName, nodeIndex)
+                        jnt      = am.find_node(char, jntName, nodeIndex)
 
                         if ctrl is None:
                             mc.warning('aniMeta: can not find ', ctrlName)
@@ -9619,7 +9316,9 @@ class Biped( Char ):
                             mc.warning('aniMeta: can not find ', jntName)
                             break
 
-                        m = self.get_matrix( jnt )
+                        matrices.append( ( ctrl, self.get_matrix( jnt ) ) )
+
+                    for ctrl, m in matrices:
                         self.set_matrix( ctrl, m )
 
                     mc.setAttr(ik_node + '.FK_IK', 0)
@@ -9634,16 +9333,16 @@ class Biped( Char ):
                     hand_ik      = 'Hand_IK_{}_Ctrl'.format(side)
                     hand_jnt     = 'Hand_{}_Jnt'.format(side)
 
-                    armUp_ik_jnt = am.find_node(char, armUp_ik_jnt)
-                    armLo_ik_jnt = am.find_node(char, armLo_ik_jnt)
-                    pole_ik      = am.find_node(char, pole_ik)
-                    hand_ik      = am.find_node(char, hand_ik)
-                    hand_jnt     = am.find_node(char, hand_jnt)
+                    armUp_ik_jnt = am.find_node(char, armUp_ik_jnt, nodeIndex)
+                    armLo_ik_jnt = am.find_node(char, armLo_ik_jnt, nodeIndex)
+                    pole_ik      = am.find_node(char, pole_ik, nodeIndex)
+                    hand_ik      = am.find_node(char, hand_ik, nodeIndex)
+                    hand_jnt     = am.find_node(char, hand_jnt, nodeIndex)
 
                     m = self.get_matrix(hand_jnt)
 
                     if side == 'Rgt':
-                        m = om.MEulerRotation(math.radians(180),0,0).asMatrix() * m
+                        m = kFlipX * m
 
                     self.set_matrix(hand_ik, m, setScale = False )
 
@@ -9750,86 +9449,79 @@ class Anim(Transform):
 
             dict['keys']  = {}
 
+            # The curve type does not change from key to key
+            unitless = dict['type'] == 'animCurveUA' or dict['type'] == 'animCurveUL'
+            angular  = dict['type'] == 'animCurveTA'
+
+            kTangentAuto = oma.MFnAnimCurve.kTangentAuto
+
             times  = []
             values = []
-
-            # Lists redundant?
-            itt   = [] # In tangent type
-            ott   = [] # Out tangent type
-            itaw  = [] # In tangent angle Weight
-            otaw  = [] # Out tangent angle weight
-            itxy  = [] # In tangent XY
-            otxy  = [] # Out tangent XY
             alt = []
             for i in range( 0, animFn.numKeys ):
 
-                if dict['type'] == 'animCurveUA' or dict['type'] == 'animCurveUL':
+                if unitless:
                     time_val = animFn.input( i )
                 else:
                     time_val = round( animFn.input( i ).value, 5 )
 
-                time_tmp = time_val
-                times.append ( time_tmp )
+                times.append ( time_val )
                 value_tmp = animFn.value( i )
 
-                if dict['type'] == 'animCurveTA':
+                if angular:
                     value_tmp = math.degrees(value_tmp)
 
                 values.append( round(value_tmp,5) )
 
                 tmp_dict = {}
 
-                # In Tangent type
-                itt.append( animFn.inTangentType( i ) )
-                ott.append( animFn.outTangentType( i ) )
-
-                # In Tangent Angle Weight
-                itaw_tmp = animFn.getTangentAngleWeight(i,True)
-                itaw.append(  [itaw_tmp[0].asDegrees(), itaw_tmp[1]] )
-
-                # Out Tangent Angle Weight
-                otaw_tmp = animFn.getTangentAngleWeight(i,False)
-                otaw.append( [otaw_tmp[0].asDegrees(), otaw_tmp[1]] )
+                # In/Out Tangent type
+                itt = animFn.inTangentType( i )
+                ott = animFn.outTangentType( i )
 
-                # In Tangent
-                itxy.append( animFn.getTangentXY(i,True))
+                # In/Out Tangent Angle Weight
+                itaw = animFn.getTangentAngleWeight( i, True )
+                otaw = animFn.getTangentAngleWeight( i, False )
+                ia = itaw[0].asDegrees()
+                oa = otaw[0].asDegrees()
 
-                # Out Tangent
-                otxy.append( animFn.getTangentXY(i,False))
+                # In/Out Tangent
+                itxy = animFn.getTangentXY( i, True )
+                otxy = animFn.getTangentXY( i, False )
 
                 tmp_dict[ 'bd' ] = animFn.isBreakdown(i)
                 tmp_dict[ 'wl' ] = animFn.weightsLocked(i)
                 tmp_dict[ 'tl' ] = animFn.tangentsLocked(i)
 
-                if itt[i] != oma.MFnAnimCurve.kTangentAuto:
-                    tmp_dict['itt'] = itt[i]
+                if itt != kTangentAuto:
+                    tmp_dict['itt'] = itt
 
-                if ott[i] != oma.MFnAnimCurve.kTangentAuto:
-                    tmp_dict['ott'] = itt[i]
+                if ott != kTangentAuto:
+                    tmp_dict['ott'] = itt
 
-                if itaw[i][0] != 0.0:
-                    tmp_dict['ia'] = round( itaw[i][0], 5 )
+                if ia != 0.0:
+                    tmp_dict['ia'] = round( ia, 5 )
 
-                if itaw[i][1] != 1.0:
-                    tmp_dict['iw'] = round( itaw[i][1], 5 )
+                if itaw[1] != 1.0:
+                    tmp_dict['iw'] = round( itaw[1], 5 )
 
-                if otaw[i][0] != 0.0:
-                    tmp_dict['oa'] = round( otaw[i][0], 5 )
+                if oa != 0.0:
+                    tmp_dict['oa'] = round( oa, 5 )
 
-                if otaw[i][1] != 1.0:
-                    tmp_dict['ow'] = round( otaw[i][1], 5 )
+                if otaw[1] != 1.0:
+                    tmp_dict['ow'] = round( otaw[1], 5 )
 
-                if itxy[i][0] != 1.0:
-                    tmp_dict['ix'] = round( itxy[i][0], 5 )
+                if itxy[0] != 1.0:
+                    tmp_dict['ix'] = round( itxy[0], 5 )
 
-                if itxy[i][1] != 0.0:
-                    tmp_dict['iy'] = round( itxy[i][1], 5 )
+                if itxy[1] != 0.0:
+                    tmp_dict['iy'] = round( itxy[1], 5 )
 
-                if otxy[i][0] != 1.0:
-                    tmp_dict['ox'] = round( otxy[i][0], 5 )
+                if otxy[0] != 1.0:
+                    tmp_dict['ox'] = round( otxy[0], 5 )
 
-                if otxy[i][1] != 0.0:
-                    tmp_dict['oy'] = round( otxy[i][1], 5 )
+                if otxy[1] != 0.0:
+                    tmp_dict['oy'] = round( otxy[1], 5 )
 
                 if len ( tmp_dict ) > 0:
                     tmp_dict[ 'time' ] = times[ i ]
@@ -16093,68 +15785,57 @@ class LibTab(QWidget):
 
             dict[ 'keys' ] = { }
 
+            # The curve type does not change from key to key
+            angular = dict[ 'type' ] == 'animCurveTA'
+
+            kTangentAuto = oma.MFnAnimCurve.kTangentAuto
+
             times = [ ]
             values = [ ]
-            itt = [ ]  # In tangent type
-            ott = [ ]  # Out tangent type
-            itaw = [ ]  # In tangent angle Weight
-            otaw = [ ]  # Out tangent angle weight
-            itxy = [ ]  # In tangent XY
-            otxy = [ ]  # Out tangent XY
-            bd = [ ]    # breakdown
-            wl = [ ]    # weights locked
-            tl = [ ]    # tangents locked
             alt = [ ]
             for i in range( 0, animFn.numKeys ):
                 time_tmp = round( animFn.input( i ).value, 5 )
                 times.append( time_tmp )
                 value_tmp = animFn.value( i )
-                if dict[ 'type' ] == 'animCurveTA':
+                if angular:
                     value_tmp = math.degrees( value_tmp )
                 values.append( round( value_tmp, 5 ) )
 
                 tmp_dict = { }
-                itt.append( animFn.inTangentType( i ) )
-                ott.append( animFn.outTangentType( i ) )
-
-                itaw_tmp = animFn.getTangentAngleWeight( i, True )
-                itaw.append( [ itaw_tmp[ 0 ].asDegrees(), itaw_tmp[ 1 ] ] )
-
-                otaw_tmp = animFn.getTangentAngleWeight( i, False )
-                otaw.append( [ otaw_tmp[ 0 ].asDegrees(), otaw_tmp[ 1 ] ] )
+                itt = animFn.inTangentType( i )
+                ott = animFn.outTangentType( i )
 
-                itxy.append( animFn.getTangentXY( i, True ) )
-                otxy.append( animFn.getTangentXY( i, False ) )
+                itaw = animFn.getTangentAngleWeight( i, True )
+                otaw = animFn.getTangentAngleWeight( i, False )
 
-                bd.append( animFn.isBreakdown( i ) )
-                wl.append( animFn.weightsLocked( i ) )
-                tl.append( animFn.tangentsLocked( i ) )
+                itxy = animFn.getTangentXY( i, True )
+                otxy = animFn.getTangentXY( i, False )
 
-                if itt[ i ] != oma.MFnAnimCurve.kTangentAuto:
-                    tmp_dict[ 'itt' ] = itt[ i ]
+                if itt != kTangentAuto:
+                    tmp_dict[ 'itt' ] = itt
 
-                if ott[ i ] != oma.MFnAnimCurve.kTangentAuto:
-                    tmp_dict[ 'ott' ] = itt[ i ]
+                if ott != kTangentAuto:
+                    tmp_dict[ 'ott' ] = itt
 
-                tmp_dict[ 'ia' ] = round( itaw[ i ][ 0 ], 5 )
+                tmp_dict[ 'ia' ] = round( itaw[ 0 ].asDegrees(), 5 )
 
-                tmp_dict[ 'iw' ] = round( itaw[ i ][ 1 ], 5 )
+                tmp_dict[ 'iw' ] = round( itaw[ 1 ], 5 )
 
-                tmp_dict[ 'oa' ] = round( otaw[ i ][ 0 ], 5 )
+                tmp_dict[ 'oa' ] = round( otaw[ 0 ].asDegrees(), 5 )
 
-                tmp_dict[ 'ow' ] = round( otaw[ i ][ 1 ], 5 )
+                tmp_dict[ 'ow' ] = round( otaw[ 1 ], 5 )
 
-                tmp_dict[ 'ix' ] = round( itxy[ i ][ 0 ], 5 )
+                tmp_dict[ 'ix' ] = round( itxy[ 0 ], 5 )
 
-                tmp_dict[ 'iy' ] = round( itxy[ i ][ 1 ], 5 )
+                tmp_dict[ 'iy' ] = round( itxy[ 1 ], 5 )
 
-                tmp_dict[ 'ox' ] = round( otxy[ i ][ 0 ], 5 )
+                tmp_dict[ 'ox' ] = round( otxy[ 0 ], 5 )
 
-                tmp_dict[ 'oy' ] = round( otxy[ i ][ 1 ], 5 )
+                tmp_dict[ 'oy' ] = round( otxy[ 1 ], 5 )
 
-                tmp_dict[ 'wl' ] = wl[ i ]
+                tmp_dict[ 'wl' ] = animFn.weightsLocked( i )
 
-                tmp_dict[ 'l' ]  = tl[ i ]
+                tmp_dict[ 'l' ]  = animFn.tangentsLocked( i )
 
                 if len( tmp_dict ) > 0:
                     tmp_dict[ 'time' ] = times[ i ]